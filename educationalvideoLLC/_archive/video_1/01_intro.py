@@ -2,6 +2,7 @@ from manim import *
 import numpy as np
 from core.narration import NarrationManager
 from core.config import BACKGROUND_COLOR
+from core.particles import Particles
 
 
 class Intro(Scene):
@@ -11,13 +12,7 @@ class Intro(Scene):
         # --- Atmospheric setup ---
         night_sky = Rectangle(width=config.frame_width, height=config.frame_height,
                               fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        stars = VGroup(*[
-            Dot(radius=0.02, color=WHITE).move_to([
-                np.random.uniform(-7, 7),
-                np.random.uniform(-2, 4),
-                0
-            ]) for _ in range(50)
-        ])
+        stars = Particles.scatter(50, x_range=(-7, 7), y_range=(-2, 4), radius=0.02, color=WHITE)
 
         mountain_points = [
             [-7, -4, 0], [-5, -2, 0], [-3, -3.5, 0],
@@ -62,7 +57,7 @@ class Intro(Scene):
         ).set_stroke(width=0)
 
         self.play(
-            FadeOut(VGroup(person, mountain, arrow1, stars, night_sky), scale=1.1),
+            FadeOut(Group(person, mountain, arrow1, stars, night_sky), scale=1.1),
             FadeIn(transition_bg, scale=1.05),
             run_time=2
         )
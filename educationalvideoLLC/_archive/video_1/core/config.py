@@ -3,6 +3,8 @@ VisualTheorem global configuration constants.
 Use these to maintain consistency across all video scenes.
 """
 
+from manim import YELLOW, BLUE_B, GREEN
+
 # Color palette
 BACKGROUND_COLOR = "#0b132b"  # Deep blue background
 ACCENT_COLOR_PRIMARY = YELLOW
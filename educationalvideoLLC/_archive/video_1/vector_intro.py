@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from core.particles import Particles, drift
 
 class IntroScene(Scene):
     def construct(self):
@@ -14,33 +15,15 @@ class IntroScene(Scene):
         self.add(bg)
 
         # Floating dots for motion
-        dots = VGroup(*[
-            Dot(radius=0.04, color=WHITE, fill_opacity=0.5).shift(
-                np.array([
-                    np.random.uniform(-6, 6),
-                    np.random.uniform(-3.5, 3.5),
-                    0
-                ])
-            )
-            for _ in range(40)
-        ])
+        dots = Particles.scatter(40, x_range=(-6, 6), y_range=(-3.5, 3.5), radius=0.04, opacity=0.5, background=BLUE_E)
         self.add(dots)
 
-        # Animate subtle drift
-        self.play(
-            AnimationGroup(*[
-                dot.animate.shift(
-                    np.array([
-                        np.random.uniform(-0.5, 0.5),
-                        np.random.uniform(-0.3, 0.3),
-                        0
-                    ])
-                )
-                for dot in dots
-            ]),
-            lag_ratio=0.1,
-            run_time=3
-        )
+        # Animate subtle drift (each dot its own velocity, all moved by one updater)
+        rng = np.random.default_rng(1)
+        velocity = np.column_stack([rng.uniform(-0.5, 0.5, 40), rng.uniform(-0.3, 0.3, 40), np.zeros(40)]) / 3
+        dots.add_updater(drift(velocity))
+        self.wait(3)
+        dots.clear_updaters()
 
         # Title text
         title = Text("How Machines Learn", font_size=60, color=WHITE)
@@ -0,0 +1,4 @@
+"""
+Render tooling for the VisualTheorem video series.
+Finds the scenes in each video directory and renders them with manim.
+"""
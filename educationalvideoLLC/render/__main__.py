@@ -0,0 +1,121 @@
+"""
+Command line entry point.
+
+    python -m render video_5 --jobs 4          # one video, 4 scenes at a time
+    python -m render --all -q l                # whole series at preview quality
+    python -m render video_5 --scene Axelrod   # a single scene
+    python -m render video_5 --batch -j 2      # 2 warm interpreters share the scenes
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .batch import render_batch
+from .brand import BrandLibrary
+from .cache import RenderCache
+from .orchestrator import QUALITY_DIRS, render_all
+from .scenes import SERIES_ROOT, discover_series, discover_video, select_scenes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m render", description="Render VisualTheorem scenes in parallel.")
+    parser.add_argument("videos", nargs="*", help="Video directories to render (e.g. video_5)")
+    parser.add_argument("--all", action="store_true", help="Render every video_* directory in the series")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="Only render this scene class or module (repeatable)")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_DIRS), help="manim quality flag (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Parallel renders (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-render, ignoring the render cache")
+    parser.add_argument("--cache-dir", default=None, help="Render cache location (default: $VISUALTHEOREM_CACHE or .render_cache/)")
+    parser.add_argument("--no-segment-cache", action="store_true", help="Disable the shared per-animation segment cache")
+    parser.add_argument("--no-hold-elision", action="store_true", help="Write static waits frame by frame instead of padding a single frame")
+    parser.add_argument("--subtitles", default="inline", choices=("inline", "track"), help="Draw narration into scenes, or record it as a subtitle track for render.assemble")
+    parser.add_argument("--brand", default="inline", choices=("inline", "clips"), help="Animate the logo intro/outro in each scene, or splice the shared pre-rendered clips at assembly")
+    parser.add_argument("--batch", action="store_true", help="Render each video's scenes in --jobs warm interpreters instead of one manim process per scene")
+    parser.add_argument("--profile", default=None, metavar="DIR", help="Write a per-play() Chrome trace and summary of each scene to DIR (renders without the render and segment caches)")
+    parser.add_argument("--list", action="store_true", help="List the scenes that would be rendered and exit")
+    return parser
+
+
+def resolve_video_dir(name):
+    path = Path(name)
+    if not path.is_dir():
+        path = SERIES_ROOT / name
+    if not path.is_dir():
+        raise SystemExit(f"No such video directory: {name}")
+    return path
+
+
+def collect_specs(args):
+    if args.all:
+        specs = discover_series()
+    else:
+        specs = []
+        for name in args.videos:
+            specs.extend(discover_video(resolve_video_dir(name)))
+    return select_scenes(specs, args.scene)
+
+
+def hook_env(args):
+    """Environment switches for the render.runner hooks in each manim process."""
+    env = {"VISUALTHEOREM_SUBTITLES": args.subtitles, "VISUALTHEOREM_BRAND": args.brand}
+    if args.no_segment_cache or args.profile:
+        env["VISUALTHEOREM_SEGMENT_CACHE"] = "off"
+    elif args.cache_dir:
+        env["VISUALTHEOREM_SEGMENT_CACHE"] = str(Path(args.cache_dir) / "segments")
+    if args.no_hold_elision:
+        env["VISUALTHEOREM_HOLD_ELISION"] = "off"
+    if args.profile:
+        env["VISUALTHEOREM_PROFILE"] = str(Path(args.profile).resolve())
+    return env
+
+
+def print_result(result):
+    if result.cached:
+        print(f"  ♻️  {result.spec.label} (cached) -> {result.output_path}")
+    elif result.ok:
+        print(f"  ✅ {result.spec.label} ({result.elapsed:.1f}s) -> {result.output_path}")
+    else:
+        print(f"  ❌ {result.spec.label} exited with {result.returncode} ({result.elapsed:.1f}s)")
+        tail = result.log.strip().splitlines()[-15:]
+        for line in tail:
+            print(f"     {line}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.all and not args.videos:
+        parser.error("give at least one video directory or --all")
+
+    specs = collect_specs(args)
+    if not specs:
+        raise SystemExit("No scenes found.")
+
+    if args.list:
+        for spec in specs:
+            print(spec.label)
+        return 0
+
+    env = hook_env(args)
+    if args.brand == "clips":
+        video_dirs = sorted({spec.video_dir for spec in specs})
+        brand_results = BrandLibrary(args.cache_dir).build(video_dirs, args.quality, jobs=args.jobs, env=env, on_result=print_result)
+        if any(not r.ok for r in brand_results):
+            print("Brand clips failed to render.")
+            return 1
+
+    print(f"🎬 Rendering {len(specs)} scene(s) at -q{args.quality}")
+    cache = None if args.no_cache or args.profile else RenderCache(args.cache_dir)
+    render = render_batch if args.batch else render_all
+    results = render(specs, quality=args.quality, jobs=args.jobs, on_result=print_result, cache=cache, env=env)
+
+    failed = [r for r in results if not r.ok]
+    print("")
+    cached = sum(1 for r in results if r.cached)
+    print(f"Done: {len(results) - len(failed)} ok ({cached} from cache), {len(failed)} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Assemble rendered scenes into one video with ffmpeg.
+
+    python -m render.assemble video_5 -q h --order Hook,PDBasics,IteratedPD,Axelrod,NoiseGenerosity,StrategyEcology,Invasion,RealWorldCases,PDConclusion
+    python -m render.assemble video_4 --subtitles burn
+
+Scenes rendered with `--subtitles track` carry <Scene>.cues.json sidecars instead of
+drawn subtitles. Their cues are merged onto the assembled timeline and then
+burned in (ASS), muxed as a soft track, or written as a transparent overlay layer.
+Scenes rendered with `--brand clips` carry <Scene>.clips.json splice markers; the
+shared logo intro/outro clips from render.brand are inserted at those points.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .brand import BrandLibrary
+from .orchestrator import QUALITY_DIRS, output_path_for
+from .scenes import SERIES_ROOT, discover_video
+from .subtitles import load_track, merge_tracks, to_ass, to_srt
+
+SUBTITLE_MODES = ("none", "soft", "burn", "overlay")
+
+# Seconds a brand outro marker may sit before the end of its scene (frame rounding)
+SPLICE_TOLERANCE = 0.1
+
+
+def run_ffmpeg(args):
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", *[str(a) for a in args]]
+    subprocess.run(cmd, check=True)
+
+
+def probe_duration(path):
+    """Duration of a media file in seconds (via ffprobe)."""
+    out = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", str(path)],
+        check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    return float(json.loads(out)["format"]["duration"])
+
+
+def concat(videos, output):
+    """Join videos with identical codec settings without re-encoding."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for video in videos:
+            f.write(f"file '{Path(video).resolve()}'\n")
+        list_file = f.name
+    try:
+        run_ffmpeg(["-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", output])
+    finally:
+        Path(list_file).unlink()
+    return Path(output)
+
+
+def burn_subtitles(video, ass_path, output):
+    """Composite an ASS track onto the picture (re-encodes the video stream)."""
+    run_ffmpeg(["-i", video, "-vf", f"ass={ass_path}", "-c:a", "copy", output])
+    return Path(output)
+
+
+def mux_soft_subtitles(video, srt_path, output):
+    """Attach an SRT as a selectable subtitle stream (no re-encode)."""
+    run_ffmpeg(["-i", video, "-i", srt_path, "-c", "copy", "-c:s", "mov_text", output])
+    return Path(output)
+
+
+def render_overlay(ass_path, output, width, height, fps, duration):
+    """Write the subtitles alone as a transparent video layer for later compositing."""
+    source = f"color=c=black@0.0:s={width}x{height}:r={fps}:d={duration:.3f},format=rgba"
+    run_ffmpeg(["-f", "lavfi", "-i", source, "-vf", f"ass={ass_path}", "-c:v", "qtrle", output])
+    return Path(output)
+
+
+def load_clip_markers(video):
+    """Brand clip splice markers recorded next to a scene video (empty if none)."""
+    path = Path(video).with_suffix(".clips.json")
+    if not path.exists():
+        return []
+    return json.loads(path.read_text())["clips"]
+
+
+def splice_brand_clips(specs, videos, quality, library):
+    """
+    Insert the shared brand clips where scenes left splice markers.
+
+    Intro markers sit at the start of a scene and outro markers at its end, so
+    the clips become separate pieces of the concat list and nothing is re-encoded.
+
+    Returns:
+        Video paths in playback order
+    """
+    pieces = []
+    for spec, video in zip(specs, videos):
+        before, after = [], []
+        duration = None
+        for marker in load_clip_markers(video):
+            clip = library.ensure(spec.video_dir, quality, marker["clip"])
+            if marker["at"] <= 0:
+                before.append(clip)
+                continue
+            duration = duration if duration is not None else probe_duration(video)
+            if duration - marker["at"] > SPLICE_TOLERANCE:
+                raise SystemExit(
+                    f"{spec.label}: brand {marker['clip']} at {marker['at']}s is not at the "
+                    f"start or end of the scene; render it with --brand inline"
+                )
+            after.append(clip)
+        pieces.extend(before + [video] + after)
+    return pieces
+
+
+def ordered_specs(video_dir, order=None):
+    specs = discover_video(video_dir)
+    if not order:
+        return specs
+    by_name = {s.class_name: s for s in specs}
+    missing = [name for name in order if name not in by_name]
+    if missing:
+        raise SystemExit(f"Unknown scene(s) in --order: {', '.join(missing)}")
+    return [by_name[name] for name in order]
+
+
+def assemble(specs, quality, output, subtitles="burn", library=None):
+    """
+    Concatenate rendered scenes and attach their narration track.
+
+    Args:
+        specs: Scenes in playback order (already rendered at `quality`)
+        quality: manim quality flag the scenes were rendered with
+        output: Final video path
+        subtitles: none, soft (SRT stream), burn (ASS composited) or overlay (separate .mov layer)
+        library: BrandLibrary for splice markers (default: the one in the render cache)
+
+    Returns:
+        Path of the assembled video
+    """
+    videos = [output_path_for(spec, quality) for spec in specs]
+    missing = [str(v) for v in videos if not v.exists()]
+    if missing:
+        raise SystemExit("Render these scenes first:\n  " + "\n  ".join(missing))
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    videos = splice_brand_clips(specs, videos, quality, library or BrandLibrary())
+
+    offsets, t = [], 0.0
+    for video in videos:
+        offsets.append(t)
+        t += probe_duration(video)
+    tracks = [(load_track(v.with_suffix(".cues.json")), off) for v, off in zip(videos, offsets)]
+    track = merge_tracks(tracks)
+
+    if subtitles == "none" or track is None:
+        return concat(videos, output)
+
+    joined = output.with_name(f"{output.stem}.joined{output.suffix}")
+    concat(videos, joined)
+    ass_path = output.with_suffix(".ass")
+    srt_path = output.with_suffix(".srt")
+    ass_path.write_text(to_ass(track))
+    srt_path.write_text(to_srt(track))
+
+    if subtitles == "burn":
+        burn_subtitles(joined, ass_path, output)
+    elif subtitles == "soft":
+        mux_soft_subtitles(joined, srt_path, output)
+    else:
+        fps = int(QUALITY_DIRS[quality].split("p")[1])
+        render_overlay(
+            ass_path, output.with_suffix(".overlay.mov"),
+            track["pixel_width"], track["pixel_height"], fps, t,
+        )
+        joined.replace(output)
+        return output
+    joined.unlink()
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.assemble", description="Join rendered scenes into one video.")
+    parser.add_argument("video", help="Video directory (e.g. video_5)")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_DIRS))
+    parser.add_argument("--order", default=None, help="Comma-separated scene classes in playback order (default: file order)")
+    parser.add_argument("--subtitles", default="burn", choices=SUBTITLE_MODES, help="How to attach track-mode narration (default: burn)")
+    parser.add_argument("--cache-dir", default=None, help="Render cache holding the brand clips (default: $VISUALTHEOREM_CACHE or .render_cache/)")
+    parser.add_argument("-o", "--output", default=None, help="Output path (default: <video>/media/<video>_<quality>.mp4)")
+    args = parser.parse_args(argv)
+
+    video_dir = Path(args.video) if Path(args.video).is_dir() else SERIES_ROOT / args.video
+    order = [name.strip() for name in args.order.split(",")] if args.order else None
+    specs = ordered_specs(video_dir, order)
+    output = args.output or video_dir / "media" / f"{video_dir.name}_{QUALITY_DIRS[args.quality]}.mp4"
+    result = assemble(specs, args.quality, output, subtitles=args.subtitles, library=BrandLibrary(args.cache_dir))
+    print(f"✅ {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Batch rendering: every scene of a video in a few warm interpreters.
+
+`python -m render video_5 --batch` hands each video's scenes to `--jobs` worker
+processes instead of starting one manim process per scene. A worker is a
+render.warm.WarmRenderer working through its share of one video's scenes in
+order, so manim is imported once and module-level state in core/ (the subtitle
+cache, the logo brand, figure prototypes) is built by the first scene and reused
+by the rest. Each scene still gets its own MP4 in media/.
+
+Workers print one marker line per finished scene:
+
+    python -m render.batch -q h video_5/00_hook.py::Hook video_5/01_pd_basics.py::PDBasics
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .cache import scene_key
+from .orchestrator import QUALITY_DIRS, RenderResult, cached_result, worker_env
+from .scenes import SceneSpec
+
+# Prefix of the result lines a worker prints (manim logs to the same stdout)
+MARKER = "@@render "
+
+
+def worker_command(specs, quality):
+    return [
+        sys.executable, "-m", "render.batch", "-q", quality,
+        *[f"{spec.module_path}::{spec.class_name}" for spec in specs],
+    ]
+
+
+def chunks(specs, jobs):
+    """
+    Split specs into at most `jobs` worker lists per video, round robin in scene order.
+
+    Workers never mix videos, so none of them has to swap `core` packages.
+    """
+    by_video = {}
+    for spec in specs:
+        by_video.setdefault(spec.video_dir, []).append(spec)
+    result = []
+    for video_specs in by_video.values():
+        count = min(jobs, len(video_specs))
+        result.extend(video_specs[i::count] for i in range(count))
+    return result
+
+
+def run_worker(specs, quality, env=None, on_result=None):
+    """
+    Render `specs` (all from one video) in one warm worker process.
+
+    Returns:
+        RenderResult per spec, in order; scenes a crashed worker never reached fail
+        with the worker's output as their log
+    """
+    cmd = worker_command(specs, quality)
+    proc = subprocess.Popen(
+        cmd, cwd=specs[0].video_dir, env=worker_env(env),
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    results = {}
+    log = []
+    for line in proc.stdout:
+        if not line.startswith(MARKER):
+            log.append(line)
+            continue
+        data = json.loads(line[len(MARKER):])
+        spec = specs[data["index"]]
+        output = Path(data["output"]) if data["output"] else None
+        result = RenderResult(spec, data["returncode"], output, data["elapsed"], data["log"])
+        results[data["index"]] = result
+        if on_result is not None:
+            on_result(result)
+    returncode = proc.wait()
+    for i, spec in enumerate(specs):
+        if i not in results:
+            results[i] = RenderResult(spec, returncode or 1, None, 0.0, "".join(log))
+            if on_result is not None:
+                on_result(results[i])
+    return [results[i] for i in range(len(specs))]
+
+
+def render_batch(specs, quality="h", jobs=None, on_result=None, cache=None, env=None):
+    """
+    Render scenes in warm worker processes; same arguments and results as
+    orchestrator.render_all (without extra manim arguments).
+
+    Args:
+        jobs: Worker processes running at once (defaults to the CPU count); each
+            video is split across at most that many
+    """
+    if quality not in QUALITY_DIRS:
+        raise ValueError(f"Unknown quality '{quality}', expected one of {sorted(QUALITY_DIRS)}")
+    jobs = jobs or os.cpu_count() or 1
+    results = {}
+    keys = {}
+    pending = []
+    for spec in specs:
+        key = scene_key(spec, quality, (), env) if cache is not None else None
+        hit = cached_result(spec, quality, cache, key) if cache is not None else None
+        if hit is not None:
+            results[spec.label] = hit
+            if on_result is not None:
+                on_result(hit)
+        else:
+            keys[spec.label] = key
+            pending.append(spec)
+
+    lock = threading.Lock()
+
+    def finished(result):
+        with lock:
+            if cache is not None and result.ok and result.output_path is not None:
+                cache.store(keys[result.spec.label], result.output_path, spec=result.spec, quality=quality)
+            results[result.spec.label] = result
+            if on_result is not None:
+                on_result(result)
+
+    workers = chunks(pending, jobs)
+    if workers:
+        # Threads only wait on worker processes; at most `jobs` run at once
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for future in [pool.submit(run_worker, chunk, quality, env, finished) for chunk in workers]:
+                future.result()
+    return [results[spec.label] for spec in specs]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.batch", description="Render scenes in one warm interpreter.")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_DIRS))
+    parser.add_argument("scenes", nargs="+", help="module.py::SceneClass, all from one video")
+    args = parser.parse_args(argv)
+
+    from .warm import WarmRenderer
+
+    renderer = WarmRenderer()
+    for index, target in enumerate(args.scenes):
+        module, class_name = target.split("::")
+        module = Path(module).resolve()
+        result = renderer.render(SceneSpec(module.parent, module, class_name), args.quality)
+        payload = {
+            "index": index,
+            "returncode": result.returncode,
+            "output": str(result.output_path) if result.output_path else None,
+            "elapsed": result.elapsed,
+            "log": result.log,
+        }
+        print(MARKER + json.dumps(payload), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+End-to-end render benchmark across the series.
+
+    python -m render.bench                      # preview preset, record and check
+    python -m render.bench --preset release --repeat 3
+    python -m render.bench --no-record          # check only, leave the history alone
+
+Renders a fixed set of scenes at a pinned quality and frame rate, each in a fresh
+manim process with every cache off, and records wall time, frames per second,
+peak RSS and output size. Runs are appended to a JSON history; each scene is
+compared against the median of the previous runs of the same preset on the same
+machine, and the command exits non-zero if one got slower or bigger in memory by
+more than the threshold. Needs manim and ffprobe installed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .assemble import probe_duration
+from .cache import manim_version
+from .orchestrator import QUALITY_DIRS, manim_command, worker_env
+from .scenes import SERIES_ROOT, SceneSpec
+
+# Bump when the history layout changes
+HISTORY_FORMAT = 1
+
+DEFAULT_HISTORY = SERIES_ROOT / "bench_history.json"
+
+# (video folder, module, scene class); picked to cover heavy plots, Text, narration and the archive
+SUITE = [
+    ("video_5", "06_ecology.py", "StrategyEcology"),
+    ("video_4", "02_science.py", "Science"),
+    ("video_3", "03_tips.py", "Tips"),
+    ("_archive/video_1", "03_descent_steps.py", "DescentSteps"),
+]
+
+# Pinned render settings; the frame rate is passed explicitly so manim.cfg files can't move it
+PRESETS = {
+    "preview": {"quality": "l", "frame_rate": 15},
+    "standard": {"quality": "m", "frame_rate": 30},
+    "release": {"quality": "h", "frame_rate": 60},
+}
+
+# Hooks that would let a run reuse earlier work are switched off; the disk caches that
+# VISUALTHEOREM_CACHE locates (pickled subtitles, result sweeps) get a fresh empty folder per render
+BENCH_ENV = {
+    "VISUALTHEOREM_SEGMENT_CACHE": "off",
+    "VISUALTHEOREM_SUBTITLES": "inline",
+    "VISUALTHEOREM_BRAND": "inline",
+}
+
+# Metrics checked for regressions (higher is worse)
+CHECKED = ("wall", "peak_rss_mb")
+
+# Previous runs the baseline median is taken over
+BASELINE_RUNS = 5
+
+
+def suite_specs(names=()):
+    """SceneSpecs of the suite, optionally only those whose class or module is in `names`."""
+    specs = [SceneSpec(SERIES_ROOT / video, SERIES_ROOT / video / module, cls) for video, module, cls in SUITE]
+    if names:
+        specs = [s for s in specs if s.class_name in names or s.module_name in names or s.module_path.name in names]
+    return specs
+
+
+def run_measured(cmd, cwd, env):
+    """
+    Run a command and measure it.
+
+    Returns:
+        (returncode, seconds, peak RSS of the process in MB, output log)
+    """
+    with tempfile.TemporaryFile("w+") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT, text=True)
+        # wait4 reports the rusage of this one child, unlike getrusage(RUSAGE_CHILDREN)
+        _, status, usage = os.wait4(proc.pid, 0)
+        elapsed = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        log.seek(0)
+        output = log.read()
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return proc.returncode, elapsed, rss_mb, output
+
+
+def bench_scene(spec, preset, media_dir, cache_dir):
+    """
+    Render one scene at `preset` and measure it.
+
+    Returns:
+        Dict with wall (s), frames, fps (frames rendered per wall second),
+        peak_rss_mb and size_bytes, or None if the render failed (log printed)
+    """
+    settings = PRESETS[preset]
+    extra = ["--frame_rate", str(settings["frame_rate"]), "--disable_caching"]
+    cmd = manim_command(spec, settings["quality"], extra, media_dir=media_dir)
+    env = worker_env({**BENCH_ENV, "VISUALTHEOREM_CACHE": str(cache_dir)})
+    returncode, wall, rss_mb, log = run_measured(cmd, spec.video_dir, env)
+    output = (
+        Path(media_dir) / "videos" / spec.module_name
+        / QUALITY_DIRS[settings["quality"]] / f"{spec.class_name}.mp4"
+    )
+    if returncode != 0 or not output.exists():
+        print(f"  ❌ {spec.label} exited with {returncode}")
+        for line in log.strip().splitlines()[-15:]:
+            print(f"     {line}")
+        return None
+    frames = round(probe_duration(output) * settings["frame_rate"])
+    return {
+        "wall": round(wall, 3),
+        "frames": frames,
+        "fps": round(frames / wall, 2),
+        "peak_rss_mb": round(rss_mb, 1),
+        "size_bytes": output.stat().st_size,
+    }
+
+
+def run_suite(specs, preset="preview", repeat=1, on_result=None):
+    """
+    Benchmark every scene `repeat` times, keeping its fastest run.
+
+    Every render starts from an empty cache folder, so no run is warmed by an earlier one.
+
+    Returns:
+        {scene label: metrics} for the scenes that rendered
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="visualtheorem-bench-") as root:
+        for spec in specs:
+            runs = [
+                bench_scene(spec, preset, Path(root) / "media" / spec.video, tempfile.mkdtemp(prefix="cache-", dir=root))
+                for _ in range(repeat)
+            ]
+            runs = [r for r in runs if r is not None]
+            if not runs:
+                continue
+            best = min(runs, key=lambda r: r["wall"])
+            # Memory is reported at its worst across repeats
+            best["peak_rss_mb"] = max(r["peak_rss_mb"] for r in runs)
+            results[spec.label] = best
+            if on_result is not None:
+                on_result(spec, best)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SERIES_ROOT,
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    path = Path(path)
+    if not path.exists():
+        return {"format": HISTORY_FORMAT, "runs": []}
+    history = json.loads(path.read_text())
+    if history.get("format") != HISTORY_FORMAT:
+        raise SystemExit(f"{path} has history format {history.get('format')}, expected {HISTORY_FORMAT}")
+    return history
+
+
+def save_history(path, history):
+    path = Path(path)
+    partial = path.with_name(path.name + ".partial")
+    partial.write_text(json.dumps(history, indent=2) + "\n")
+    partial.replace(path)
+
+
+def baseline(history, preset, machine, label, metric):
+    """Median of `metric` for `label` over the last BASELINE_RUNS comparable runs, or None."""
+    values = [
+        run["results"][label][metric]
+        for run in history["runs"]
+        if run["preset"] == preset and run["machine"] == machine and label in run["results"]
+    ][-BASELINE_RUNS:]
+    return statistics.median(values) if values else None
+
+
+def regressions(history, entry, threshold):
+    """
+    Metrics of `entry` worse than their baseline by more than `threshold` (a fraction).
+
+    Returns:
+        List of (label, metric, baseline, value)
+    """
+    found = []
+    for label, metrics in entry["results"].items():
+        for metric in CHECKED:
+            base = baseline(history, entry["preset"], entry["machine"], label, metric)
+            if base and metrics[metric] > base * (1 + threshold):
+                found.append((label, metric, base, metrics[metric]))
+    return found
+
+
+def print_result(spec, metrics):
+    print(
+        f"  {spec.label:<42} {metrics['wall']:8.2f}s {metrics['frames']:>6} frames "
+        f"{metrics['fps']:7.2f} fps {metrics['peak_rss_mb']:8.1f} MB {metrics['size_bytes'] / 1e6:7.2f} MB out"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--preset", default="preview", choices=sorted(PRESETS), help="Pinned quality and frame rate (default: preview)")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="Only benchmark this scene class or module (repeatable)")
+    parser.add_argument("--repeat", type=int, default=1, help="Renders per scene; the fastest counts (default: 1)")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help=f"JSON history file (default: {DEFAULT_HISTORY.name} in the series root)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown/memory growth vs the baseline, as a fraction (default: 0.10)")
+    parser.add_argument("--no-record", action="store_true", help="Compare against the history without appending this run")
+    args = parser.parse_args(argv)
+
+    specs = suite_specs(args.scene)
+    if not specs:
+        raise SystemExit("No benchmark scenes selected.")
+    settings = PRESETS[args.preset]
+    print(f"⏱️  Benchmarking {len(specs)} scene(s), preset {args.preset} (-q{settings['quality']}, {settings['frame_rate']} fps)")
+    results = run_suite(specs, args.preset, max(1, args.repeat), on_result=print_result)
+
+    history = load_history(args.history)
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "manim": manim_version(),
+        "preset": args.preset,
+        **settings,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    found = regressions(history, entry, args.threshold)
+    if not args.no_record and results:
+        history["runs"].append(entry)
+        save_history(args.history, history)
+        print(f"Recorded in {args.history}")
+
+    failed = len(specs) - len(results)
+    for label, metric, base, value in found:
+        print(f"  ⚠️  {label}: {metric} {value:g} vs baseline {base:g} (+{value / base - 1:.0%})")
+    print(f"Done: {len(results)} measured, {failed} failed, {len(found)} regression(s) over {args.threshold:.0%}")
+    return 1 if failed or found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
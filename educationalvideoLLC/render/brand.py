@@ -0,0 +1,105 @@
+"""
+Shared brand clip library.
+
+The logo intro/outro (core/logo.py) are rendered once per logo design and quality into
+<cache>/brand/<quality dir>/<key>/, where the key hashes core/logo.py, the core modules it
+imports and render/brand_scenes.py. Scenes rendered with VISUALTHEOREM_BRAND=clips leave a
+splice marker instead, and render.assemble inserts the clip. Videos whose logo code is
+byte-identical share one set of clips, so a change to create_logo rebuilds it once.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from .cache import CACHE_FORMAT, core_dependencies, default_cache_root, manim_version
+from .orchestrator import QUALITY_DIRS, render_all
+from .scenes import SceneSpec
+
+BRAND_SCENES = Path(__file__).with_name("brand_scenes.py")
+
+# Splice marker name -> scene class in brand_scenes.py
+CLIPS = {"intro": "LogoIntro", "outro": "LogoOutro"}
+
+
+def brand_key(video_dir, quality):
+    """Hex digest of everything that shapes a video's brand clips at one quality."""
+    h = hashlib.sha256()
+
+    def feed(label, data):
+        if isinstance(data, str):
+            data = data.encode()
+        h.update(label.encode() + b"\0" + str(len(data)).encode() + b"\0" + data)
+
+    feed("format", str(CACHE_FORMAT))
+    feed("manim", manim_version())
+    feed("quality", quality)
+    feed("scenes", BRAND_SCENES.read_bytes())
+    for dep in core_dependencies(BRAND_SCENES, core_dir=Path(video_dir) / "core"):
+        feed(f"core/{dep.name}", dep.read_bytes())
+    return h.hexdigest()
+
+
+def has_brand(video_dir):
+    return (Path(video_dir) / "core" / "logo.py").exists()
+
+
+class BrandLibrary:
+    """
+    Pre-rendered brand clips, addressed by brand_key.
+
+    Layout: <root>/brand/<quality dir>/<key>/LogoIntro.mp4 and LogoOutro.mp4.
+    """
+    def __init__(self, root=None):
+        self.root = (Path(root) if root is not None else default_cache_root()) / "brand"
+
+    def path_for(self, key, quality, clip):
+        return self.root / QUALITY_DIRS[quality] / key / f"{CLIPS[clip]}.mp4"
+
+    def lookup(self, video_dir, quality, clip):
+        """Return the clip for this video's logo code, or None if it is not built yet."""
+        path = self.path_for(brand_key(video_dir, quality), quality, clip)
+        return path if path.exists() else None
+
+    def build(self, video_dirs, quality, jobs=None, env=None, on_result=None):
+        """
+        Render every missing clip for the given videos (once per distinct key).
+
+        Returns:
+            List of RenderResult for the clips that had to be rendered
+        """
+        pending = {}
+        for video_dir in video_dirs:
+            if not has_brand(video_dir):
+                continue
+            key = brand_key(video_dir, quality)
+            for clip, class_name in CLIPS.items():
+                if (key, clip) not in pending and not self.path_for(key, quality, clip).exists():
+                    pending[(key, clip)] = SceneSpec(video_dir, BRAND_SCENES, class_name)
+        if not pending:
+            return []
+
+        env = {**(env or {}), "VISUALTHEOREM_BRAND": "inline"}
+        results = render_all(list(pending.values()), quality=quality, jobs=jobs, env=env, on_result=on_result)
+        for (key, clip), result in zip(pending, results):
+            if result.ok:
+                self._store(result.output_path, self.path_for(key, quality, clip))
+        return results
+
+    def _store(self, source, target):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+
+    def ensure(self, video_dir, quality, clip, env=None):
+        """Path of a clip, rendering it first if needed."""
+        path = self.lookup(video_dir, quality, clip)
+        if path is not None:
+            return path
+        for result in self.build([video_dir], quality, env=env):
+            if not result.ok:
+                tail = "\n".join(result.log.strip().splitlines()[-15:])
+                raise RuntimeError(f"Brand clip {result.spec.class_name} failed to render:\n{tail}")
+        return self.lookup(video_dir, quality, clip)
@@ -0,0 +1,24 @@
+"""
+Brand clips shared by the whole series (see render/brand.py).
+Rendered from inside a video directory, so `core` is that video's package.
+"""
+
+from manim import *
+from core.config import BACKGROUND_COLOR
+from core.logo import animate_logo_intro, animate_logo_outro
+
+
+class BrandScene(Scene):
+    """Series background on the camera, like core.scene.VisualTheoremScene (without the narrator)."""
+    def setup(self):
+        self.camera.background_color = ManimColor(BACKGROUND_COLOR)
+
+
+class LogoIntro(BrandScene):
+    def construct(self):
+        animate_logo_intro(self, splice=False)
+
+
+class LogoOutro(BrandScene):
+    def construct(self):
+        animate_logo_outro(self, splice=False)
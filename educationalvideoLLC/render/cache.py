@@ -0,0 +1,174 @@
+"""
+Content-addressed render cache.
+A scene's key hashes everything that can change its MP4: the scene module,
+the `core/` modules it (transitively) imports, the quality flags and the manim version.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import time
+from importlib import metadata
+from pathlib import Path
+
+from .scenes import SERIES_ROOT
+
+# Bump when the key layout changes so old entries are ignored
+CACHE_FORMAT = 1
+
+# Environment switches (see render.runner / core/narration.py) that change the output
+OUTPUT_ENV = ("VISUALTHEOREM_SUBTITLES", "VISUALTHEOREM_BRAND")
+
+# Files written next to a scene's MP4 that belong to the same render
+SIDECARS = (".srt", ".cues.json", ".clips.json")
+
+
+def default_cache_root():
+    """Cache location: $VISUALTHEOREM_CACHE, or .render_cache/ in the series root."""
+    return Path(os.environ.get("VISUALTHEOREM_CACHE", SERIES_ROOT / ".render_cache"))
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "not-installed"
+
+
+def _imported_core_modules(source_path, in_core):
+    """Names of the core modules imported by one file (`core.x` absolute or `.x` relative)."""
+    tree = ast.parse(Path(source_path).read_text(), filename=str(source_path))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                parts = alias.name.split(".")
+                if parts[0] == "core" and len(parts) > 1:
+                    names.add(parts[1])
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level == 0 and module.split(".")[0] == "core":
+                parts = module.split(".")
+                if len(parts) > 1:
+                    names.add(parts[1])
+                else:
+                    # from core import narration
+                    names.update(alias.name for alias in node.names)
+            elif node.level == 1 and in_core:
+                if module:
+                    names.add(module.split(".")[0])
+                else:
+                    names.update(alias.name for alias in node.names)
+    return names
+
+
+def core_dependencies(module_path, core_dir=None):
+    """
+    Every `core/` file a scene module depends on, following imports inside core/.
+
+    Args:
+        module_path: Path to the scene module (e.g. video_5/03_axelrod.py)
+        core_dir: The `core/` package it imports (default: next to the module)
+
+    Returns:
+        Sorted list of Paths, including core/__init__.py when core is imported at all
+    """
+    module_path = Path(module_path)
+    core_dir = Path(core_dir) if core_dir is not None else module_path.parent / "core"
+    seen = set()
+    pending = list(_imported_core_modules(module_path, in_core=False))
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        path = core_dir / f"{name}.py"
+        if not path.exists():
+            continue
+        seen.add(name)
+        pending.extend(_imported_core_modules(path, in_core=True))
+
+    deps = [core_dir / f"{name}.py" for name in seen]
+    if deps and (core_dir / "__init__.py").exists():
+        deps.append(core_dir / "__init__.py")
+    return sorted(deps)
+
+
+def scene_key(spec, quality, extra_args=(), env=None):
+    """Hex digest identifying one rendered output of a scene."""
+    h = hashlib.sha256()
+
+    def feed(label, data):
+        if isinstance(data, str):
+            data = data.encode()
+        h.update(label.encode() + b"\0" + str(len(data)).encode() + b"\0" + data)
+
+    feed("format", str(CACHE_FORMAT))
+    feed("manim", manim_version())
+    feed("quality", quality)
+    feed("args", "\0".join(extra_args))
+    env = env or {}
+    feed("env", "\0".join(f"{name}={env.get(name, '')}" for name in OUTPUT_ENV))
+    feed("scene", spec.class_name)
+    feed("module", spec.module_path.read_bytes())
+    for dep in core_dependencies(spec.module_path):
+        feed(f"core/{dep.name}", dep.read_bytes())
+    return h.hexdigest()
+
+
+class RenderCache:
+    """
+    On-disk store of finished scene MP4s, addressed by scene_key.
+
+    Layout: <root>/scenes/<key>.mp4 plus <key>.json with what produced it.
+    """
+    def __init__(self, root=None):
+        self.root = Path(root) if root is not None else default_cache_root()
+        self.scene_dir = self.root / "scenes"
+
+    def path_for(self, key):
+        return self.scene_dir / f"{key}.mp4"
+
+    def lookup(self, key):
+        """Return the cached MP4 for `key`, or None on a miss."""
+        path = self.path_for(key)
+        return path if path.exists() else None
+
+    def store(self, key, video_path, spec=None, quality=None):
+        """Copy a freshly rendered MP4 (and its sidecars) into the cache and return the cached path."""
+        self.scene_dir.mkdir(parents=True, exist_ok=True)
+        target = self.path_for(key)
+        for suffix in SIDECARS:
+            sidecar = Path(video_path).with_suffix(suffix)
+            if sidecar.exists():
+                shutil.copyfile(sidecar, target.with_suffix(suffix))
+        tmp = target.with_suffix(".tmp")
+        shutil.copyfile(video_path, tmp)
+        os.replace(tmp, target)
+
+        info = {"created": time.time(), "manim": manim_version()}
+        if spec is not None:
+            info["scene"] = spec.label
+        if quality is not None:
+            info["quality"] = quality
+        target.with_suffix(".json").write_text(json.dumps(info, indent=2))
+        return target
+
+    def restore(self, key, output_path):
+        """Place the cached MP4 (and sidecars) at the path manim would have written to."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        cached = self.path_for(key)
+        for suffix in ("",) + SIDECARS:
+            source = cached.with_suffix(suffix) if suffix else cached
+            target = output_path.with_suffix(suffix) if suffix else output_path
+            if not source.exists():
+                continue
+            if target.exists():
+                target.unlink()
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copyfile(source, target)
+        return output_path
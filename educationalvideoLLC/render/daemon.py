@@ -0,0 +1,205 @@
+"""
+Warm render daemon: a long-lived process that keeps manim imported between renders.
+
+    python -m render.daemon start &                          # once, from the series root
+    python -m render.daemon render video_5/07_cases.py -q l  # every scene of the module
+    python -m render.daemon render video_5/07_cases.py RealWorldCases
+    python -m render.daemon status
+    python -m render.daemon stop
+
+The server renders requests one at a time with a render.warm.WarmRenderer, so a
+small edit to a scene costs only its re-import and the frames that changed (the
+runner hooks, including the segment cache, are installed once at start). Hook
+switches (VISUALTHEOREM_*) are read from the server's environment when it starts.
+Client and server talk over a Unix socket in the cache folder, created owner-only,
+and authenticate with a random key the server writes next to it (mode 0600) at
+start, so no other user can send it a request.
+"""
+
+import argparse
+import os
+import sys
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+from .cache import default_cache_root
+from .orchestrator import QUALITY_DIRS
+from .scenes import SceneSpec, find_scene_classes
+
+
+def default_socket():
+    return default_cache_root() / "daemon.sock"
+
+
+def key_path(address):
+    """File holding the auth key of the daemon listening on `address`."""
+    return Path(address).with_suffix(".key")
+
+
+def write_key(address):
+    """Generate a fresh auth key and write it, readable by the owner only."""
+    key = os.urandom(32)
+    path = key_path(address)
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def result_payload(result):
+    return {
+        "label": result.spec.label,
+        "ok": result.ok,
+        "elapsed": result.elapsed,
+        "output": str(result.output_path) if result.output_path else None,
+        "log": result.log,
+    }
+
+
+def handle(request, renderer, started):
+    """
+    Answer one request.
+
+    Returns:
+        (reply, stop); raises KeyError, TypeError or AttributeError on a malformed request
+    """
+    op = request.get("op")
+    if op == "stop":
+        return {"ok": True}, True
+    if op == "status":
+        return {
+            "ok": True, "pid": os.getpid(), "uptime": time.perf_counter() - started,
+            "video": str(renderer.video_dir) if renderer.video_dir else None,
+            "renders": renderer.renders,
+        }, False
+    if op != "render":
+        return {"ok": False, "error": f"unknown request {op!r}"}, False
+    scenes = request["scenes"]
+    if not isinstance(scenes, list) or not all(isinstance(name, str) for name in scenes):
+        raise TypeError(f"scenes must be a list of class names, got {scenes!r}")
+    results = []
+    for class_name in scenes:
+        spec = SceneSpec(request["video_dir"], request["module"], class_name)
+        result = renderer.render(spec, request["quality"])
+        status = "✅" if result.ok else "❌"
+        print(f"  {status} {spec.label} ({result.elapsed:.1f}s)", flush=True)
+        results.append(result_payload(result))
+    return {"ok": all(r["ok"] for r in results), "results": results}, False
+
+
+def serve(address, renderer=None):
+    """
+    Accept requests on `address` until a stop request arrives.
+
+    A client that drops its connection or sends a malformed request only loses
+    its own reply; the daemon keeps serving.
+    """
+    started = time.perf_counter()
+    if renderer is None:
+        from .warm import WarmRenderer
+        renderer = WarmRenderer()
+    print(f"🔥 manim warm in {time.perf_counter() - started:.1f}s; listening on {address}", flush=True)
+
+    address = Path(address)
+    address.parent.mkdir(parents=True, exist_ok=True)
+    address.unlink(missing_ok=True)
+    key = write_key(address)
+    # Bind under a restrictive umask so the socket never exists with wider permissions
+    umask = os.umask(0o077)
+    try:
+        listener = Listener(str(address), family="AF_UNIX", authkey=key)
+    finally:
+        os.umask(umask)
+    with listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, OSError) as e:
+                print(f"  ⚠️  rejected a connection: {e!r}", flush=True)
+                continue
+            with conn:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError) as e:
+                    print(f"  ⚠️  client went away: {e!r}", flush=True)
+                    continue
+                try:
+                    reply, stop = handle(request, renderer, started)
+                except (KeyError, TypeError, AttributeError) as e:
+                    print(f"  ⚠️  malformed request: {e!r}", flush=True)
+                    reply, stop = {"ok": False, "error": f"malformed request: {e!r}"}, False
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError) as e:
+                    print(f"  ⚠️  client went away: {e!r}", flush=True)
+            if stop:
+                break
+    address.unlink(missing_ok=True)
+    key_path(address).unlink(missing_ok=True)
+
+
+def request(address, payload):
+    """Send one request to the daemon and return its reply."""
+    try:
+        key = key_path(address).read_bytes()
+        with Client(str(address), family="AF_UNIX", authkey=key) as conn:
+            conn.send(payload)
+            reply = conn.recv()
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise SystemExit(f"No render daemon on {address}; start one with `python -m render.daemon start`.")
+    except AuthenticationError:
+        raise SystemExit(f"The daemon on {address} rejected the key in {key_path(address)}; restart it.")
+    if "error" in reply:
+        raise SystemExit(f"The daemon refused the request: {reply['error']}")
+    return reply
+
+
+def render_request(module, scenes, quality):
+    """Request payload for rendering `scenes` (default: all) of a scene module."""
+    module = Path(module).resolve()
+    if not module.exists():
+        raise SystemExit(f"{module} does not exist")
+    scenes = scenes or find_scene_classes(module)
+    if not scenes:
+        raise SystemExit(f"No scenes in {module}")
+    return {"op": "render", "video_dir": str(module.parent), "module": str(module), "scenes": scenes, "quality": quality}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.daemon", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--socket", default=None, help="Socket path (default: <cache>/daemon.sock)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("start", help="Run the daemon in the foreground")
+    render = commands.add_parser("render", help="Render scenes of a module in the daemon")
+    render.add_argument("module", help="Scene module, e.g. video_5/07_cases.py")
+    render.add_argument("scenes", nargs="*", help="Scene classes (default: every scene in the module)")
+    render.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_DIRS), help="manim quality flag (default: l)")
+    commands.add_parser("status", help="Show what the daemon has loaded")
+    commands.add_parser("stop", help="Shut the daemon down")
+    args = parser.parse_args(argv)
+    address = Path(args.socket).resolve() if args.socket else default_socket()
+
+    if args.command == "start":
+        serve(address)
+        return 0
+    if args.command == "render":
+        reply = request(address, render_request(args.module, args.scenes, args.quality))
+        for result in reply["results"]:
+            if result["ok"]:
+                print(f"  ✅ {result['label']} ({result['elapsed']:.1f}s) -> {result['output']}")
+            else:
+                print(f"  ❌ {result['label']} ({result['elapsed']:.1f}s)")
+                for line in result["log"].strip().splitlines()[-15:]:
+                    print(f"     {line}")
+        return 0 if reply["ok"] else 1
+    reply = request(address, {"op": args.command})
+    if args.command == "status":
+        print(f"pid {reply['pid']}, up {reply['uptime']:.0f}s, {reply['renders']} render(s), video: {reply['video']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Cost of building crowds of human figures: fresh construction vs cached prototypes.
+
+    python -m render.figure_timing --count 500
+
+Builds `count` figures with core/figures.py three ways (build_figure per call, as
+the scenes used to; human_figure copies; one crowd()) and prints the time and the
+peak traced memory of each. Needs manim installed.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from .scenes import SERIES_ROOT
+
+# Video whose core/ package holds the figure factory
+FIGURES_VIDEO = SERIES_ROOT / "video_5"
+
+
+def measure(build):
+    """(seconds, peak bytes) for one call of `build`."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def compare(count=500, style="detailed"):
+    """
+    Returns:
+        Dict of (seconds, peak bytes) for "fresh", "cached" and "crowd"
+    """
+    if str(FIGURES_VIDEO) not in sys.path:
+        sys.path.insert(0, str(FIGURES_VIDEO))
+    from manim import VGroup, YELLOW_A
+    from core import figures
+
+    figures._PROTOTYPES.clear()
+    return {
+        "fresh": measure(lambda: VGroup(*[figures.build_figure(style, YELLOW_A, 0.3) for _ in range(count)])),
+        "cached": measure(lambda: VGroup(*[figures.human_figure(style, YELLOW_A, 0.3) for _ in range(count)])),
+        "crowd": measure(lambda: figures.crowd(count, style, YELLOW_A, 0.3)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.figure_timing", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=500, help="Figures per variant (default: 500)")
+    parser.add_argument("--style", default="detailed", choices=["simple", "detailed"])
+    args = parser.parse_args(argv)
+
+    result = compare(args.count, args.style)
+    fresh = result["fresh"][0]
+    print(f"{args.count} '{args.style}' figures:")
+    for name, label in [("fresh", "build_figure per call"), ("cached", "human_figure copies"), ("crowd", "crowd()")]:
+        seconds, peak = result[name]
+        print(f"  {label:<22} {seconds * 1000:8.1f} ms  {peak / 2**20:6.1f} MiB peak  ({fresh / seconds:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Per-frame cost of the scene background: full-frame Rectangle vs camera background.
+
+    python -m render.frame_timing -q h --frames 240
+
+Draws the same foreground (a title, a subtitle box and a few shapes) through a
+manim Camera both ways and prints milliseconds per frame. Needs manim installed.
+"""
+
+import argparse
+import sys
+import time
+
+from .orchestrator import QUALITY_DIRS
+
+# manim quality flag -> config quality name
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+BACKGROUND_COLOR = "#1a1d2e"  # core/config.py
+
+
+def foreground():
+    from manim import BLACK, DOWN, LEFT, RIGHT, UP, WHITE, Circle, Rectangle, Square, Text, VGroup
+
+    title = Text("Tit for Tat", font_size=42, color=WHITE).to_edge(UP)
+    box = Rectangle(width=9, height=0.8, fill_color=BLACK, fill_opacity=0.5).set_stroke(width=0)
+    box.to_edge(DOWN)
+    shapes = VGroup(*[Circle(radius=0.4, fill_opacity=0.7).shift(LEFT * 3 + RIGHT * 1.5 * i) for i in range(5)])
+    return [title, box, shapes, Square(side_length=2).shift(DOWN * 0.5)]
+
+
+def time_frames(camera, mobjects, frames):
+    """Mean seconds per frame for clearing the camera and drawing `mobjects`."""
+    camera.reset()
+    camera.capture_mobjects(mobjects)  # warm up caches outside the timing
+    start = time.perf_counter()
+    for _ in range(frames):
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+    return (time.perf_counter() - start) / frames
+
+
+def compare(quality="h", frames=120):
+    """
+    Returns:
+        Dict with seconds per frame for "rectangle" and "camera" backgrounds
+    """
+    from manim import Camera, ManimColor, Rectangle, config, tempconfig
+
+    with tempconfig({"quality": QUALITY_NAMES[quality]}):
+        fg = foreground()
+        bg = Rectangle(width=config.frame_width, height=config.frame_height,
+                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
+        rectangle = time_frames(Camera(), [bg, *fg], frames)
+        camera = time_frames(Camera(background_color=ManimColor(BACKGROUND_COLOR)), fg, frames)
+    return {"rectangle": rectangle, "camera": camera}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.frame_timing", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_DIRS))
+    parser.add_argument("--frames", type=int, default=120, help="Frames drawn per variant (default: 120)")
+    args = parser.parse_args(argv)
+
+    result = compare(args.quality, args.frames)
+    print(f"Background cost at {QUALITY_DIRS[args.quality]} ({args.frames} frames):")
+    print(f"  full-frame Rectangle: {result['rectangle'] * 1000:.2f} ms/frame")
+    print(f"  camera background:    {result['camera'] * 1000:.2f} ms/frame")
+    saved = result["rectangle"] - result["camera"]
+    print(f"  saved:                {saved * 1000:.2f} ms/frame ({saved / result['rectangle']:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
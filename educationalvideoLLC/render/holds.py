@@ -0,0 +1,88 @@
+"""
+Static-hold elision.
+
+When a play() is a static hold (a wait() with no updaters, including every narration
+hold), manim already rasterizes one frame, but it then pushes that frame through the
+movie writer once per output frame: 210 full RGBA frames for a 3.5s hold at 60 fps,
+each converted to YUV and piped to the encoder.
+
+With this hook the writer gets the frame once. Afterwards, ffmpeg's `tpad` filter clones
+it to the hold length inside that partial movie, using manim's own encoder settings
+(libx264, yuv420p, crf 23), so the partial files still concatenate without re-encoding.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+# Holds shorter than this are written normally; an ffmpeg launch costs more than they do
+DEFAULT_MIN_SECONDS = 1.0
+
+
+def extend_last_frame(path, extra_frames, frame_rate):
+    """Append `extra_frames` copies of the last frame to a partial movie, in place."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.stem}.hold{path.suffix}")
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-i", str(path),
+            "-vf", f"tpad=stop_mode=clone:stop={extra_frames}",
+            "-r", str(frame_rate),
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23",
+            "-an", str(tmp),
+        ],
+        check=True,
+    )
+    os.replace(tmp, path)
+
+
+def install(min_seconds=DEFAULT_MIN_SECONDS):
+    """
+    Patch manim's Cairo renderer to write static holds as one frame plus padding.
+
+    Must run in the manim process before the scene renders (see render.runner).
+    Transparent renders and non-MP4 outputs keep manim's normal behaviour.
+    """
+    from manim import config
+    from manim.renderer import cairo_renderer
+
+    if shutil.which("ffmpeg") is None:
+        return False
+
+    CairoRenderer = cairo_renderer.CairoRenderer
+    original_play = CairoRenderer.play
+    original_freeze = CairoRenderer.freeze_current_frame
+
+    def freeze_current_frame(self, duration):
+        # Same frame count as manim's own freeze_current_frame (int(duration * rate) can be one off)
+        dt = 1 / self.camera.frame_rate
+        frames = int(duration / dt)
+        if (
+            self.skip_animations
+            or config["transparent"]
+            or config["movie_file_extension"] != ".mp4"
+            or duration < min_seconds
+            or frames < 2
+        ):
+            return original_freeze(self, duration)
+        self.add_frame(self.get_frame(), num_frames=1)
+        self.time += (frames - 1) * dt
+        self._pending_hold_frames = frames - 1
+
+    def play(self, scene, *args, **kwargs):
+        self._pending_hold_frames = 0
+        original_play(self, scene, *args, **kwargs)
+        extra = self._pending_hold_frames
+        self._pending_hold_frames = 0
+        if extra and self.file_writer.partial_movie_files:
+            partial = self.file_writer.partial_movie_files[-1]
+            if partial is not None and Path(partial).exists():
+                extend_last_frame(partial, extra, self.camera.frame_rate)
+                # Frames that reach the movie without passing through write_frame (read by render.profiler)
+                self.padded_frames = getattr(self, "padded_frames", 0) + extra
+
+    CairoRenderer.freeze_current_frame = freeze_current_frame
+    CairoRenderer.play = play
+    return True
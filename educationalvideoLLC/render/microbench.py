@@ -0,0 +1,306 @@
+"""
+Micro-benchmarks for the shared core/ helpers, per video.
+
+    python -m render.microbench                     # every active video
+    python -m render.microbench video_4 video_5 -k subtitle
+    python -m render.microbench --save bench.json   # later: --baseline bench.json
+
+Times mobject construction (no scene) and play() cost (a dry-run scene: frames are
+rasterized but nothing is written) for the subtitle, citation, bibliography, logo
+and human-figure helpers over varied text lengths, font sizes and max widths.
+Each video runs in its own worker process so its own core/ copy is measured; the
+table puts the videos side by side and marks cases whose helper source differs
+between copies. Needs manim installed.
+"""
+
+import argparse
+import hashlib
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .frame_timing import QUALITY_NAMES
+from .orchestrator import QUALITY_DIRS, worker_env
+from .scenes import SERIES_ROOT
+
+# Subtitle texts from one line to a wrapped paragraph
+TEXTS = {
+    "short": "Cooperation pays.",
+    "medium": "Tit for Tat never beats its partner, yet it wins the tournament.",
+    "long": (
+        "A single misread move can lock two reciprocators into an echo of retaliation "
+        "that only forgiveness, or a lucky second mistake, can break."
+    ),
+}
+FONT_SIZES = [20, 26, 36]
+MAX_WIDTHS = [None, 6, 10]
+
+# Shortest time spent on each case, and the rounds bounds
+MIN_TIME = 0.5
+MIN_ROUNDS = 3
+MAX_ROUNDS = 200
+
+# Medians further apart than this between videos (same source) are flagged
+DRIFT_THRESHOLD = 0.25
+
+
+def measure(action, min_time=MIN_TIME):
+    """
+    Call `action` until `min_time` has passed (at least MIN_ROUNDS times).
+
+    Returns:
+        Dict with min and median seconds per call, and the number of rounds
+    """
+    times = []
+    deadline = time.perf_counter() + min_time
+    while len(times) < MIN_ROUNDS or (time.perf_counter() < deadline and len(times) < MAX_ROUNDS):
+        start = time.perf_counter()
+        action()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "rounds": len(times)}
+
+
+def play_action(scene_class, body, quality):
+    """An action rendering a dry-run scene whose construct() is `body(scene)`."""
+    from manim import tempconfig
+
+    class MicroBench(scene_class):
+        def construct(self):
+            body(self)
+
+    settings = {
+        "dry_run": True, "disable_caching": True, "progress_bar": "none",
+        "verbosity": "WARNING", "quality": QUALITY_NAMES[quality],
+    }
+
+    def action():
+        with tempconfig(settings):
+            MicroBench().render()
+
+    return action
+
+
+def subtitle_cases(narration, scene_class, quality):
+    """(name, params, kind, action) cases for core/narration.py."""
+    if not hasattr(narration, "SubtitleCache"):
+        return  # archived videos predate the shared narration API
+    cache_dir = Path(tempfile.gettempdir()) / "visualtheorem-microbench"
+    for text_name, text in TEXTS.items():
+        for font_size in FONT_SIZES:
+            for max_width in MAX_WIDTHS:
+                narrator = narration.NarrationManager(None, font_size=font_size, cache=None, mode="inline")
+                params = {"text": text_name, "font_size": font_size, "max_width": max_width}
+                yield "subtitle", params, "build", (
+                    lambda n=narrator, t=text, w=max_width: n._build_subtitle(t, "bottom", w)
+                )
+        # Cache hit: a copy of an already laid-out group
+        cached = narration.NarrationManager(None, cache=narration.SubtitleCache(cache_dir), mode="inline")
+        cached._subtitle_group(text, "bottom")
+        yield "subtitle.cached", {"text": text_name}, "build", lambda n=cached, t=text: n._subtitle_group(t, "bottom")
+
+        for max_width in MAX_WIDTHS:
+            def body(scene, t=text, w=max_width):
+                narrator = narration.NarrationManager(scene, cache=None, mode="inline")
+                narrator._render_subtitle(t, 1.0, "bottom", max_width=w)
+            yield "subtitle", {"text": text_name, "max_width": max_width}, "play", play_action(scene_class, body, quality)
+
+
+def citation_cases(citations, scene_class, quality):
+    """Cases for core/citations.py, on the shortest and longest citations it defines."""
+    cites = sorted(
+        (value for value in vars(citations).values() if isinstance(value, citations.Citation)),
+        key=lambda c: len(c.full_cite()),
+    )
+    if not cites:
+        return
+    for length, cite in (("short", cites[0]), ("long", cites[-1])):
+        for side_note in (False, True):
+            params = {"cite": length, "side_note": side_note}
+            yield "citation", params, "build", lambda c=cite, s=side_note: citations.build_citation(c, side_note=s)
+
+            def body(scene, c=cite, s=side_note):
+                citations.show_citation(scene, c, duration=1.0, side_note=s)
+            yield "citation", params, "play", play_action(scene_class, body, quality)
+
+    for count in sorted({1, len(cites) // 2 or 1, len(cites)}):
+        selected = cites[:count]
+        yield "bibliography", {"refs": count}, "build", lambda c=selected: citations.build_bibliography(c)
+        if hasattr(citations, "show_bibliography"):
+            yield "bibliography", {"refs": count}, "play", play_action(
+                scene_class, lambda scene, c=selected: citations.show_bibliography(scene, c), quality,
+            )
+
+
+def logo_cases(logo, scene_class, quality):
+    """Cases for core/logo.py."""
+    yield "logo", {}, "build", logo.create_logo
+    yield "brand", {}, "build", logo.create_brand
+    yield "logo.intro", {}, "play", play_action(scene_class, logo.animate_logo_intro, quality)
+    yield "logo.outro", {}, "play", play_action(scene_class, logo.animate_logo_outro, quality)
+
+
+def figure_cases(figures, scene_class, quality):
+    """Cases for core/figures.py."""
+    from manim import FadeIn
+
+    for style in figures.STYLES:
+        yield "figure", {"style": style, "cached": False}, "build", lambda s=style: figures.build_figure(s)
+        yield "figure", {"style": style, "cached": True}, "build", lambda s=style: figures.human_figure(s)
+        yield "crowd", {"style": style, "count": 50}, "build", lambda s=style: figures.crowd(50, s)
+
+        def body(scene, s=style):
+            people = figures.crowd(20, s).arrange_in_grid(rows=4, buff=0.3)
+            scene.play(FadeIn(people, lag_ratio=0.05), run_time=1.0)
+        yield "crowd", {"style": style, "count": 20}, "play", play_action(scene_class, body, quality)
+
+
+# core/ module -> its cases; each module is digested to spot copies drifting apart
+CASES = {
+    "narration": subtitle_cases,
+    "citations": citation_cases,
+    "logo": logo_cases,
+    "figures": figure_cases,
+}
+
+
+def case_id(name, params, kind):
+    """Stable label, e.g. "subtitle.build[text=short,font_size=26,max_width=None]"."""
+    inner = ",".join(f"{k}={v}" for k, v in params.items())
+    return f"{name}.{kind}[{inner}]" if inner else f"{name}.{kind}"
+
+
+def source_digest(video_dir, module):
+    path = Path(video_dir) / "core" / f"{module}.py"
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12] if path.exists() else None
+
+
+def run_worker(quality, keyword, min_time):
+    """Benchmark the helpers of the video in the current directory; results as a list of dicts."""
+    import importlib
+
+    from manim import Scene
+
+    try:
+        scene_class = importlib.import_module("core.scene").VisualTheoremScene
+    except ImportError:
+        scene_class = Scene
+
+    results = []
+    for module_name, cases in CASES.items():
+        try:
+            module = importlib.import_module(f"core.{module_name}")
+        except ImportError:
+            continue
+        digest = source_digest(Path.cwd(), module_name)
+        for name, params, kind, action in cases(module, scene_class, quality):
+            label = case_id(name, params, kind)
+            if keyword and keyword not in label:
+                continue
+            timing = measure(action, min_time if kind == "build" else 0)
+            results.append({"case": label, "module": module_name, "source": digest, **timing})
+    return results
+
+
+def bench_video(video, quality="l", keyword=None, min_time=MIN_TIME):
+    """Run the worker for one video directory in its own process."""
+    video_dir = SERIES_ROOT / video
+    cmd = [
+        sys.executable, "-m", "render.microbench", "--worker", video,
+        "-q", quality, "--min-time", str(min_time), *(["-k", keyword] if keyword else []),
+    ]
+    env = worker_env({"VISUALTHEOREM_SUBTITLES": "inline", "VISUALTHEOREM_BRAND": "inline"})
+    proc = subprocess.run(cmd, cwd=video_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{video} microbenchmarks failed:\n{proc.stderr.strip()}")
+    # Results are the last line; manim may log above it
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def drift(results):
+    """
+    Cases whose helper source is identical across videos but whose medians are not.
+
+    Returns:
+        List of (case, slowest video, ratio slowest/fastest)
+    """
+    by_case = {}
+    for video, rows in results.items():
+        for row in rows:
+            by_case.setdefault(row["case"], []).append((video, row))
+    found = []
+    for case, entries in by_case.items():
+        if len(entries) < 2 or len({row["source"] for _, row in entries}) > 1:
+            continue
+        fastest = min(row["median"] for _, row in entries)
+        video, slowest = max(entries, key=lambda e: e[1]["median"])
+        if fastest and slowest["median"] / fastest > 1 + DRIFT_THRESHOLD:
+            found.append((case, video, slowest["median"] / fastest))
+    return found
+
+
+def print_table(results):
+    videos = list(results)
+    cases = list(dict.fromkeys(row["case"] for rows in results.values() for row in rows))
+    lookup = {(video, row["case"]): row for video, rows in results.items() for row in rows}
+    width = max(len(case) for case in cases)
+    print(f"{'case (median ms)':<{width}}  " + "  ".join(f"{v:>10}" for v in videos))
+    for case in cases:
+        rows = [lookup.get((video, case)) for video in videos]
+        cells = [f"{row['median'] * 1000:10.2f}" if row else f"{'-':>10}" for row in rows]
+        sources = {row["source"] for row in rows if row}
+        note = "  (copies differ)" if len(sources) > 1 else ""
+        print(f"{case:<{width}}  " + "  ".join(cells) + note)
+
+
+def compare(results, baseline, threshold):
+    """Cases slower than in `baseline` by more than `threshold`: (video, case, before, after)."""
+    found = []
+    for video, rows in results.items():
+        before = {row["case"]: row for row in baseline.get(video, [])}
+        for row in rows:
+            old = before.get(row["case"])
+            if old and row["median"] > old["median"] * (1 + threshold):
+                found.append((video, row["case"], old["median"], row["median"]))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.microbench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("videos", nargs="*", help="Video directories (default: every active video_*)")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_NAMES), help="Quality of play() cases (default: l)")
+    parser.add_argument("-k", "--keyword", default=None, help="Only cases whose label contains this text")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help=f"Seconds spent per build case (default: {MIN_TIME})")
+    parser.add_argument("--save", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs the baseline, as a fraction (default: 0.2)")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.quality, args.keyword, args.min_time)))
+        return 0
+
+    videos = args.videos or sorted(p.name for p in SERIES_ROOT.glob("video_*") if (p / "core").is_dir())
+    print(f"⏱️  Core helper microbenchmarks ({QUALITY_DIRS[args.quality]} play cases): {', '.join(videos)}")
+    results = {video: bench_video(video, args.quality, args.keyword, args.min_time) for video in videos}
+    print_table(results)
+
+    for case, video, ratio in drift(results):
+        print(f"  ⚠️  {case}: identical source, but {video} is {ratio:.1f}x the fastest copy")
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved to {args.save}")
+    if args.baseline:
+        slower = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        for video, case, before, after in slower:
+            print(f"  ⚠️  {video} {case}: {before * 1000:.2f} -> {after * 1000:.2f} ms")
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
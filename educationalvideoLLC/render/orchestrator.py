@@ -0,0 +1,163 @@
+"""
+Parallel render orchestrator.
+Renders many scenes at once, one manim process per scene, across a process pool.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .cache import SIDECARS, scene_key
+from .scenes import SERIES_ROOT
+
+# manim quality flag -> output folder name (pixel height + frame rate)
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+
+class RenderResult:
+    """Outcome of rendering one scene."""
+    def __init__(self, spec, returncode, output_path, elapsed, log="", cached=False):
+        self.spec = spec
+        self.returncode = returncode
+        self.output_path = output_path
+        self.elapsed = elapsed
+        self.log = log
+        self.cached = cached
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+    def __repr__(self):
+        status = "cached" if self.cached else "ok" if self.ok else f"failed ({self.returncode})"
+        return f"RenderResult({self.spec.label}, {status}, {self.elapsed:.1f}s)"
+
+
+def media_dir_for(spec):
+    """Each video renders into its own media/ folder so module names never collide."""
+    return spec.video_dir / "media"
+
+
+def output_path_for(spec, quality):
+    """Path manim writes the final MP4 of a scene to."""
+    return (
+        media_dir_for(spec) / "videos" / spec.module_name
+        / QUALITY_DIRS[quality] / f"{spec.class_name}.mp4"
+    )
+
+
+def manim_command(spec, quality, extra_args=(), media_dir=None):
+    """Build the manim command line for one scene (run through render.runner for the hooks)."""
+    return [
+        sys.executable, "-m", "render.runner", "render",
+        f"-q{quality}",
+        "--media_dir", str(media_dir or media_dir_for(spec)),
+        *extra_args,
+        str(spec.module_path),
+        spec.class_name,
+    ]
+
+
+def worker_env(env=None):
+    """Environment for a manim process: ours, plus `env`, with the series root importable."""
+    env = {**os.environ, **(env or {})}
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SERIES_ROOT), env.get("PYTHONPATH")) if p
+    )
+    return env
+
+
+def render_scene(spec, quality="h", extra_args=(), cache=None, key=None, env=None):
+    """
+    Render a single scene in a fresh manim process.
+
+    Runs from the video directory so the scene's `core` package is the one imported.
+    With a RenderCache and key, a successful render is stored for later runs.
+    `env` holds extra environment variables, e.g. the render.runner hook switches.
+    """
+    cmd = manim_command(spec, quality, extra_args)
+    for suffix in SIDECARS:
+        # Drop sidecars of an earlier render so they are not mistaken for this one's
+        output_path_for(spec, quality).with_suffix(suffix).unlink(missing_ok=True)
+    env = worker_env(env)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd,
+        cwd=spec.video_dir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    output = output_path_for(spec, quality)
+    if proc.returncode != 0 or not output.exists():
+        output = None
+    elif cache is not None and key is not None:
+        cache.store(key, output, spec=spec, quality=quality)
+    return RenderResult(spec, proc.returncode, output, elapsed, proc.stdout)
+
+
+def cached_result(spec, quality, cache, key):
+    """RenderResult for a cache hit, or None. Hits never launch manim."""
+    if cache.lookup(key) is None:
+        return None
+    start = time.perf_counter()
+    output = cache.restore(key, output_path_for(spec, quality))
+    return RenderResult(spec, 0, output, time.perf_counter() - start, cached=True)
+
+
+def render_all(specs, quality="h", jobs=None, extra_args=(), on_result=None, cache=None, env=None):
+    """
+    Render scenes in parallel.
+
+    Args:
+        specs: SceneSpec list (from scenes.discover_video / discover_series)
+        quality: manim quality flag (l, m, h, p, k)
+        jobs: Number of worker processes (defaults to the CPU count)
+        extra_args: Extra manim CLI arguments passed to every render
+        on_result: Optional callback invoked with each RenderResult as it finishes
+        cache: Optional RenderCache; unchanged scenes are restored from it instead of rendered
+        env: Extra environment variables for every manim process (see render.runner)
+
+    Returns:
+        List of RenderResult in the same order as `specs`
+    """
+    if quality not in QUALITY_DIRS:
+        raise ValueError(f"Unknown quality '{quality}', expected one of {sorted(QUALITY_DIRS)}")
+    jobs = jobs or os.cpu_count() or 1
+    extra_args = tuple(extra_args)
+    results = {}
+    pending = []
+    for i, spec in enumerate(specs):
+        key = scene_key(spec, quality, extra_args, env) if cache is not None else None
+        hit = cached_result(spec, quality, cache, key) if cache is not None else None
+        if hit is not None:
+            results[i] = hit
+            if on_result is not None:
+                on_result(hit)
+        else:
+            pending.append((i, spec, key))
+
+    if not pending:
+        return [results[i] for i in range(len(specs))]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+        futures = {
+            pool.submit(render_scene, spec, quality, extra_args, cache, key, env): i
+            for i, spec, key in pending
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[i] for i in range(len(specs))]
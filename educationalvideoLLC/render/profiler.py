@@ -0,0 +1,245 @@
+"""
+Per-play() render profiler.
+
+Records every play() (wait() included, it is a play of Wait) with its wall time,
+frames output (hold frames padded by render.holds included), mobject count and
+Bezier point count, and splits the time into
+  construct    building heavy mobjects (Text, MathTex, SVGs, images)
+  interpolate  advancing animations and updaters to each frame time
+  rasterize    Cairo drawing the frame
+  write        piping frames to ffmpeg
+Writes `<Scene>.trace.json` (open in chrome://tracing or ui.perfetto.dev) and a
+`<Scene>.profile.txt` summary sorted by wall time.
+
+    VISUALTHEOREM_PROFILE=profiles python -m render.runner render -qh 03_tips.py Tips
+"""
+
+import functools
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Trace lanes, one per category, so spans never have to nest
+LANES = {"play": 1, "construct": 2, "interpolate": 3, "rasterize": 4, "write": 5}
+CATEGORIES = ["construct", "interpolate", "rasterize", "write"]
+
+# Mobject classes whose construction is timed (outermost constructor only)
+CONSTRUCTED = ["Text", "MarkupText", "Paragraph", "MathTex", "Tex", "SVGMobject", "ImageMobject", "Code"]
+
+
+class PlayRecord:
+    """What one play() cost."""
+    def __init__(self, index, label):
+        self.index = index
+        self.label = label
+        self.wall = 0.0
+        self.frames = 0
+        self.mobjects = 0
+        self.points = 0
+        self.split = defaultdict(float)
+
+
+class Profile:
+    """
+    Trace events and play records of one scene render.
+
+    install() keeps a single Profile and reset()s it as each Scene.render starts, so
+    warm processes rendering several scenes write each scene's own numbers.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.start = time.perf_counter()
+        self.events = []
+        self.plays = []
+        self.current = None
+        self.outside = defaultdict(float)       # category time outside any play()
+        self.built = defaultdict(lambda: [0, 0.0])  # class name -> [count, seconds]
+        self.depth = 0
+
+    def _us(self, t):
+        return (t - self.start) * 1e6
+
+    def span(self, category, name, start, end, args=None):
+        event = {
+            "name": name, "cat": category, "ph": "X", "pid": 1, "tid": LANES[category],
+            "ts": self._us(start), "dur": (end - start) * 1e6,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def record(self, category, name, start, end, frames=0):
+        self.span(category, name, start, end)
+        bucket = self.current.split if self.current is not None else self.outside
+        bucket[category] += end - start
+        if frames and self.current is not None:
+            self.current.frames += frames
+
+    def trace(self):
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": lane}}
+            for lane, tid in LANES.items()
+        ]
+        return {"traceEvents": meta + self.events, "displayTimeUnit": "ms"}
+
+    def summary(self, scene_name):
+        total = sum(p.wall for p in self.plays)
+        lines = [
+            f"{scene_name}: {len(self.plays)} play() calls, {total:.2f}s in play(), "
+            f"{sum(p.frames for p in self.plays)} frames output",
+            "",
+            "Time by category (inside play / outside):",
+        ]
+        for category in CATEGORIES:
+            inside = sum(p.split[category] for p in self.plays)
+            lines.append(f"  {category:<12} {inside:8.2f}s  {self.outside[category]:8.2f}s")
+
+        lines += ["", "Slowest play() calls:",
+                  f"  {'#':>4} {'wall s':>8} {'frames':>6} {'ms/frame':>8} {'mobjects':>8} {'points':>9} "
+                  + " ".join(f"{c[:6]:>7}" for c in CATEGORIES) + "  animations"]
+        for p in sorted(self.plays, key=lambda p: p.wall, reverse=True):
+            per_frame = p.wall / p.frames * 1000 if p.frames else 0.0
+            lines.append(
+                f"  {p.index:>4} {p.wall:8.3f} {p.frames:>6} {per_frame:8.2f} {p.mobjects:>8} {p.points:>9} "
+                + " ".join(f"{p.split[c]:7.3f}" for c in CATEGORIES) + f"  {p.label}"
+            )
+
+        if self.built:
+            lines += ["", "Mobject construction:"]
+            for name, (count, seconds) in sorted(self.built.items(), key=lambda item: -item[1][1]):
+                lines.append(f"  {name:<14} {count:>6} built  {seconds:8.3f}s")
+        return "\n".join(lines) + "\n"
+
+
+def play_label(args):
+    """Short description of what a play() animates, e.g. "Write(Text), FadeIn(VGroup)"."""
+    parts = []
+    for anim in args:
+        name = type(anim).__name__
+        if name == "Wait":
+            parts.append(f"wait {anim.run_time:.2f}s")
+            continue
+        mobject = getattr(anim, "mobject", None)
+        if name == "_AnimationBuilder":
+            name = "animate"
+        parts.append(f"{name}({type(mobject).__name__})" if mobject is not None else name)
+    return ", ".join(parts) or "play()"
+
+
+def scene_size(scene):
+    """(mobjects, points) over every mobject in the scene, submobjects included."""
+    family = [m for top in scene.mobjects for m in top.get_family()]
+    return len(family), sum(len(m.points) for m in family)
+
+
+def _timed(profile, category, fn, name):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.record(category, name, start, time.perf_counter())
+    return wrapper
+
+
+def _timed_write(profile, fn):
+    """Time SceneFileWriter.write_frame and count the frames each call writes (its num_frames)."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        frames = kwargs.get("num_frames", args[2] if len(args) > 2 else 1)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.record("write", "write_frame", start, time.perf_counter(), frames=frames)
+    return wrapper
+
+
+def _timed_constructor(profile, cls):
+    original = cls.__init__
+
+    @functools.wraps(original)
+    def __init__(self, *args, **kwargs):
+        if profile.depth:
+            return original(self, *args, **kwargs)
+        profile.depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            profile.depth -= 1
+            name = type(self).__name__
+            profile.record("construct", name, start, end)
+            built = profile.built[name]
+            built[0] += 1
+            built[1] += end - start
+
+    cls.__init__ = __init__
+
+
+def install(output_dir):
+    """
+    Patch manim so every Scene render writes a trace and a summary to `output_dir`.
+
+    Must run in the manim process before the scene renders (see render.runner).
+    """
+    import manim
+    from manim import Scene
+    from manim.camera.camera import Camera
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    constructed = [getattr(manim, name) for name in CONSTRUCTED if hasattr(manim, name)]
+    instrument(Profile(), output_dir, Scene, Camera, SceneFileWriter, constructed)
+    return True
+
+
+def instrument(profile, output_dir, Scene, Camera, SceneFileWriter, constructed=()):
+    """Patch the given scene, camera and file writer classes to record into `profile`."""
+    output_dir = Path(output_dir)
+    for cls in constructed:
+        _timed_constructor(profile, cls)
+    Scene.update_to_time = _timed(profile, "interpolate", Scene.update_to_time, "update_to_time")
+    Camera.capture_mobjects = _timed(profile, "rasterize", Camera.capture_mobjects, "capture_mobjects")
+    SceneFileWriter.write_frame = _timed_write(profile, SceneFileWriter.write_frame)
+
+    original_play = Scene.play
+    original_render = Scene.render
+
+    def play(self, *args, **kwargs):
+        record = PlayRecord(len(profile.plays), play_label(args))
+        outer, profile.current = profile.current, record
+        padded = getattr(self.renderer, "padded_frames", 0)
+        start = time.perf_counter()
+        try:
+            return original_play(self, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            profile.current = outer
+            # Holds elided by render.holds write one frame; ffmpeg pads the rest
+            record.frames += getattr(self.renderer, "padded_frames", 0) - padded
+            record.wall = end - start
+            record.mobjects, record.points = scene_size(self)
+            profile.plays.append(record)
+            profile.span("play", record.label, start, end, {
+                "index": record.index, "frames": record.frames,
+                "mobjects": record.mobjects, "points": record.points,
+                **{f"{c}_ms": round(record.split[c] * 1000, 3) for c in CATEGORIES},
+            })
+
+    def render(self, *args, **kwargs):
+        profile.reset()
+        try:
+            return original_render(self, *args, **kwargs)
+        finally:
+            name = type(self).__name__
+            output_dir.mkdir(parents=True, exist_ok=True)
+            (output_dir / f"{name}.trace.json").write_text(json.dumps(profile.trace()))
+            (output_dir / f"{name}.profile.txt").write_text(profile.summary(name))
+
+    Scene.play = play
+    Scene.render = render
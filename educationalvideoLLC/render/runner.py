@@ -0,0 +1,74 @@
+"""
+Run the manim CLI with the series' renderer hooks installed.
+
+    python -m render.runner render -qh 03_axelrod.py Axelrod
+
+Takes exactly the arguments `manim` takes. Hooks are switched with environment
+variables so the orchestrator can configure each worker process:
+
+    VISUALTHEOREM_SEGMENT_CACHE   segment store folder, or "off" (default: <cache>/segments)
+    VISUALTHEOREM_HOLD_ELISION    minimum static hold in seconds to elide, or "off" (default: 1.0)
+    VISUALTHEOREM_PROFILE         folder for per-play() traces and summaries (default: off)
+"""
+
+import os
+import sys
+
+from .cache import default_cache_root
+
+OFF = {"", "0", "off", "false", "no"}
+
+
+def segment_cache_root():
+    """Segment store folder from the environment, or None when disabled."""
+    value = os.environ.get("VISUALTHEOREM_SEGMENT_CACHE")
+    if value is None:
+        return default_cache_root() / "segments"
+    if value.strip().lower() in OFF:
+        return None
+    return value
+
+
+def hold_elision_threshold():
+    """Minimum static hold (seconds) written as a single frame, or None when disabled."""
+    from .holds import DEFAULT_MIN_SECONDS
+    value = os.environ.get("VISUALTHEOREM_HOLD_ELISION")
+    if value is None:
+        return DEFAULT_MIN_SECONDS
+    if value.strip().lower() in OFF:
+        return None
+    return float(value)
+
+
+def profile_dir():
+    """Profiler output folder from the environment, or None when disabled."""
+    value = os.environ.get("VISUALTHEOREM_PROFILE", "")
+    if value.strip().lower() in OFF:
+        return None
+    return value
+
+
+def install_hooks():
+    root = segment_cache_root()
+    if root is not None:
+        from . import segments
+        segments.install(root)
+    min_seconds = hold_elision_threshold()
+    if min_seconds is not None:
+        from . import holds
+        holds.install(min_seconds)
+    # Last, so play() timings include the other hooks
+    output_dir = profile_dir()
+    if output_dir is not None:
+        from . import profiler
+        profiler.install(output_dir)
+
+
+def main(argv=None):
+    install_hooks()
+    from manim.__main__ import main as manim_main
+    return manim_main(args=argv if argv is not None else sys.argv[1:], prog_name="manim")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
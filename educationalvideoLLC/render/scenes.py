@@ -0,0 +1,92 @@
+"""
+Scene discovery for VisualTheorem videos.
+Reads scene modules with `ast` so nothing (including manim) is imported.
+"""
+
+import ast
+from pathlib import Path
+
+SERIES_ROOT = Path(__file__).resolve().parent.parent
+
+# Base classes that mark a class as a renderable manim scene
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene", "VisualTheoremScene"}
+
+
+class SceneSpec:
+    """A single renderable scene: one class inside one module of a video."""
+    def __init__(self, video_dir, module_path, class_name):
+        self.video_dir = Path(video_dir)
+        self.module_path = Path(module_path)
+        self.class_name = class_name
+
+    @property
+    def video(self):
+        return self.video_dir.name
+
+    @property
+    def module_name(self):
+        return self.module_path.stem
+
+    @property
+    def label(self):
+        """Short label used in logs, e.g. video_5/03_axelrod.py::Axelrod"""
+        return f"{self.video}/{self.module_path.name}::{self.class_name}"
+
+    def __repr__(self):
+        return f"SceneSpec({self.label})"
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def find_scene_classes(module_path):
+    """Return the names of the Scene subclasses defined in a module, in source order."""
+    tree = ast.parse(Path(module_path).read_text(), filename=str(module_path))
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = {_base_name(b) for b in node.bases}
+        if bases & SCENE_BASES:
+            names.append(node.name)
+    return names
+
+
+def discover_video(video_dir):
+    """
+    Find every scene in a video directory.
+
+    Args:
+        video_dir: Directory holding the scene modules and a `core/` package
+
+    Returns:
+        List of SceneSpec, ordered by module file name
+    """
+    video_dir = Path(video_dir).resolve()
+    specs = []
+    for module_path in sorted(video_dir.glob("*.py")):
+        for class_name in find_scene_classes(module_path):
+            specs.append(SceneSpec(video_dir, module_path, class_name))
+    return specs
+
+
+def discover_series(root=SERIES_ROOT):
+    """Find the scenes of every active video (`video_*`) in the series."""
+    specs = []
+    for video_dir in sorted(Path(root).glob("video_*")):
+        if video_dir.is_dir() and (video_dir / "core").is_dir():
+            specs.extend(discover_video(video_dir))
+    return specs
+
+
+def select_scenes(specs, names):
+    """Keep only the scenes whose class or module name is in `names` (all if empty)."""
+    if not names:
+        return list(specs)
+    wanted = set(names)
+    return [s for s in specs if s.class_name in wanted or s.module_name in wanted]
@@ -0,0 +1,254 @@
+"""
+Durable animation-segment cache.
+
+manim writes one partial movie per play()/wait() into media/.../partial_movie_files and
+skips a call when a file with the same hash already exists. Those hashes come from a JSON
+dump of the scene and move around between runs, and the folder is pruned and often deleted.
+
+This module swaps in a stable digest of the camera, the animation parameters and the
+mobject state (points, colors, stroke/fill, updaters and the data their closures,
+defaults and globals hold) at each call, chained to the digest of the previous call.
+Finished segments are published to a shared store, so a re-render anywhere that
+points at the same store only recomputes the calls after the first change.
+"""
+
+import hashlib
+import inspect
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+# Bump when the digest layout changes so old segments are ignored
+DIGEST_FORMAT = 3
+
+# Decimal places kept when hashing float arrays; hides float noise between machines
+PRECISION = 6
+
+# How deep nested values (containers, closures, functions they reach) are followed
+MAX_DEPTH = 4
+
+# Animation attributes that hold live state rather than parameters
+SKIPPED_ATTRS = {"starting_mobject", "renderer", "scene", "animations_hashes"}
+
+
+class _Digest:
+    """Incremental hasher that understands mobjects, animations, arrays and callables."""
+    def __init__(self, seed=b""):
+        self.h = hashlib.sha256(seed)
+        self.seen = set()
+
+    def tag(self, label):
+        self.h.update(b"\x00" + label.encode() + b"\x00")
+
+    def array(self, value):
+        arr = np.asarray(value)
+        if arr.dtype.kind == "f":
+            arr = np.round(arr, PRECISION) + 0.0  # + 0.0 folds -0.0 into 0.0
+        self.tag(f"{arr.dtype.str}{arr.shape}")
+        self.h.update(np.ascontiguousarray(arr).tobytes())
+
+    def callable(self, fn, depth=0):
+        owner = getattr(fn, "__self__", None)
+        if hasattr(owner, "digest_state"):
+            # Stateful updaters (e.g. core/scheduler.py) describe their pending work
+            self.value(owner.digest_state(), depth=1)
+        fn = getattr(fn, "__func__", fn)
+        name = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', type(fn).__name__)}"
+        self.tag(f"fn:{name}")
+        code = getattr(fn, "__code__", None)
+        if code is not None:
+            self.code(code)
+        if not inspect.isfunction(fn) or depth > MAX_DEPTH:
+            return
+        if id(fn) in self.seen:
+            self.tag("fn:seen")
+            return
+        self.seen.add(id(fn))
+        # The data a function works on: defaults, closure cells and the globals it reads
+        self.tag("defaults")
+        self.value(fn.__defaults__, depth + 1)
+        self.value(fn.__kwdefaults__, depth + 1)
+        try:
+            variables = inspect.getclosurevars(fn)
+        except (TypeError, ValueError):
+            return
+        for scope, names in (("nonlocal", variables.nonlocals), ("global", variables.globals)):
+            for key in sorted(names):
+                if inspect.ismodule(names[key]):
+                    continue
+                self.tag(f"{scope}:{key}")
+                self.value(names[key], depth + 1)
+
+    def code(self, code):
+        """Bytecode and literal constants, nested functions (lambdas, inner defs) included."""
+        self.h.update(code.co_code)
+        for const in code.co_consts:
+            if inspect.iscode(const):
+                self.tag(f"code:{const.co_name}")
+                self.code(const)
+            elif isinstance(const, (int, float, str, bytes, bool)) or const is None:
+                self.tag(repr(const))
+
+    def mobject(self, mob):
+        for m in mob.get_family():
+            self.tag(f"mob:{type(m).__name__}")
+            self.array(m.points)
+            for attr in (
+                "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas",
+                "stroke_width", "background_stroke_width",
+                "sheen_factor", "sheen_direction", "z_index", "pixel_array",
+            ):
+                value = getattr(m, attr, None)
+                if value is not None:
+                    self.tag(attr)
+                    self.array(value)
+            for updater in getattr(m, "updaters", []):
+                self.callable(updater)
+
+    def value(self, value, depth=0):
+        """Hash an arbitrary animation attribute without relying on ids or reprs."""
+        if depth > MAX_DEPTH:
+            return
+        if value is None or isinstance(value, (bool, int, str)):
+            self.tag(repr(value))
+        elif isinstance(value, float):
+            self.tag(repr(round(value, PRECISION)))
+        elif isinstance(value, np.ndarray):
+            self.array(value)
+        elif hasattr(value, "get_family") and hasattr(value, "points"):
+            if id(value) in self.seen:
+                self.tag("mob:seen")
+                return
+            self.seen.add(id(value))
+            self.mobject(value)
+        elif hasattr(value, "interpolate") and hasattr(value, "run_time"):
+            self.animation(value, depth + 1)
+        elif isinstance(value, (list, tuple)):
+            self.tag(f"seq:{len(value)}")
+            for item in value:
+                self.value(item, depth + 1)
+        elif isinstance(value, dict):
+            for k in sorted(value, key=str):
+                self.tag(str(k))
+                self.value(value[k], depth + 1)
+        elif callable(value):
+            self.callable(value, depth)
+        else:
+            self.tag(type(value).__name__)
+
+    def animation(self, anim, depth=0):
+        self.tag(f"anim:{type(anim).__name__}")
+        for name in sorted(vars(anim)):
+            if name.startswith("_") or name in SKIPPED_ATTRS:
+                continue
+            self.tag(name)
+            self.value(getattr(anim, name), depth)
+
+    def hexdigest(self):
+        return self.h.hexdigest()
+
+
+def play_digest(previous, camera, animations, mobjects):
+    """
+    Stable digest of one play()/wait() call.
+
+    Args:
+        previous: Digest of the previous call in this scene ("" for the first)
+        camera: The renderer's camera
+        animations: Compiled animations of the call
+        mobjects: Scene mobjects at the start of the call
+
+    Returns:
+        Hex digest string, usable as a partial movie file name
+    """
+    d = _Digest(f"{DIGEST_FORMAT}:{previous}".encode())
+    d.tag("camera")
+    d.value([
+        camera.pixel_width, camera.pixel_height, camera.frame_rate,
+        camera.frame_width, camera.frame_height,
+    ])
+    d.array(camera.frame_center)
+    d.value(str(camera.background_color))
+    d.tag("animations")
+    for anim in animations:
+        d.animation(anim)
+    d.tag("mobjects")
+    for mob in mobjects:
+        d.mobject(mob)
+    return d.hexdigest()
+
+
+class SegmentStore:
+    """Shared folder of partial movie files, named by play_digest."""
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path_for(self, digest, ext):
+        return self.root / digest[:2] / f"{digest}{ext}"
+
+    def fetch(self, digest, ext, target):
+        """Link a stored segment into manim's partial movie folder. Returns True on a hit."""
+        source = self.path_for(digest, ext)
+        if not source.exists():
+            return False
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        return True
+
+    def publish(self, source, digest, ext):
+        """Copy a finished segment into the store (no-op if it is already there)."""
+        target = self.path_for(digest, ext)
+        if target.exists():
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+
+
+def install(store_root):
+    """
+    Route manim's partial movie caching through a SegmentStore.
+
+    Must run in the manim process before the scene renders (see render.runner).
+    """
+    from manim import config
+    from manim.renderer import cairo_renderer
+
+    store = SegmentStore(store_root)
+    CairoRenderer = cairo_renderer.CairoRenderer
+    original_finished = CairoRenderer.scene_finished
+
+    def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+        previous = getattr(scene_object, "_segment_digest", "")
+        digest = play_digest(previous, camera_object, animations_list, current_mobjects_list)
+        scene_object._segment_digest = digest
+
+        file_writer = scene_object.renderer.file_writer
+        ext = config["movie_file_extension"]
+        local = Path(file_writer.partial_movie_directory) / f"{digest}{ext}"
+        if not local.exists():
+            store.fetch(digest, ext, local)
+        return digest
+
+    def scene_finished(self, scene):
+        ext = config["movie_file_extension"]
+        partial_dir = getattr(self.file_writer, "partial_movie_directory", None)
+        if partial_dir is not None:
+            for digest in self.animations_hashes:
+                if digest is None:
+                    continue
+                local = Path(partial_dir) / f"{digest}{ext}"
+                if local.exists():
+                    store.publish(local, digest, ext)
+        return original_finished(self, scene)
+
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+    CairoRenderer.scene_finished = scene_finished
+    return store
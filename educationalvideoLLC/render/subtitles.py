@@ -0,0 +1,136 @@
+"""
+Subtitle sidecars for narration recorded in "track" mode (see core/narration.py).
+Converts <Scene>.cues.json files to ASS with the same look as the drawn subtitles,
+and merges the cues of several scenes onto one timeline for assembly.
+"""
+
+import json
+import re
+from pathlib import Path
+
+# manim font sizes are 1/960 of the frame width per point
+FONT_POINTS_PER_FRAME_WIDTH = 960
+
+# Subtitle edge offsets used by NarrationManager (to_edge buff 0.5 + shift), in frame units
+EDGE_OFFSETS = {"bottom": 0.5 + 0.3, "top": 0.5 + 0.5}
+ALIGNMENT = {"bottom": 2, "top": 8}  # ASS numpad alignment: bottom/top centre
+
+ASS_HEADER = """[Script Info]
+ScriptType: v4.00+
+PlayResX: {width}
+PlayResY: {height}
+WrapStyle: 0
+ScaledBorderAndShadow: yes
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+{styles}
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+def load_track(path):
+    """Read a .cues.json sidecar; returns None if the scene recorded no narration."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def merge_tracks(tracks_with_offsets):
+    """
+    Put the cues of several scenes on one timeline.
+
+    Args:
+        tracks_with_offsets: (track dict or None, start offset in seconds) per scene
+
+    Returns:
+        Track dict with the first track's frame settings and all cues shifted
+    """
+    merged = None
+    for track, offset in tracks_with_offsets:
+        if track is None:
+            continue
+        if merged is None:
+            merged = {k: v for k, v in track.items() if k != "cues"}
+            merged["scene"] = "assembled"
+            merged["cues"] = []
+        for cue in track["cues"]:
+            shifted = dict(cue)
+            shifted["start"] = round(cue["start"] + offset, 3)
+            shifted["end"] = round(cue["end"] + offset, 3)
+            merged["cues"].append(shifted)
+    return merged
+
+
+def _ass_time(seconds):
+    cs = int(round(seconds * 100))
+    h, cs = divmod(cs, 360000)
+    m, cs = divmod(cs, 6000)
+    s, cs = divmod(cs, 100)
+    return f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
+
+
+def _ass_color(hex_color, alpha=0):
+    """'#RRGGBB' -> '&HAABBGGRR' (alpha 00 is opaque)."""
+    h = hex_color.lstrip("#")[:6].upper().rjust(6, "0")
+    return f"&H{alpha:02X}{h[4:6]}{h[2:4]}{h[0:2]}"
+
+
+def _ass_text(markup):
+    text = markup.replace("\n", "\\N")
+    for tag, code in (("i", "i"), ("b", "b")):
+        text = re.sub(rf"<{tag}>", f"{{\\\\{code}1}}", text)
+        text = re.sub(rf"</{tag}>", f"{{\\\\{code}0}}", text)
+    return re.sub(r"<[^>]+>", "", text)
+
+
+def to_ass(track):
+    """Render a track dict as an ASS script styled like NarrationManager's subtitles."""
+    width, height = track["pixel_width"], track["pixel_height"]
+    px_per_unit = height / track["frame_height"]
+    fade_ms = int(track.get("fade", 0.5) * 1000)
+
+    sizes = {cue["font_size"] for cue in track["cues"]} or {26}
+    styles = []
+    for position in ("bottom", "top"):
+        for size in sorted(sizes):
+            font_px = round(size * width / FONT_POINTS_PER_FRAME_WIDTH)
+            margin_v = round(EDGE_OFFSETS[position] * px_per_unit)
+            box = _ass_color("#000000", alpha=0x80)  # 50% black box, like the drawn background
+            styles.append(
+                f"Style: {position}{size},Sans,{font_px},&H00FFFFFF,&H000000FF,{box},{box},"
+                f"0,0,0,0,100,100,0,0,3,{round(0.15 * px_per_unit)},0,{ALIGNMENT[position]},"
+                f"40,40,{margin_v},1"
+            )
+
+    lines = [ASS_HEADER.format(width=width, height=height, styles="\n".join(styles)).rstrip("\n")]
+    for cue in track["cues"]:
+        margin = 0
+        if cue.get("max_width"):
+            margin = max(0, round((track["frame_width"] - cue["max_width"]) / 2 * px_per_unit))
+        color = "" if cue["color"].upper().startswith("#FFFFFF") else f"\\c{_ass_color(cue['color'])}"
+        lines.append(
+            f"Dialogue: 0,{_ass_time(cue['start'])},{_ass_time(cue['end'])},"
+            f"{cue['position']}{cue['font_size']},,{margin},{margin},0,,"
+            f"{{\\fad({fade_ms},{fade_ms}){color}}}{_ass_text(cue['text'])}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _srt_time(seconds):
+    ms = int(round(seconds * 1000))
+    h, ms = divmod(ms, 3600000)
+    m, ms = divmod(ms, 60000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+def to_srt(track):
+    blocks = []
+    for i, cue in enumerate(track["cues"], start=1):
+        text = re.sub(r"</?(?!i>|b>|/i>|/b>)[^>]+>", "", cue["text"])
+        blocks.append(f"{i}\n{_srt_time(cue['start'])} --> {_srt_time(cue['end'])}\n{text}\n")
+    return "\n".join(blocks)
@@ -0,0 +1,114 @@
+"""
+In-process scene rendering with manim kept imported.
+
+A WarmRenderer pays for the manim/Cairo/Pango/NumPy imports and the runner hooks
+once, then renders scenes by calling Scene.render() in the same interpreter.
+Each video has its own `core` package, so switching videos (or editing a core/
+module) drops every `core` module from sys.modules before the next import;
+scene modules are re-executed only when their file changed. Module-level state
+in core/ (the subtitle cache, prototype figures) stays warm in between.
+"""
+
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from .cache import SIDECARS
+from .frame_timing import QUALITY_NAMES
+from .orchestrator import RenderResult, media_dir_for, output_path_for
+from .runner import install_hooks
+
+
+def purge_core():
+    """Forget every imported `core` module so the next import reads the current video's."""
+    for name in [n for n in sys.modules if n == "core" or n.startswith("core.")]:
+        del sys.modules[name]
+
+
+def core_snapshot(video_dir):
+    """{path: mtime} of a video's core/ modules."""
+    return {str(p): p.stat().st_mtime_ns for p in sorted((Path(video_dir) / "core").glob("*.py"))}
+
+
+class WarmRenderer:
+    """
+    Renders SceneSpecs one after another in this process.
+
+    Args:
+        hooks: Install the render.runner hooks (segment cache, hold elision...) first
+    """
+    def __init__(self, hooks=True):
+        if hooks:
+            install_hooks()
+        import manim  # noqa: F401  (the import is the warm-up)
+        self.video_dir = None
+        self.core = {}
+        self.modules = {}   # module path -> (mtime, module)
+        self.renders = 0
+
+    def use_video(self, video_dir):
+        """Make `video_dir` the current video; purges core/ when the video or its sources changed."""
+        video_dir = Path(video_dir).resolve()
+        snapshot = core_snapshot(video_dir)
+        if video_dir == self.video_dir and snapshot == self.core:
+            return False
+        purge_core()
+        self.modules.clear()
+        if self.video_dir is not None and str(self.video_dir) in sys.path:
+            sys.path.remove(str(self.video_dir))
+        sys.path.insert(0, str(video_dir))
+        os.chdir(video_dir)
+        self.video_dir = video_dir
+        self.core = snapshot
+        return True
+
+    def load_module(self, module_path):
+        """The scene module at `module_path`, re-executed only if the file changed."""
+        import importlib.util
+
+        module_path = Path(module_path).resolve()
+        mtime = module_path.stat().st_mtime_ns
+        cached = self.modules.get(module_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self.modules[module_path] = (mtime, module)
+        return module
+
+    def render(self, spec, quality="h"):
+        """
+        Render one scene into the video's media/ folder, like render.orchestrator.
+
+        Returns:
+            RenderResult; a failure carries the traceback as its log
+        """
+        from manim import tempconfig
+        from manim.constants import QUALITIES
+
+        for suffix in SIDECARS:
+            output_path_for(spec, quality).with_suffix(suffix).unlink(missing_ok=True)
+        start = time.perf_counter()
+        try:
+            self.use_video(spec.video_dir)
+            scene_class = getattr(self.load_module(spec.module_path), spec.class_name)
+            preset = QUALITIES[QUALITY_NAMES[quality]]
+            settings = {
+                "pixel_width": preset["pixel_width"],
+                "pixel_height": preset["pixel_height"],
+                "frame_rate": preset["frame_rate"],
+                "media_dir": str(media_dir_for(spec)),
+                "input_file": str(spec.module_path),
+            }
+            with tempconfig(settings):
+                scene = scene_class()
+                scene.render()
+            output = Path(scene.renderer.file_writer.movie_file_path)
+        except Exception:
+            return RenderResult(spec, 1, None, time.perf_counter() - start, traceback.format_exc())
+        finally:
+            self.renders += 1
+        return RenderResult(spec, 0, output if output.exists() else None, time.perf_counter() - start)
@@ -0,0 +1,132 @@
+"""
+Watch mode: re-render only the scenes an edit affects.
+
+    python -m render.watch video_5                # preview quality, CPU-count jobs
+    python -m render.watch video_4 video_5 -j 2
+    python -m render.watch video_5 --graph        # print the import graph and exit
+
+Each scene depends on its own module plus every core/ module it imports,
+followed transitively (cache.core_dependencies). The video folders are polled;
+when files change, the scenes depending on them are re-rendered in parallel
+through render.orchestrator (render cache and runner hooks included), and every
+other scene is left alone.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .__main__ import print_result, resolve_video_dir
+from .cache import RenderCache, core_dependencies
+from .orchestrator import QUALITY_DIRS, render_all
+from .scenes import SERIES_ROOT, discover_video
+
+
+def dependency_graph(video_dirs):
+    """
+    {file: [SceneSpec, ...]} for every scene module and core/ file of the videos.
+
+    A file maps to the scenes that have to be re-rendered when it changes.
+    """
+    graph = {}
+    for video_dir in video_dirs:
+        for spec in discover_video(video_dir):
+            for path in [spec.module_path, *core_dependencies(spec.module_path)]:
+                graph.setdefault(Path(path).resolve(), []).append(spec)
+    return graph
+
+
+def snapshot(video_dirs):
+    """{path: mtime} of the Python files a re-render can depend on."""
+    files = {}
+    for video_dir in video_dirs:
+        for path in [*Path(video_dir).glob("*.py"), *Path(video_dir).glob("core/*.py")]:
+            try:
+                files[path.resolve()] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass  # deleted between glob and stat
+    return files
+
+
+def changed_files(before, after):
+    """Paths added, removed or modified between two snapshots."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def affected_scenes(graph, changed):
+    """Scenes depending on any changed file, in discovery order, without duplicates."""
+    seen = {}
+    for path in changed:
+        for spec in graph.get(path, []):
+            seen.setdefault(spec.label, spec)
+    order = {spec.label: i for i, spec in enumerate(s for specs in graph.values() for s in specs)}
+    return sorted(seen.values(), key=lambda spec: order[spec.label])
+
+
+def print_graph(graph):
+    for path in sorted(graph):
+        names = ", ".join(sorted({spec.class_name for spec in graph[path]}))
+        print(f"  {path.relative_to(SERIES_ROOT)} -> {names}")
+
+
+def watch(video_dirs, quality="l", jobs=None, interval=0.5, cache=None, env=None):
+    """
+    Poll `video_dirs` forever, re-rendering the scenes affected by each change.
+
+    A change is acted on once the files have stopped changing for one interval,
+    so an editor's save (or a git checkout) triggers one render round.
+    """
+    state = snapshot(video_dirs)
+    print(f"👀 Watching {', '.join(Path(d).name for d in video_dirs)} (Ctrl+C to stop)")
+    while True:
+        time.sleep(interval)
+        current = snapshot(video_dirs)
+        if current == state:
+            continue
+        # Let a burst of writes settle
+        while True:
+            time.sleep(interval)
+            settled = snapshot(video_dirs)
+            if settled == current:
+                break
+            current = settled
+
+        changed = changed_files(state, current)
+        state = current
+        # Rebuilt every round: edits can add scenes or change what a module imports
+        specs = affected_scenes(dependency_graph(video_dirs), changed)
+        names = ", ".join(sorted(p.name for p in changed))
+        if not specs:
+            print(f"  {names} changed; no scene depends on it")
+            continue
+        print(f"🔁 {names} changed -> re-rendering {len(specs)} scene(s) at -q{quality}")
+        results = render_all(specs, quality=quality, jobs=jobs, on_result=print_result, cache=cache, env=env)
+        failed = sum(1 for r in results if not r.ok)
+        print(f"  Done: {len(results) - failed} ok, {failed} failed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.watch", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("videos", nargs="+", help="Video directories to watch (e.g. video_5)")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_DIRS), help="manim quality flag (default: l)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Parallel renders (default: CPU count)")
+    parser.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds (default: 0.5)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-render affected scenes even when their render cache key is unchanged")
+    parser.add_argument("--graph", action="store_true", help="Print which scenes each file affects and exit")
+    args = parser.parse_args(argv)
+
+    video_dirs = [resolve_video_dir(name) for name in args.videos]
+    if args.graph:
+        print_graph(dependency_graph(video_dirs))
+        return 0
+    cache = None if args.no_cache else RenderCache()
+    try:
+        watch(video_dirs, args.quality, args.jobs, args.interval, cache)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
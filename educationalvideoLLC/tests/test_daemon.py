@@ -0,0 +1,96 @@
+"""The daemon only serves clients holding its key, and survives bad ones."""
+
+import stat
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+from render.daemon import key_path, request, serve, write_key
+from render.orchestrator import RenderResult
+
+
+def test_key_is_owner_only(tmp_path):
+    address = tmp_path / "daemon.sock"
+    key = write_key(address)
+    assert len(key) == 32
+    assert stat.S_IMODE(key_path(address).stat().st_mode) == 0o600
+    assert write_key(address) != key
+
+
+def serve_once(address, key):
+    """Listener answering one authenticated request, or None if the handshake fails."""
+    listener = Listener(str(address), family="AF_UNIX", authkey=key)
+
+    def run():
+        try:
+            with listener.accept() as conn:
+                conn.send({"ok": True, "echo": conn.recv()})
+        except Exception:
+            pass
+        finally:
+            listener.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_client_with_key_is_served(tmp_path):
+    address = tmp_path / "daemon.sock"
+    thread = serve_once(address, write_key(address))
+    assert request(address, {"op": "status"}) == {"ok": True, "echo": {"op": "status"}}
+    thread.join(5)
+
+
+def test_client_with_wrong_key_is_refused(tmp_path):
+    address = tmp_path / "daemon.sock"
+    thread = serve_once(address, write_key(address))
+    key_path(address).write_bytes(b"x" * 32)
+    with pytest.raises(SystemExit, match="rejected the key"):
+        request(address, {"op": "status"})
+    thread.join(5)
+
+
+class FakeRenderer:
+    """Stands in for WarmRenderer: every render succeeds instantly."""
+    def __init__(self):
+        self.video_dir = None
+        self.renders = 0
+
+    def render(self, spec, quality):
+        self.renders += 1
+        return RenderResult(spec, 0, None, 0.0)
+
+
+def start_daemon(address):
+    thread = threading.Thread(target=serve, args=(address, FakeRenderer()), daemon=True)
+    thread.start()
+    for _ in range(200):
+        if address.exists() and key_path(address).exists():
+            return thread
+        time.sleep(0.01)
+    raise AssertionError("daemon did not start")
+
+
+def test_bad_clients_do_not_kill_the_daemon(tmp_path):
+    address = tmp_path / "daemon.sock"
+    thread = start_daemon(address)
+
+    # Authenticates, then hangs up without sending anything
+    Client(str(address), family="AF_UNIX", authkey=key_path(address).read_bytes()).close()
+    for payload in ["status", {"scenes": []}, {"op": "render"}, {"op": "render", "scenes": "Intro"}]:
+        with pytest.raises(SystemExit, match="refused the request"):
+            request(address, payload)
+
+    assert request(address, {"op": "status"})["renders"] == 0
+    reply = request(address, {
+        "op": "render", "video_dir": str(tmp_path), "module": str(tmp_path / "01_intro.py"),
+        "scenes": ["Intro"], "quality": "l",
+    })
+    assert reply["ok"] and reply["results"][0]["label"].endswith("01_intro.py::Intro")
+    assert request(address, {"op": "stop"}) == {"ok": True}
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not address.exists() and not key_path(address).exists()
@@ -0,0 +1,36 @@
+"""The replicator run behind video_5/06_ecology.py tells the story its narration does."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "video_5"))
+
+from core.memory_one import MemoryOne, payoff_grid  # noqa: E402
+from core.replicator import replicator_trajectory  # noqa: E402
+
+# Strategies, initial populations, GENERATIONS and ERROR_RATE of StrategyEcology
+NAMES = ["Tit for Tat", "Generous TFT", "Always Cooperate", "Always Defect", "Random"]
+INITIAL = [20, 15, 35, 15, 15]
+GENERATIONS = 30
+ERROR_RATE = 0.02
+
+
+def trajectory():
+    payoffs = payoff_grid(MemoryOne.named(*NAMES), error=ERROR_RATE)
+    return replicator_trajectory(payoffs, INITIAL, GENERATIONS)
+
+
+def test_always_defect_thrives_then_starves():
+    defect = trajectory()[:, NAMES.index("Always Defect")]
+    peak = int(np.argmax(defect))
+    assert 0 < peak < GENERATIONS
+    assert defect[peak] > 2 * defect[0]
+    assert defect[-1] < 0.05
+
+
+def test_reciprocators_take_over():
+    final = trajectory()[-1]
+    assert final[:2].sum() > 0.8
+    assert set(np.argsort(final)[-2:]) == {0, 1}
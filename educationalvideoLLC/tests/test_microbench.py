@@ -0,0 +1,40 @@
+"""The microbenchmark bookkeeping that runs without manim: labels, timing loop, drift and baseline checks."""
+
+from render.microbench import MIN_ROUNDS, case_id, compare, drift, measure
+
+
+def row(case, median, source="abc"):
+    return {"case": case, "module": "narration", "source": source, "min": median, "median": median, "rounds": 3}
+
+
+def test_case_ids_are_stable():
+    params = {"text": "short", "font_size": 26, "max_width": None}
+    assert case_id("subtitle", params, "build") == "subtitle.build[text=short,font_size=26,max_width=None]"
+    assert case_id("logo", {}, "play") == "logo.play"
+
+
+def test_measure_runs_at_least_min_rounds():
+    calls = []
+    timing = measure(lambda: calls.append(1), min_time=0)
+    assert timing["rounds"] == len(calls) == MIN_ROUNDS
+    assert 0 <= timing["min"] <= timing["median"]
+
+
+def test_drift_flags_identical_copies_with_diverging_timings():
+    results = {
+        "video_3": [row("subtitle.build", 0.010), row("logo.build", 0.010)],
+        "video_4": [row("subtitle.build", 0.020), row("logo.build", 0.011)],
+    }
+    [(case, video, ratio)] = drift(results)
+    assert (case, video) == ("subtitle.build", "video_4") and ratio == 2.0
+
+
+def test_drift_ignores_copies_that_differ():
+    results = {"video_3": [row("subtitle.build", 0.010, "old")], "video_4": [row("subtitle.build", 0.030, "new")]}
+    assert drift(results) == []
+
+
+def test_compare_reports_slowdowns_over_the_threshold():
+    baseline = {"video_5": [row("subtitle.build", 0.010), row("logo.build", 0.010)]}
+    results = {"video_5": [row("subtitle.build", 0.013), row("logo.build", 0.011)]}
+    assert compare(results, baseline, 0.2) == [("video_5", "subtitle.build", 0.010, 0.013)]
@@ -0,0 +1,99 @@
+"""Profiled frame counts match the frames a render actually outputs."""
+
+from render.profiler import Profile, instrument
+
+FRAME_RATE = 15
+
+
+class Wait:
+    def __init__(self, run_time, elided=False, batched=True):
+        self.run_time = run_time
+        self.elided = elided
+        self.batched = batched
+
+
+class Animation:
+    def __init__(self, run_time):
+        self.run_time = run_time
+        self.mobject = None
+
+
+def classes():
+    """Scene, camera and writer classes calling each other the way manim's Cairo renderer does."""
+    class Camera:
+        def capture_mobjects(self, mobjects):
+            pass
+
+    class SceneFileWriter:
+        def __init__(self):
+            self.written = 0
+
+        def write_frame(self, frame, num_frames=1):
+            self.written += num_frames
+
+    class Renderer:
+        def __init__(self):
+            self.camera = Camera()
+            self.file_writer = SceneFileWriter()
+            self.padded_frames = 0
+
+        def play(self, scene, animation):
+            frames = int(animation.run_time * FRAME_RATE)
+            if isinstance(animation, Wait) and animation.elided:
+                # render.holds: one frame written, ffmpeg pads the rest
+                self.file_writer.write_frame("frame", num_frames=1)
+                self.padded_frames += frames - 1
+            elif isinstance(animation, Wait) and animation.batched:
+                # Newer manim: freeze_current_frame writes the whole hold in one call
+                self.file_writer.write_frame("frame", num_frames=frames)
+            else:
+                for i in range(frames):
+                    scene.update_to_time(i / FRAME_RATE)
+                    self.camera.capture_mobjects(scene.mobjects)
+                    self.file_writer.write_frame("frame")
+
+    class Scene:
+        def __init__(self, animations):
+            self.renderer = Renderer()
+            self.mobjects = []
+            self.animations = animations
+
+        def update_to_time(self, t):
+            pass
+
+        def play(self, animation):
+            self.renderer.play(self, animation)
+
+        def render(self):
+            for animation in self.animations:
+                self.play(animation)
+
+    return Scene, Camera, SceneFileWriter
+
+
+def profile_scene(animations, tmp_path):
+    Scene, Camera, SceneFileWriter = classes()
+    profile = Profile()
+    instrument(profile, tmp_path, Scene, Camera, SceneFileWriter)
+    scene = Scene(animations)
+    scene.render()
+    return profile, scene
+
+
+def test_frames_match_frames_written_and_padded(tmp_path):
+    profile, scene = profile_scene(
+        [Animation(1.0), Wait(3.5, elided=True), Wait(2.0), Wait(1.0, batched=False)], tmp_path
+    )
+    assert [p.frames for p in profile.plays] == [15, 52, 30, 15]
+    output = scene.renderer.file_writer.written + scene.renderer.padded_frames
+    assert sum(p.frames for p in profile.plays) == output == 112
+    assert "112 frames output" in (tmp_path / "Scene.profile.txt").read_text()
+
+
+def test_each_render_starts_a_fresh_profile(tmp_path):
+    Scene, Camera, SceneFileWriter = classes()
+    profile = Profile()
+    instrument(profile, tmp_path, Scene, Camera, SceneFileWriter)
+    Scene([Animation(1.0), Wait(2.0)]).render()
+    Scene([Wait(1.0)]).render()
+    assert [p.frames for p in profile.plays] == [15]
@@ -0,0 +1,62 @@
+"""Segment digests must change when an updater's captured data changes."""
+
+import numpy as np
+
+from render.segments import _Digest
+
+
+def digest_of(fn):
+    d = _Digest()
+    d.callable(fn)
+    return d.hexdigest()
+
+
+def make_follower(trajectory):
+    def follow(mob, alpha):
+        return trajectory[int(alpha * (len(trajectory) - 1))]
+    return follow
+
+
+def make_scaler(factor=1.0):
+    return lambda mob, alpha, factor=factor: alpha * factor
+
+
+def test_closures_over_different_data_differ():
+    assert digest_of(make_follower([0.1, 0.2, 0.3])) != digest_of(make_follower([0.1, 0.2, 0.4]))
+    assert digest_of(make_follower(np.zeros(5))) != digest_of(make_follower(np.ones(5)))
+
+
+def test_closures_over_equal_data_match():
+    assert digest_of(make_follower([1, 2, 3])) == digest_of(make_follower([1, 2, 3]))
+
+
+def test_defaults_are_hashed():
+    assert digest_of(make_scaler(1.0)) != digest_of(make_scaler(2.0))
+
+
+RATE = 0.01
+
+
+def reads_global(mob, alpha):
+    return alpha * RATE
+
+
+def test_globals_are_hashed():
+    global RATE
+    before = digest_of(reads_global)
+    RATE = 0.02
+    try:
+        assert digest_of(reads_global) != before
+    finally:
+        RATE = 0.01
+
+
+def test_nested_code_is_hashed():
+    def outer_a():
+        return lambda: 1
+
+    def outer_b():
+        return lambda: 2
+
+    outer_b.__qualname__ = outer_a.__qualname__
+    assert digest_of(outer_a) != digest_of(outer_b)
@@ -0,0 +1,86 @@
+"""Round-robin engine of video_5/core/tournament.py against hand-computed matches."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "video_5"))
+
+from core.tournament import StrategyTable, round_robin  # noqa: E402
+
+ROUNDS = 200
+
+# Deterministic entries only, so every score has a closed form
+FIELD = ["Tit for Tat", "Tit for Two Tats", "Suspicious TFT", "Always Defect", "Always Cooperate", "Graaskamp"]
+
+
+def play(names, repetitions=1, seed=0):
+    return round_robin(StrategyTable.from_names(names), rounds=ROUNDS, repetitions=repetitions, seed=seed)
+
+
+def score(result, a, b):
+    return result.mean_scores[result.names.index(a), result.names.index(b)]
+
+
+def test_every_match_plays_every_round():
+    result = play(FIELD, repetitions=3)
+    n = len(FIELD)
+    assert result.moves.shape == (3, n * (n + 1) // 2, ROUNDS, 2)
+    for a in FIELD:
+        for b in FIELD:
+            moves_a, moves_b = result.history(a, b, repetition=2)
+            assert len(moves_a) == len(moves_b) == ROUNDS
+
+
+def test_scores_do_not_depend_on_seating():
+    forward, backward = play(FIELD), play(FIELD[::-1])
+    for a in FIELD:
+        for b in FIELD:
+            assert score(forward, a, b) == pytest.approx(score(backward, a, b))
+            moves_a, moves_b = forward.history(a, b)
+            swapped_b, swapped_a = forward.history(b, a)
+            assert np.array_equal(moves_a, swapped_a) and np.array_equal(moves_b, swapped_b)
+
+
+def test_scores_match_the_payoffs_of_the_moves():
+    result = play(FIELD)
+    t, r, p, s = 5.0, 3.0, 1.0, 0.0
+    payoff = np.array([[p, t], [s, r]])
+    for a in FIELD:
+        for b in FIELD:
+            if a == b:
+                continue
+            moves_a, moves_b = result.history(a, b)
+            assert score(result, a, b) == pytest.approx(payoff[moves_a.astype(int), moves_b.astype(int)].mean())
+
+
+def test_tft_family_against_always_defect():
+    result = play(FIELD)
+    # Suckered once, twice, never
+    assert score(result, "Tit for Tat", "Always Defect") == pytest.approx((ROUNDS - 1) / ROUNDS)
+    assert score(result, "Tit for Two Tats", "Always Defect") == pytest.approx((ROUNDS - 2) / ROUNDS)
+    assert score(result, "Suspicious TFT", "Always Defect") == pytest.approx(1.0)
+
+
+def test_tft_family_against_tit_for_tat():
+    result = play(FIELD)
+    assert score(result, "Tit for Tat", "Tit for Tat") == pytest.approx(3.0)
+    assert score(result, "Tit for Two Tats", "Tit for Tat") == pytest.approx(3.0)
+    # Suspicious TFT opens with D and the pair alternates DC / CD forever
+    assert score(result, "Suspicious TFT", "Tit for Tat") == pytest.approx(2.5)
+    ranking = [name for name, _ in result.ranking()]
+    assert ranking.index("Tit for Tat") < ranking.index("Suspicious TFT")
+
+
+def test_graaskamp_probes_once():
+    moves, _ = play(FIELD).history("Graaskamp", "Always Cooperate")
+    assert np.flatnonzero(~moves).tolist() == [49]
+
+
+def test_same_seed_same_tournament():
+    field = ["Tit for Tat", "Joss", "Random", "Name Withheld"]
+    first, second = play(field, repetitions=4, seed=7), play(field, repetitions=4, seed=7)
+    assert np.array_equal(first.moves, second.moves)
+    assert not np.array_equal(first.moves, play(field, repetitions=4, seed=8).moves)
@@ -1,20 +1,11 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_WARNING, ACCENT_COLOR_PRIMARY
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_WARNING, ACCENT_COLOR_PRIMARY
 import numpy as np
 
-class Hook(Scene):
+class Hook(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # --- Scene 1: Multiple procrastination examples ---
         narrator.narrate("Why do we do THIS...", duration=2)
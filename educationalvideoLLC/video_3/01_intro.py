@@ -1,8 +1,8 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 
-class Intro(Scene):
+class Intro(VisualTheoremScene):
     # Constants for positioning
     RATIONAL_INITIAL_POS = LEFT * 2.5
     IMPULSIVE_INITIAL_POS = RIGHT * 2.5
@@ -44,16 +44,7 @@ class Intro(Scene):
             self.update_rope(rope, rational, impulsive)
     
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # --- Title visual without showing text ---
         # Start with visual metaphor, not text
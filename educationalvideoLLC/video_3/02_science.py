@@ -1,20 +1,11 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 import numpy as np
 
-class Science(Scene):
+class Science(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # No title text - go straight to visual
         narrator.narrate("Here's what's really happening: dopamine.", duration=2.5)
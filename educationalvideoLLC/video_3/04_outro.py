@@ -1,19 +1,10 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY
 
-class Outro(Scene):
+class Outro(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # --- Final takeaway ---
         takeaway = Text(
@@ -101,7 +92,7 @@ class Outro(Scene):
         # --- Fade out ---
         self.play(
             FadeOut(VGroup(brand, subscribe, glow), scale=1.1),
-            FadeOut(bg),
+            self.fade_out_background(),
             run_time=2
         )
 
@@ -1,21 +1,12 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_WARNING, ACCENT_COLOR_PRIMARY
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_WARNING, ACCENT_COLOR_PRIMARY
 from core.logo import animate_logo_intro
 import numpy as np
 
-class Hook(Scene):
+class Hook(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # --- Logo Intro ---
         brand = animate_logo_intro(self)
@@ -1,19 +1,11 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.particles import Particles, grow_particles
 
-class Intro(Scene):
+class Intro(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # --- Background ---
-        bg = Rectangle(
-            width=config.frame_width,
-            height=config.frame_height,
-            fill_color=BACKGROUND_COLOR,
-            fill_opacity=1
-        ).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # --- Counterintuitive claim ---
         claim = Text(
@@ -70,37 +62,28 @@ class Intro(Scene):
         brain_outline.move_to(LEFT * 2.5)
         
         # Show it filling up with memories
-        memory_dots = VGroup(*[
-            Dot(radius=0.08, color=ACCENT_COLOR_PRIMARY)
-            for _ in range(30)
-        ])
-        memory_dots.arrange_in_grid(5, 6, buff=0.15)
+        memory_dots = Particles.grid(5, 6, spacing=0.31, radius=0.08, color=ACCENT_COLOR_PRIMARY).hide()
         memory_dots.move_to(brain_outline.get_center())
         
         self.play(
             FadeIn(brain_outline),
-            *[GrowFromCenter(dot) for dot in memory_dots[:15]],
+            grow_particles(memory_dots, indices=slice(0, 15)),
             run_time=2
         )
         
         narrator.narrate("Every day, thousands of new memories compete for space.", duration=2.5)
         self.play(
-            *[GrowFromCenter(dot) for dot in memory_dots[15:]],
+            grow_particles(memory_dots, indices=slice(15, None)),
             run_time=1.5
         )
         
         # Show overflow/chaos
-        overflow_dots = VGroup(*[
-            Dot(radius=0.08, color=ACCENT_COLOR_WARNING)
-            for _ in range(10)
-        ])
-        # Arrange in a scattered pattern
-        overflow_dots.arrange_in_grid(3, 4, buff=0.2)
+        overflow_dots = Particles.grid(3, 4, spacing=0.36, count=10, radius=0.08, color=ACCENT_COLOR_WARNING)
         overflow_dots.move_to(brain_outline.get_center() + UP * 0.5)
         
         narrator.narrate("If nothing was forgotten, your brain would overflow.", duration=2.5)
         self.play(
-            *[GrowFromCenter(dot) for dot in overflow_dots],
+            grow_particles(overflow_dots),
             brain_outline.animate.set_color(RED),
             run_time=1.5
         )
@@ -112,11 +95,7 @@ class Intro(Scene):
         clean_brain = Ellipse(width=3, height=4, color=ACCENT_COLOR_SUCCESS, stroke_width=3)
         clean_brain.move_to(RIGHT * 2.5)
         
-        important_memories = VGroup(*[
-            Dot(radius=0.1, color=ACCENT_COLOR_PRIMARY)
-            for _ in range(12)
-        ])
-        important_memories.arrange_in_grid(3, 4, buff=0.2)
+        important_memories = Particles.grid(3, 4, spacing=0.4, radius=0.1, color=ACCENT_COLOR_PRIMARY)
         important_memories.move_to(clean_brain.get_center())
         
         arrow = Arrow(brain_outline.get_right(), clean_brain.get_left(), color=WHITE)
@@ -127,14 +106,14 @@ class Intro(Scene):
         )
         
         self.play(
-            FadeOut(VGroup(memory_dots, overflow_dots)),
+            FadeOut(Group(memory_dots, overflow_dots)),
             brain_outline.animate.set_color(GRAY_D),
             run_time=1
         )
         
         self.play(
             FadeIn(clean_brain),
-            *[GrowFromCenter(dot) for dot in important_memories],
+            grow_particles(important_memories),
             run_time=1.5
         )
         
@@ -157,7 +136,7 @@ class Intro(Scene):
         # --- Transition ---
         narrator.narrate("But why do we forget certain things and not others?", duration=2.5)
         self.play(
-            FadeOut(VGroup(
+            FadeOut(Group(
                 title, brain_outline, clean_brain, important_memories,
                 arrow, chaos_label, order_label
             )),
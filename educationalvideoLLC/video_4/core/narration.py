@@ -1,26 +1,229 @@
 from manim import *
+from manim import __version__ as MANIM_VERSION
+import atexit
+import hashlib
+import json
+import os
+import re
+import pickle
+import time
+from pathlib import Path
+
+from .scheduler import OverlayScheduler
+
+# Subtitle cache shared by every video's core/narration.py (series root/.render_cache)
+SUBTITLE_CACHE_DIR = Path(
+    os.environ.get("VISUALTHEOREM_CACHE", Path(__file__).resolve().parents[2] / ".render_cache")
+) / "subtitles"
+
+# Style changes in this file must invalidate cached subtitles
+_SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _private(stat):
+    """Whether a cache file is safe to unpickle: owned by this user, writable by nobody else."""
+    if not hasattr(os, "getuid"):
+        return True  # no POSIX owners (Windows)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+# Where each position mode places a subtitle
+SUBTITLE_POSITIONS = {
+    "bottom": lambda m: m.to_edge(DOWN).shift(UP * 0.3),
+    "top": lambda m: m.to_edge(UP).shift(DOWN * 0.5),
+}
+
+
+class SubtitleCache:
+    """
+    Memoizes subtitle groups (MarkupText + background box).
+    Each distinct subtitle is laid out once, then handed out as a copy.
+    Built groups are pickled to disk so later renders skip Pango layout entirely.
+    Unpickling runs code, so the cache folders are created owner-only and a pickle
+    that another user owns or could have written is never loaded.
+    """
+    def __init__(self, cache_dir=SUBTITLE_CACHE_DIR):
+        # One folder per manim version and narration source, so a pickle is only ever
+        # loaded by the code that wrote it
+        self.cache_dir = Path(cache_dir) / f"manim-{MANIM_VERSION}-{_SOURCE_DIGEST[:16]}"
+        self.groups = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.build_time = 0.0
+        self.load_time = 0.0
+
+    def key(self, text, font_size, color, max_width, position):
+        parts = (
+            text, font_size, str(color), max_width, position,
+            config.frame_width, config.frame_height, MANIM_VERSION, _SOURCE_DIGEST,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _load(self, key):
+        path = self.cache_dir / f"{key}.pkl"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                if not _private(os.fstat(f.fileno())):
+                    logger.warning(f"Subtitle cache: not loading {path}, it is not private to this user")
+                    return None
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Subtitle cache: ignoring unreadable {path.name}: {e!r}")
+            return None
+
+    def _save(self, key, group):
+        path = self.cache_dir / f"{key}.pkl"
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.cache_dir.mkdir(mode=0o700, exist_ok=True)
+            fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(group, f)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError) as e:
+            # Disk cache is best effort; the in-memory copy still works
+            logger.warning(f"Subtitle cache: could not write {path.name}: {e!r}")
+            tmp.unlink(missing_ok=True)
+
+    def get(self, key, build):
+        """Return a fresh copy of the cached group for `key`, building it on a miss."""
+        group = self.groups.get(key)
+        if group is None:
+            start = time.perf_counter()
+            group = self._load(key)
+            if group is not None:
+                self.disk_hits += 1
+                self.load_time += time.perf_counter() - start
+        if group is None:
+            self.misses += 1
+            logger.debug(f"Subtitle cache miss: {key[:12]}")
+            start = time.perf_counter()
+            group = build()
+            self.build_time += time.perf_counter() - start
+            self._save(key, group)
+        else:
+            self.hits += 1
+        self.groups[key] = group
+        return group.copy()
+
+    def report(self):
+        if not self.hits and not self.misses:
+            return
+        # Construction time with the cache vs what building every request would have cost
+        per_build = self.build_time / self.misses if self.misses else 0.0
+        spent = self.build_time + self.load_time
+        logger.info(
+            f"Subtitle cache: {self.hits} hits ({self.disk_hits} from disk, {self.load_time:.2f}s), "
+            f"{self.misses} builds ({self.build_time:.2f}s); construction {spent:.2f}s "
+            f"vs ~{(self.hits + self.misses) * per_build:.2f}s uncached"
+        )
+
+
+SUBTITLE_CACHE = SubtitleCache()
+atexit.register(SUBTITLE_CACHE.report)
+
+# "inline" draws subtitles into the scene; "track" only records timed cues
+SUBTITLE_MODE = os.environ.get("VISUALTHEOREM_SUBTITLES", "inline")
+
+# Fade in/out time around every subtitle (seconds)
+SUBTITLE_FADE = 0.5
+
+
+def _srt_time(seconds):
+    ms = int(round(seconds * 1000))
+    h, ms = divmod(ms, 3600000)
+    m, ms = divmod(ms, 60000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+class SubtitleTrack:
+    """
+    Timed narration cues for one scene, written next to the scene's video.
+    Produces <Scene>.srt for players and <Scene>.cues.json (with styling) for
+    render.assemble, which turns it into ASS or a transparent overlay for ffmpeg.
+    """
+    def __init__(self, scene):
+        self.scene = scene
+        self.cues = []
+
+    def base_path(self):
+        file_writer = self.scene.renderer.file_writer
+        movie_path = getattr(file_writer, "movie_file_path", None)
+        if movie_path:
+            return Path(movie_path).with_suffix("")
+        return Path(config.media_dir) / "subtitles" / type(self.scene).__name__
+
+    def add(self, start, end, text, position, font_size, color, max_width=None):
+        self.cues.append({
+            "start": round(start, 3),
+            "end": round(end, 3),
+            "text": text,
+            "position": position,
+            "font_size": font_size,
+            "color": str(color),
+            "max_width": max_width,
+        })
+        self.write()
+
+    def to_srt(self):
+        blocks = []
+        for i, cue in enumerate(self.cues, start=1):
+            # SRT understands <i>/<b>; drop any other Pango markup
+            text = re.sub(r"</?(?!i>|b>|/i>|/b>)[^>]+>", "", cue["text"])
+            blocks.append(f"{i}\n{_srt_time(cue['start'])} --> {_srt_time(cue['end'])}\n{text}\n")
+        return "\n".join(blocks)
+
+    def write(self):
+        base = self.base_path()
+        base.parent.mkdir(parents=True, exist_ok=True)
+        base.with_suffix(".srt").write_text(self.to_srt())
+        meta = {
+            "scene": type(self.scene).__name__,
+            "fade": SUBTITLE_FADE,
+            "frame_width": config.frame_width,
+            "frame_height": config.frame_height,
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "cues": self.cues,
+        }
+        base.with_suffix(".cues.json").write_text(json.dumps(meta, indent=2))
+
 
 class NarrationManager:
     """
     Unified narration system for VisualTheorem videos.
     Provides consistent subtitle styling across all scenes.
     """
-    def __init__(self, scene, font_size=26, color=WHITE):
+    def __init__(self, scene, font_size=26, color=WHITE, cache=SUBTITLE_CACHE, mode=None):
         self.scene = scene
         self.font_size = font_size
         self.color = color
+        self.cache = cache
+        self.mode = mode or SUBTITLE_MODE
+        self.track = SubtitleTrack(scene) if self.mode == "track" else None
+        self._scheduler = None
+        self._track_lanes = {}
+
+    @property
+    def scheduler(self):
+        """Shared OverlayScheduler for non-blocking subtitles and side notes."""
+        if self._scheduler is None:
+            self._scheduler = OverlayScheduler(self.scene)
+        return self._scheduler
+
+    def _build_subtitle(self, text, position, max_width=None):
+        # Optional constrained width to avoid overlapping visuals
+        if max_width is not None:
+            subtitle = MarkupText(text, font_size=self.font_size, color=self.color).set(width=max_width)
+        else:
+            subtitle = MarkupText(text, font_size=self.font_size, color=self.color)
+        SUBTITLE_POSITIONS[position](subtitle)
 
-    def narrate(self, text, duration=2.5):
-        """
-        Display narration text at the bottom with fade in/out.
-        
-        Args:
-            text: The narration text to display
-            duration: How long to display the text (seconds)
-        """
-        subtitle = MarkupText(text, font_size=self.font_size, color=self.color)
-        subtitle.to_edge(DOWN).shift(UP * 0.3)
-        
         bg_box = Rectangle(
             width=subtitle.width + 0.4,
             height=subtitle.height + 0.25,
@@ -28,9 +231,74 @@ class NarrationManager:
             fill_opacity=0.5,
             stroke_width=0
         ).move_to(subtitle)
-        
-        group = VGroup(bg_box, subtitle)
-        self.scene.play(FadeIn(group, shift=UP * 0.1, rate_func=smooth), run_time=0.5)
+
+        return VGroup(bg_box, subtitle)
+
+    def _subtitle_group(self, text, position, max_width=None):
+        if self.cache is None:
+            return self._build_subtitle(text, position, max_width)
+        key = self.cache.key(text, self.font_size, self.color, max_width, position)
+        return self.cache.get(key, lambda: self._build_subtitle(text, position, max_width))
+
+    def _render_subtitle(self, text, duration, position, max_width=None):
+        # Let queued subtitles finish first so blocking and queued ones never overlap
+        self.flush()
+        if self.track is not None:
+            # Same timing as the drawn subtitle, but the picture just holds (a static wait)
+            start = self.scene.renderer.time
+            total = duration + 2 * SUBTITLE_FADE
+            self.track.add(start, start + total, text, position, self.font_size, self.color, max_width)
+            self.scene.wait(total)
+            return
+
+        group = self._subtitle_group(text, position, max_width)
+        self.scene.play(FadeIn(group, shift=UP * 0.1, rate_func=smooth), run_time=SUBTITLE_FADE)
         self.scene.wait(duration)
-        self.scene.play(FadeOut(group, shift=DOWN * 0.1, rate_func=smooth), run_time=0.5)
+        self.scene.play(FadeOut(group, shift=DOWN * 0.1, rate_func=smooth), run_time=SUBTITLE_FADE)
+
+    def narrate(self, text, duration=2.5, max_width=None):
+        """
+        Display narration at bottom with fade in/out.
+        Optionally constrain width to avoid overlapping visuals.
+        """
+        self._render_subtitle(text, duration, "bottom", max_width=max_width)
+
+    def narrate_top(self, text, duration=2.5, max_width=None):
+        """Display narration at the top (safe area) to avoid lower-third collisions."""
+        self._render_subtitle(text, duration, "top", max_width=max_width)
+
+    def _queue_subtitle(self, text, duration, position, max_width=None):
+        if self.track is not None:
+            now = self.scene.renderer.time
+            start = max(now, self._track_lanes.get(position, now))
+            end = start + duration + 2 * SUBTITLE_FADE
+            self.track.add(start, end, text, position, self.font_size, self.color, max_width)
+            self._track_lanes[position] = end
+            return
+        group = self._subtitle_group(text, position, max_width)
+        self.scheduler.queue(
+            group, duration, lane=position, fade=SUBTITLE_FADE,
+            shift=UP * 0.1, exit_shift=DOWN * 0.1,
+        )
+
+    def narrate_async(self, text, duration=2.5, max_width=None):
+        """
+        Queue bottom narration without blocking: it plays alongside the next
+        self.play(...) calls. Call flush() before the scene ends.
+        """
+        self._queue_subtitle(text, duration, "bottom", max_width=max_width)
+
+    def narrate_top_async(self, text, duration=2.5, max_width=None):
+        """Queue top narration without blocking (see narrate_async)."""
+        self._queue_subtitle(text, duration, "top", max_width=max_width)
 
+    def flush(self):
+        """Wait until every queued subtitle (and side note) has been read."""
+        if self.track is not None:
+            if self._track_lanes:
+                remaining = max(self._track_lanes.values()) - self.scene.renderer.time
+                self._track_lanes = {}
+                if remaining > 0:
+                    self.scene.wait(remaining)
+        if self._scheduler is not None:
+            self._scheduler.flush()
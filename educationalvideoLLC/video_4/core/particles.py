@@ -0,0 +1,245 @@
+"""
+Array-backed particles: starfields, memory dots, drifting specks.
+
+A Particles mobject keeps positions, colors, radii and opacities in NumPy arrays
+and draws them as one point cloud (each particle a disc of pixels), so thousands
+of particles cost about as much per frame as a single mobject. Motion comes from
+vectorized updaters (drift, twinkle, attract) and batched grow/fade animations.
+
+Particles are drawn opaque, blended against `background`: keep them behind other
+mobjects, on the scene background.
+"""
+
+from manim import *
+
+from .config import BACKGROUND_COLOR
+
+
+def _disc_offsets(radius_px):
+    """Integer pixel offsets covering a disc (at least the centre pixel)."""
+    r = int(np.ceil(radius_px))
+    y, x = np.mgrid[-r:r + 1, -r:r + 1]
+    inside = x ** 2 + y ** 2 <= max(radius_px, 0.5) ** 2
+    return np.stack([x[inside], y[inside]], axis=-1)
+
+
+class Particles(PMobject):
+    """
+    A cloud of round particles.
+
+    Args:
+        positions: (n, 3) centres (or (n, 2))
+        color: One color, or a list of n colors
+        radius: One radius, or (n,) radii (scene units)
+        opacity: One opacity, or (n,) opacities
+        background: Color the particles are blended against
+
+    Attributes (all length n, edit them then call refresh()):
+        positions, colors (rgb), radii, opacity,
+        brightness: Multiplies opacity (twinkle writes it)
+        grow: Multiplies radii (grow_particles writes it)
+    """
+    def __init__(self, positions, color=WHITE, radius=0.05, opacity=1.0, background=BACKGROUND_COLOR, **kwargs):
+        positions = np.asarray(positions, dtype=float)
+        if positions.shape[-1] == 2:
+            positions = np.column_stack([positions, np.zeros(len(positions))])
+        n = len(positions)
+        self.positions = positions
+        colors = color if isinstance(color, (list, tuple)) else [color] * n
+        self.colors = np.array([ManimColor(c).to_rgb() for c in colors], dtype=float)
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=float), (n,)).copy()
+        self.opacity = np.broadcast_to(np.asarray(opacity, dtype=float), (n,)).copy()
+        self.brightness = np.ones(n)
+        self.grow = np.ones(n)
+        self.background = np.array(ManimColor(background).to_rgb(), dtype=float)
+        super().__init__(stroke_width=1, **kwargs)
+
+    @classmethod
+    def scatter(cls, count, x_range=(-7, 7), y_range=(-4, 4), seed=0, **kwargs):
+        """`count` particles uniformly placed in a box (seeded, so frames are reproducible)."""
+        rng = np.random.default_rng(seed)
+        positions = np.column_stack([rng.uniform(*x_range, count), rng.uniform(*y_range, count)])
+        return cls(positions, **kwargs)
+
+    @classmethod
+    def grid(cls, rows, cols, spacing=0.3, count=None, **kwargs):
+        """
+        Particles on a rows x cols grid centred on the origin, filled row by row from
+        the top left (like arrange_in_grid); `count` keeps only the first cells.
+        """
+        y, x = np.mgrid[0:rows, 0:cols]
+        positions = np.column_stack([
+            (x.ravel() - (cols - 1) / 2) * spacing,
+            ((rows - 1) / 2 - y.ravel()) * spacing,
+        ])
+        return cls(positions[:count], **kwargs)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def generate_points(self):
+        self.refresh()
+
+    def init_colors(self, propagate_colors=True):
+        # Colors live in self.colors; the Mobject default color must not overwrite them
+        return self
+
+    def refresh(self):
+        """Rebuild the drawn pixel discs from the particle arrays."""
+        units_per_pixel = config.frame_width / config.pixel_width
+        alpha = np.clip(self.opacity * self.brightness, 0, 1)
+        radius_px = np.round(self.radii * self.grow / units_per_pixel * 2) / 2
+        visible = (alpha > 0) & (self.grow > 0)
+
+        points, rgbas = [np.zeros((0, 3))], [np.zeros((0, 4))]
+        for r in np.unique(radius_px[visible]):
+            members = np.flatnonzero(visible & (radius_px == r))
+            offsets = _disc_offsets(r) * units_per_pixel
+            disc = np.zeros((len(offsets), 3))
+            disc[:, :2] = offsets
+            points.append((self.positions[members, None] + disc).reshape(-1, 3))
+            a = alpha[members, None]
+            rgb = self.background * (1 - a) + self.colors[members] * a
+            rgba = np.column_stack([rgb, np.ones(len(members))])
+            rgbas.append(np.repeat(rgba, len(offsets), axis=0))
+        self.points = np.concatenate(points)
+        self.rgbas = np.concatenate(rgbas)
+        return self
+
+    # Geometry follows the particle centres, so layout works even while particles are hidden
+
+    def get_points_defining_boundary(self):
+        extent = np.zeros((len(self), 3))
+        extent[:, :2] = self.radii[:, None]
+        return np.concatenate([self.positions - extent, self.positions + extent])
+
+    def shift(self, *vectors):
+        self.positions = self.positions + sum(vectors)
+        return self.refresh()
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+        self.positions = func(self.positions - about_point) + about_point
+        # Radii follow the transform's average stretch (scale grows them, rotate doesn't)
+        stretch = func(np.array([RIGHT, UP])) - func(np.zeros((2, 3)))
+        self.radii = self.radii * np.linalg.norm(stretch, axis=1).mean()
+        return self.refresh()
+
+    def hide(self, indices=None):
+        """Shrink particles (all, or `indices`) to nothing, ready for grow_particles."""
+        self.grow[indices if indices is not None else slice(None)] = 0
+        return self.refresh()
+
+    def set_color(self, color=WHITE, family=True):
+        self.colors[:] = ManimColor(color).to_rgb()
+        return self.refresh()
+
+    def fade(self, darkness=0.5, family=True):
+        self.opacity = self.opacity * (1 - darkness)
+        return self.refresh()
+
+    def set_opacity(self, opacity, family=True):
+        self.opacity[:] = opacity
+        return self.refresh()
+
+    # Animations interpolate the particle arrays; the drawn discs are rebuilt from them
+
+    def null_point_align(self, mobject):
+        return self
+
+    def align_points(self, mobject):
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        self.positions = path_func(mobject1.positions, mobject2.positions, alpha)
+        for name in ("colors", "radii", "opacity", "brightness", "grow"):
+            setattr(self, name, interpolate(getattr(mobject1, name), getattr(mobject2, name), alpha))
+        return self.refresh()
+
+
+def drift(velocity, bounds=None):
+    """
+    Updater: move every particle by its velocity, wrapping around `bounds`.
+
+    Args:
+        velocity: (3,) or (n, 3) units per second
+        bounds: ((x_min, x_max), (y_min, y_max)) to wrap within, or None
+    """
+    velocity = np.asarray(velocity, dtype=float)
+
+    def update(particles, dt):
+        positions = particles.positions + velocity * dt
+        if bounds is not None:
+            for axis, (low, high) in enumerate(bounds):
+                positions[:, axis] = low + (positions[:, axis] - low) % (high - low)
+        particles.positions = positions
+        particles.refresh()
+
+    return update
+
+
+def twinkle(period=2.0, depth=0.6, seed=0):
+    """Updater: brightness pulses between 1 - depth and 1, each particle at its own phase."""
+    phases = {}
+
+    def update(particles, dt):
+        if "phase" not in phases:
+            phases["phase"] = np.random.default_rng(seed).uniform(0, TAU, len(particles))
+            phases["time"] = 0.0
+        phases["time"] += dt
+        wave = 0.5 + 0.5 * np.sin(TAU * phases["time"] / period + phases["phase"])
+        particles.brightness = 1 - depth * wave
+        particles.refresh()
+
+    return update
+
+
+def attract(point, strength=1.5):
+    """Updater: particles close in on `point` (a fraction strength * dt of the way per frame)."""
+    def update(particles, dt):
+        target = point.get_center() if isinstance(point, Mobject) else np.asarray(point, dtype=float)
+        particles.positions = particles.positions + (target - particles.positions) * min(1.0, strength * dt)
+        particles.refresh()
+
+    return update
+
+
+def _staggered(alpha, count, lag_ratio):
+    """Per-particle progress for a batch effect that starts each particle `lag_ratio` later."""
+    if count == 0:
+        return np.zeros(0)
+    span = 1 + lag_ratio * (count - 1)
+    starts = lag_ratio * np.arange(count) / span
+    return np.clip((alpha - starts) * span, 0, 1)
+
+
+def grow_particles(particles, indices=None, lag_ratio=0.0, **kwargs):
+    """
+    Animation: particles (all, or `indices`) grow from nothing, like GrowFromCenter on each.
+
+    Each particle eases in on its own; extra kwargs (run_time...) go to the animation.
+    """
+    kwargs.setdefault("rate_func", linear)
+    members = np.arange(len(particles))[indices if indices is not None else slice(None)]
+    particles.hide(members)
+
+    def update(mob, alpha):
+        mob.grow[members] = smooth(_staggered(alpha, len(members), lag_ratio))
+        mob.refresh()
+
+    return UpdateFromAlphaFunc(particles, update, **kwargs)
+
+
+def fade_particles(particles, opacity=0.0, indices=None, lag_ratio=0.0, **kwargs):
+    """Animation: particles (all, or `indices`) fade from their opacity to `opacity`."""
+    kwargs.setdefault("rate_func", linear)
+    members = np.arange(len(particles))[indices if indices is not None else slice(None)]
+    start = particles.opacity[members].copy()
+
+    def update(mob, alpha):
+        t = smooth(_staggered(alpha, len(members), lag_ratio))
+        mob.opacity[members] = start + (opacity - start) * t
+        mob.refresh()
+
+    return UpdateFromAlphaFunc(particles, update, **kwargs)
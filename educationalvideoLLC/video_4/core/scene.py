@@ -0,0 +1,37 @@
+"""
+Base scene for VisualTheorem videos.
+Paints the series background through the camera and sets up the standard narrator.
+"""
+
+from manim import *
+from .config import BACKGROUND_COLOR
+from .narration import NarrationManager
+
+
+class VisualTheoremScene(Scene):
+    """
+    Scene with the series look built in.
+
+    The camera clears every frame to `background_color`, so scenes no longer add a
+    full-frame Rectangle that Cairo has to fill on every frame. `self.narrator` is a
+    NarrationManager using `subtitle_font_size`; subclasses can override either.
+    """
+    background_color = BACKGROUND_COLOR
+    subtitle_font_size = 26
+
+    def setup(self):
+        self.camera.background_color = ManimColor(self.background_color)
+        self.narrator = NarrationManager(self, font_size=self.subtitle_font_size)
+
+    def fade_out_background(self):
+        """
+        Animation fading the background to black (what FadeOut(bg) used to do).
+
+        Returns:
+            Animation to pass to self.play alongside the scene's own fade-outs
+        """
+        black = Rectangle(width=config.frame_width, height=config.frame_height)
+        black.set_stroke(width=0).set_fill(BLACK, opacity=0)
+        # Behind everything, so foreground fades look exactly as before
+        self.add_to_back(black)
+        return black.animate.set_fill(opacity=1)
@@ -1,15 +1,10 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 
-class PDBasics(Scene):
+class PDBasics(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # Payoff matrix labels
         coop = Text("Cooperate", font_size=26, color=ACCENT_COLOR_SUCCESS)
@@ -1,16 +1,17 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 from core.citations import AXELROD_1980, show_citation
+from core.tournament import StrategyTable, round_robin
+import numpy as np
 
-class Axelrod(Scene):
-    def construct(self):
-        narrator = NarrationManager(self)
+# Replicas of the round-robin averaged for the on-screen scores; fixed seed, fixed frames
+TOURNAMENT_REPETITIONS = 20
+TOURNAMENT_SEED = 1980
 
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+class Axelrod(VisualTheoremScene):
+    def construct(self):
+        narrator = self.narrator
 
         # Tournament bracket (abstract grid of strategy nodes)
         strategies = [
@@ -28,12 +29,20 @@ class Axelrod(Scene):
             label.move_to(box.get_center())
             nodes.add(VGroup(box, label))
         nodes.arrange_in_grid(rows=3, cols=2, buff=0.5).move_to(UP * 0.8)
+
+        # Play the tournament between these entries (200 rounds, like Axelrod's)
+        names = [name for name, _ in strategies]
+        tournament = round_robin(
+            StrategyTable.from_names(names), rounds=200,
+            repetitions=TOURNAMENT_REPETITIONS, seed=TOURNAMENT_SEED,
+        )
         self.play(FadeIn(nodes, lag_ratio=0.1), run_time=1.2)
 
-        narrator.narrate_top("Axelrod invited strategies to play the repeated dilemma—round-robin tournaments.", duration=3, max_width=9.5)
+        narrator.narrate_top_async("Axelrod invited strategies to play the repeated dilemma—round-robin tournaments.", duration=3, max_width=9.5)
         
-        # Cite Axelrod & Hamilton 1981
-        show_citation(self, AXELROD_1980, position=DOWN + RIGHT, duration=1.5, side_note=True)
+        # Cite Axelrod & Hamilton 1981 (side note runs alongside the narration)
+        show_citation(self, AXELROD_1980, position=DOWN + RIGHT, duration=1.5, side_note=True, scheduler=narrator.scheduler)
+        narrator.flush()
 
         # Highlight Tit for Tat and show behavior
         tft_index = 0
@@ -41,18 +50,23 @@ class Axelrod(Scene):
         highlight = SurroundingRectangle(tft, color=ACCENT_COLOR_PRIMARY, buff=0.12)
         self.play(Create(highlight), run_time=0.6)
 
-        narrator.narrate_top("Tit for Tat: cooperate first, then copy your opponent's last move.", duration=2.8, max_width=9.5)
+        narrator.narrate_top_async("Tit for Tat: cooperate first, then copy your opponent's last move.", duration=2.8, max_width=9.5)
 
-        # Behavior visualization: sequence of icons (C/D)
+        # Behavior visualization: Tit for Tat (left) against Joss (right) from the tournament,
+        # starting just before Joss's first sneaky defection
         C = Text("C", font_size=28, color=ACCENT_COLOR_SUCCESS)
         D = Text("D", font_size=28, color=ACCENT_COLOR_WARNING)
-        seq1 = VGroup(C.copy(), C.copy(), D.copy(), C.copy(), D.copy())
-        seq2 = VGroup(C.copy(), D.copy(), C.copy(), D.copy(), C.copy())
+        tft_moves, joss_moves = tournament.history("Tit for Tat", "Joss")
+        start = max(0, int(np.argmin(joss_moves)) - 1)
+        window = slice(start, start + 5)
+        seq1 = VGroup(*[(C if move else D).copy() for move in tft_moves[window]])
+        seq2 = VGroup(*[(C if move else D).copy() for move in joss_moves[window]])
         seq1.arrange(RIGHT, buff=0.25).move_to(DOWN * 0.4 + LEFT * 2.2)
         seq2.arrange(RIGHT, buff=0.25).move_to(DOWN * 0.4 + RIGHT * 2.2)
         self.play(FadeIn(seq1), FadeIn(seq2), run_time=0.8)
+        narrator.flush()
 
-        narrator.narrate_top("It is nice, retaliatory, forgiving, and clear—hard to exploit, easy to trust.", duration=3.2, max_width=9.5)
+        narrator.narrate_top_async("It is nice, retaliatory, forgiving, and clear—hard to exploit, easy to trust.", duration=3.2, max_width=9.5)
 
         # Icons for four principles
         nice = VGroup(Circle(radius=0.35, color=ACCENT_COLOR_SUCCESS, stroke_width=4), Text("Nice", font_size=18, color=WHITE)).arrange(DOWN, buff=0.1)
@@ -61,12 +75,18 @@ class Axelrod(Scene):
         clear = VGroup(Square(side_length=0.6, color=WHITE, stroke_width=3), Text("Clear", font_size=18, color=WHITE)).arrange(DOWN, buff=0.1)
         principles = VGroup(nice, retal, forgive, clear).arrange(RIGHT, buff=0.8).move_to(DOWN * 1.8)
         self.play(FadeIn(principles, lag_ratio=0.1), run_time=1.0)
+        narrator.flush()
 
-        # Emphasize 'nice finishes first'
-        crown = Star(color=ACCENT_COLOR_PRIMARY, fill_opacity=0.7, outer_radius=0.25, inner_radius=0.1).move_to(tft.get_top() + UP * 0.2)
-        self.play(GrowFromCenter(crown), run_time=0.6)
+        # Emphasize 'nice finishes first': average points per round, crown on the winner
+        scores = VGroup(*[
+            Text(f"{score:.2f} pts/round", font_size=16, color=GRAY_B).next_to(node, DOWN, buff=0.08)
+            for node, score in zip(nodes, tournament.totals)
+        ])
+        winner = nodes[int(np.argmax(tournament.totals))]
+        crown = Star(color=ACCENT_COLOR_PRIMARY, fill_opacity=0.7, outer_radius=0.25, inner_radius=0.1).move_to(winner.get_top() + UP * 0.2)
+        self.play(FadeIn(scores, lag_ratio=0.1), GrowFromCenter(crown), run_time=0.6)
 
         narrator.narrate_top("In both tournaments, nice strategies dominated. Tit for Tat won.", duration=3, max_width=9.5)
 
         # Fade out for next scene
-        self.play(FadeOut(VGroup(nodes, highlight, seq1, seq2, principles, crown)), run_time=1.0)
+        self.play(FadeOut(VGroup(nodes, highlight, seq1, seq2, principles, scores, crown)), run_time=1.0)
@@ -1,32 +1,79 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
-import random
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.citations import MOLANDER_1985, show_citation
+from core.noise import noisy_matches
+from core.memory_one import MemoryOne, long_run_payoffs, mean_echo_length
+from core.generosity import cached_generosity_sweep
+import numpy as np
 
-class NoiseGenerosity(Scene):
-    def construct(self):
-        narrator = NarrationManager(self)
+# Seeded noisy matches: same seed, same glyphs and arrows on every render
+NOISE_SEED = 2006
+ERROR_RATE = 0.05
+MATCHES = 2000
+ROUNDS = 50
+WINDOW = 10
+# Molander sweep grid (solved once, then read from the sweep cache)
+SWEEP_NOISE = np.linspace(0.002, 0.2, 100)
+SWEEP_GENEROSITY = np.linspace(0, 1, 501)
+
+class NoiseGenerosity(VisualTheoremScene):
+    def create_generosity_curve(self, sweep, highlight_noise=None):
+        """
+        Optimal generosity against noise level, from a GenerositySweep.
 
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+        Args:
+            sweep: core.generosity.GenerositySweep
+            highlight_noise: Optional noise level to mark with a dot on the curve
+
+        Returns:
+            VGroup(axes, axis labels, curve[, dot])
+        """
+        axes = Axes(
+            x_range=[0, float(sweep.noise[-1]), 0.05],
+            y_range=[0, 0.5, 0.1],
+            x_length=6.5,
+            y_length=3.2,
+            tips=False,
+            axis_config={"color": GRAY_B, "stroke_width": 2, "include_numbers": True, "font_size": 18},
+        )
+        x_label = Text("Noise", font_size=20, color=GRAY_B).next_to(axes.x_axis, DOWN, buff=0.45)
+        y_label = Text("Optimal generosity", font_size=20, color=GRAY_B).rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.45)
+        optimal = sweep.optimal_generosity()
+        curve = VMobject(color=ACCENT_COLOR_PRIMARY, stroke_width=4)
+        curve.set_points_smoothly([axes.c2p(x, y) for x, y in zip(sweep.noise, optimal)])
+        group = VGroup(axes, x_label, y_label, curve)
+        if highlight_noise is not None:
+            y = np.interp(highlight_noise, sweep.noise, optimal)
+            group.add(Dot(axes.c2p(highlight_noise, y), color=ACCENT_COLOR_SUCCESS, radius=0.08))
+        return group
+
+    def construct(self):
+        narrator = self.narrator
 
         title = Text("Noise & Generous Tit for Tat", font_size=34, color=WHITE, weight=BOLD)
         title.to_edge(UP, buff=0.6)
         self.play(Write(title), run_time=0.8)
 
-        # Two sequences (intended vs perceived)
+        # Simulate TFT vs TFT under noise for the example glyphs; the stats are exact (Markov chain)
+        tft = noisy_matches("Tit for Tat", "Tit for Tat", matches=MATCHES, rounds=ROUNDS, error=ERROR_RATE, seed=NOISE_SEED)
+        players, opponent = MemoryOne.named("Tit for Tat", "Generous TFT"), MemoryOne.named("Tit for Tat")
+        _, _, outcomes = long_run_payoffs(players, opponent, error=ERROR_RATE)
+        echoes = mean_echo_length(players, opponent, error=ERROR_RATE)
+        echo = tft.first_echo(window=WINDOW)
+        if echo is None:
+            raise ValueError(
+                f"No clean TFT echo within {WINDOW} rounds in {MATCHES} matches "
+                f"(NOISE_SEED={NOISE_SEED}, error={ERROR_RATE}); pick another NOISE_SEED"
+            )
+        match, start = echo
+        shown = slice(start, start + WINDOW)
+
+        # Two sequences: one player's intended moves vs how the opponent perceived them
         C = Text("C", font_size=28, color=ACCENT_COLOR_SUCCESS)
         D = Text("D", font_size=28, color=ACCENT_COLOR_WARNING)
-        intended = VGroup(*[C.copy() if i % 2 == 0 else C.copy() for i in range(10)])
-        perceived = VGroup()
-        for i in range(10):
-            # Introduce noise ~10%: flip a C to D
-            if random.random() < 0.12:
-                perceived.add(D.copy())
-            else:
-                perceived.add(intended[i].copy())
+        intended = VGroup(*[(C if move else D).copy() for move in tft.intended[match, shown, 0]])
+        perceived = VGroup(*[(C if move else D).copy() for move in tft.perceived[match, shown, 0]])
         intended.arrange(RIGHT, buff=0.18).move_to(UP * 0.2 + LEFT * 0.9)
         perceived.arrange(RIGHT, buff=0.18).move_to(DOWN * 0.6 + LEFT * 0.9)
 
@@ -34,28 +81,44 @@ class NoiseGenerosity(Scene):
         narrator.narrate_top("In the real world, signals are noisy—cooperation may look like defection.", duration=3, max_width=9.5)
         self.play(FadeIn(perceived), run_time=0.8)
 
-        # Echo retaliation visualization
-        echo = VGroup()
-        for i in range(4):
-            arrow = Arrow(UP * 0.2 + RIGHT * (i*0.8 - 0.8), DOWN * 0.6 + RIGHT * (i*0.8 - 0.4), color=ACCENT_COLOR_WARNING, stroke_width=4)
-            echo.add(arrow)
+        # Echo retaliation visualization: a defection seen at t comes back two rounds later
+        links = [(t - start, back - start) for t, back in tft.echo_links(match) if back < start + WINDOW]
+        echo = VGroup(*[
+            Arrow(perceived[t].get_top(), intended[back].get_bottom(), buff=0.05, color=ACCENT_COLOR_WARNING, stroke_width=4)
+            for t, back in links
+        ])
         self.play(*[Create(a) for a in echo], run_time=1.0)
 
         narrator.narrate_top("Tit for Tat can get stuck in retaliation loops.", duration=2.2, max_width=9.5)
 
-        # Generous TFT: occasionally forgive
+        # Generous TFT: occasionally forgive the defections that feed the echo
         narrator.narrate_top("Generous Tit for Tat forgives sometimes, breaking the echo.", duration=2.8, max_width=9.5)
         forgive_glow = VGroup()
-        for idx in [2, 5, 8]:
-            glow = SurroundingRectangle(perceived[idx], color=ACCENT_COLOR_PRIMARY, buff=0.12)
+        for t, _ in links:
+            glow = SurroundingRectangle(perceived[t], color=ACCENT_COLOR_PRIMARY, buff=0.12)
             forgive_glow.add(glow)
         self.play(*[Create(g) for g in forgive_glow], run_time=1.0)
         self.play(FadeOut(echo), run_time=0.6)
 
-        # Outcome arrows up
+        # Outcome arrows up, with the long-run effect of generosity
         up_arrows = VGroup(*[Arrow(DOWN*0.2 + RIGHT * (i*0.6), UP*0.6 + RIGHT * (i*0.6), color=ACCENT_COLOR_SUCCESS, stroke_width=4) for i in range(4)])
         up_arrows.move_to(RIGHT * 3)
-        self.play(*[Create(a) for a in up_arrows], run_time=0.8)
+        stats = VGroup(
+            Text(f"Mutual cooperation: {outcomes[0, 0]:.0%} → {outcomes[1, 0]:.0%}", font_size=20, color=WHITE),
+            Text(f"Average echo: {echoes[0]:.0f} → {echoes[1]:.0f} rounds", font_size=20, color=GRAY_B),
+        ).arrange(DOWN, buff=0.12).next_to(up_arrows, DOWN, buff=0.3)
+        self.play(*[Create(a) for a in up_arrows], FadeIn(stats), run_time=0.8)
 
         self.wait(0.5)
-        self.play(FadeOut(VGroup(title, intended, perceived, forgive_glow, up_arrows)), run_time=0.8)
+        self.play(FadeOut(VGroup(intended, perceived, forgive_glow, up_arrows, stats)), run_time=0.8)
+
+        # How generous? Molander's optimum, solved exactly over a noise x generosity grid
+        sweep = cached_generosity_sweep(SWEEP_NOISE, SWEEP_GENEROSITY)
+        plot = self.create_generosity_curve(sweep, highlight_noise=ERROR_RATE)
+        plot.move_to(DOWN * 0.4)
+        self.play(Create(plot[0]), FadeIn(plot[1:3]), run_time=1.0)
+        narrator.narrate_top_async("The noisier the world, the less forgiveness pays—but never zero.", duration=3, max_width=9.5)
+        show_citation(self, MOLANDER_1985, position=DOWN + RIGHT, duration=1.5, side_note=True, scheduler=narrator.scheduler)
+        self.play(Create(plot[3]), *[FadeIn(dot, scale=0.5) for dot in plot[4:]], run_time=1.5)
+        narrator.flush()
+        self.play(FadeOut(VGroup(title, plot)), run_time=0.8)
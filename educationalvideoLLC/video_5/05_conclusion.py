@@ -1,16 +1,11 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_SUCCESS
 from core.logo import create_logo
 
-class PDConclusion(Scene):
+class PDConclusion(VisualTheoremScene):
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # Disarmament staircase (yearly checks)
         narrator.narrate_top("Cooperation emerges when interactions repeat and trust can be checked.", duration=3, max_width=9.5)
@@ -36,4 +31,4 @@ class PDConclusion(Scene):
         narrator.narrate_top("If you enjoyed this, subscribe for more game theory and psychology explained simply.", duration=3, max_width=9.5)
 
         self.wait(0.6)
-        self.play(FadeOut(VGroup(stairs, group, brand, bg), scale=1.05), run_time=1.4)
+        self.play(FadeOut(VGroup(stairs, group, brand), scale=1.05), self.fade_out_background(), run_time=1.4)
@@ -1,40 +1,86 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 from core.citations import NOWAK_2006, show_citation
+from core.memory_one import MemoryOne, payoff_grid
+from core.replicator import replicator_trajectory, shares_at
+from core.spatial import simulate, to_rgba
+from core.figures import human_figure
 
-class StrategyEcology(Scene):
+# Bar length (frame units) of a strategy holding the whole population
+BAR_SCALE = 11
+# Generations simulated and shown; the ecology has settled well before this
+GENERATIONS = 30
+# Chance that a move is misread; with noise, generosity pays (Nowak & Sigmund)
+ERROR_RATE = 0.02
+# Spatial game (Nowak & May 1992): lattice side, generations shown, temptation, seed
+LATTICE_SIZE = 200
+LATTICE_GENERATIONS = 60
+LATTICE_TEMPTATION = 1.85
+LATTICE_SEED = 1992
+
+class StrategyEcology(VisualTheoremScene):
     """
     Strategy ecology: Replicator dynamics showing how nice strategies outcompete nasty ones.
     Better visuals with animated population bars and evolutionary dynamics.
     """
     
     def create_human_figure(self, color=WHITE, scale_factor=0.4):
-        """Create a simple human figure."""
-        head = Circle(radius=0.15, color=color, fill_opacity=0.8)
-        body = Rectangle(width=0.15, height=0.4, color=color, fill_opacity=0.8)
-        left_arm = Line(ORIGIN, LEFT * 0.2 + DOWN * 0.15, color=color, stroke_width=6)
-        right_arm = Line(ORIGIN, RIGHT * 0.2 + DOWN * 0.15, color=color, stroke_width=6)
-        left_leg = Line(ORIGIN, LEFT * 0.1 + DOWN * 0.3, color=color, stroke_width=6)
-        right_leg = Line(ORIGIN, RIGHT * 0.1 + DOWN * 0.3, color=color, stroke_width=6)
-        
-        human = VGroup(
-            body,
-            left_arm.move_to(body.get_top() + DOWN * 0.05),
-            right_arm.move_to(body.get_top() + DOWN * 0.05),
-            head.move_to(body.get_top() + UP * 0.2),
-            left_leg.move_to(body.get_bottom()),
-            right_leg.move_to(body.get_bottom())
-        ).scale(scale_factor)
-        return human
+        """Create a simple human figure (a copy of the cached prototype)."""
+        return human_figure("simple", color=color, scale_factor=scale_factor)
+    
+    def create_generation_counter(self, tracker, max_digits=3):
+        """
+        "Generation: N" label following a ValueTracker (shows floor(value) + 1).
+        Digits are copied from ten pre-built glyphs, so no text is laid out per frame.
+        """
+        prefix = Text("Generation:", font_size=24, color=WHITE)
+        glyphs = [Text(str(d), font_size=24, color=WHITE) for d in range(10)]
+        step = max(glyph.width for glyph in glyphs) + 0.02
+        slots = VGroup(*[glyphs[0].copy() for _ in range(max_digits)])
+        shown = [None]
+        
+        def update_digits(group):
+            value = int(tracker.get_value()) + 1
+            if value == shown[0]:
+                return
+            shown[0] = value
+            digits = str(value)
+            for i, slot in enumerate(slots):
+                if i < len(digits):
+                    slot.become(glyphs[int(digits[i])])
+                else:
+                    slot.set_opacity(0)
+                # Hidden slots stay in line too, so the counter's bounding box is stable
+                slot.next_to(prefix, RIGHT, buff=0.15 + i * step, aligned_edge=DOWN)
+        
+        counter = VGroup(prefix, slots)
+        slots.add_updater(update_digits)
+        update_digits(slots)
+        return counter
+    
+    def create_lattice(self, frames, tracker, height=5.2):
+        """
+        Spatial game lattice as one ImageMobject showing frame floor(tracker).
+        Each generation swaps the pixel array, so the cost per frame is one texture.
+        """
+        lattice = ImageMobject(frames[0].copy())
+        lattice.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        lattice.height = height
+        shown = [0]
+        
+        def show_generation(image):
+            index = min(int(tracker.get_value()), len(frames) - 1)
+            if index == shown[0]:
+                return
+            shown[0] = index
+            image.pixel_array = frames[index].copy()
+        
+        lattice.add_updater(show_generation)
+        return lattice
     
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # Title
         title = Text("The Ecology of Strategies", font_size=36, color=WHITE, weight=BOLD)
@@ -44,21 +90,28 @@ class StrategyEcology(Scene):
         narrator.narrate_top("In repeated games, strategies compete like species in an ecosystem.", duration=3, max_width=9.5)
         self.play(FadeOut(title), run_time=0.4)
         
-        # Strategy labels with human icons
+        # Strategy labels with human icons, and initial populations. Plenty of unconditional
+        # cooperators to exploit: Always Defect triples (15% -> 45% by generation 12), then
+        # starves once they are gone and Tit for Tat / Generous TFT take over
         strategies = [
-            ("Tit for Tat", ACCENT_COLOR_SUCCESS, 40),
-            ("Generous TFT", ACCENT_COLOR_PRIMARY, 30),
-            ("Always Cooperate", BLUE_B, 20),
-            ("Always Defect", ACCENT_COLOR_WARNING, 50),
-            ("Random", GRAY_B, 25),
+            ("Tit for Tat", ACCENT_COLOR_SUCCESS, 20),
+            ("Generous TFT", ACCENT_COLOR_PRIMARY, 15),
+            ("Always Cooperate", BLUE_B, 35),
+            ("Always Defect", ACCENT_COLOR_WARNING, 15),
+            ("Random", GRAY_B, 15),
         ]
         
-        # Initial population bars (generation 1)
+        # Real dynamics: exact long-run payoffs of the noisy IPD, then replicator steps
+        names = [name for name, _, _ in strategies]
+        payoffs = payoff_grid(MemoryOne.named(*names), error=ERROR_RATE)
+        trajectory = replicator_trajectory(payoffs, [pop for _, _, pop in strategies], GENERATIONS)
+        
+        # One set of bars for the whole simulation
         bars = VGroup()
         labels = VGroup()
         humans = VGroup()
         
-        for i, (name, color, initial_pop) in enumerate(strategies):
+        for i, (name, color, _) in enumerate(strategies):
             # Label
             label = Text(name, font_size=18, color=color)
             label.to_edge(LEFT, buff=0.5).shift(UP * 1.8 - DOWN * i * 0.8)
@@ -71,7 +124,7 @@ class StrategyEcology(Scene):
             
             # Bar
             bar = Rectangle(
-                width=initial_pop / 15,
+                width=trajectory[0][i] * BAR_SCALE,
                 height=0.5,
                 color=color,
                 fill_opacity=0.7,
@@ -88,77 +141,33 @@ class StrategyEcology(Scene):
         )
         self.play(*[GrowFromEdge(bar, LEFT) for bar in bars], run_time=1.5)
         
-        narrator.narrate_top("At first, 'Always Defect' thrives—it exploits cooperators.", duration=3, max_width=9.5)
+        narrator.narrate_top("At first, 'Always Defect' thrives—it exploits the unconditional cooperators.", duration=3, max_width=9.5)
         self.wait(0.5)
         
-        # Generation label
-        gen_label = Text("Generation: 1", font_size=24, color=WHITE)
+        # Generation counter
+        generation = ValueTracker(0)
+        gen_label = self.create_generation_counter(generation)
         gen_label.to_corner(UP + RIGHT, buff=0.6)
         self.play(FadeIn(gen_label), run_time=0.5)
         
         # Cite Nowak 2006
         show_citation(self, NOWAK_2006, position=DOWN + RIGHT, duration=1.5, side_note=True)
         
-        # Evolution: Defectors decline, nice strategies thrive
-        new_populations = [
-            ("Tit for Tat", 55),      # grows
-            ("Generous TFT", 40),     # grows
-            ("Always Cooperate", 15), # declines (exploited)
-            ("Always Defect", 20),    # declines (can't exploit TFT)
-            ("Random", 18),           # declines
-        ]
-        
         narrator.narrate_top("But Tit for Tat retaliates. Defectors starve. Nice strategies multiply.", duration=3.5, max_width=9.5)
         
-        # Animate to generation 10
-        for gen in range(2, 11):
-            new_bars = VGroup()
-            for i, (name, new_pop) in enumerate(new_populations):
-                color = strategies[i][1]
-                bar = Rectangle(
-                    width=new_pop / 15,
-                    height=0.5,
-                    color=color,
-                    fill_opacity=0.7,
-                    stroke_width=2
-                )
-                bar.next_to(labels[i], RIGHT, buff=0.3, aligned_edge=LEFT)
-                new_bars.add(bar)
-            
-            # Update generation
-            new_gen_label = Text(f"Generation: {gen}", font_size=24, color=WHITE)
-            new_gen_label.to_corner(UP + RIGHT, buff=0.6)
-            
-            self.play(
-                Transform(bars, new_bars),
-                Transform(gen_label, new_gen_label),
-                run_time=0.4
-            )
-            self.wait(0.2)
-        
-        # Final generation: nice strategies dominate
-        final_populations = [
-            ("Tit for Tat", 70),
-            ("Generous TFT", 50),
-            ("Always Cooperate", 10),
-            ("Always Defect", 5),
-            ("Random", 8),
-        ]
+        # Bars follow the trajectory: resized in place, left edges fixed
+        anchors = [bar.get_left() for bar in bars]
         
-        final_bars = VGroup()
-        for i, (name, final_pop) in enumerate(final_populations):
-            color = strategies[i][1]
-            bar = Rectangle(
-                width=final_pop / 15,
-                height=0.5,
-                color=color,
-                fill_opacity=0.7,
-                stroke_width=2
-            )
-            bar.next_to(labels[i], RIGHT, buff=0.3, aligned_edge=LEFT)
-            final_bars.add(bar)
+        def follow_trajectory(group):
+            shares = shares_at(trajectory, generation.get_value())
+            for bar, anchor, share in zip(group, anchors, shares):
+                bar.stretch_to_fit_width(max(share * BAR_SCALE, 0.01))
+                bar.move_to(anchor, aligned_edge=LEFT)
         
-        self.play(Transform(bars, final_bars), run_time=1.2)
+        bars.add_updater(follow_trajectory)
+        self.play(generation.animate.set_value(GENERATIONS), run_time=6.6, rate_func=linear)
+        bars.remove_updater(follow_trajectory)
+        gen_label.clear_updaters()
         
         narrator.narrate_top("After many rounds, nice and retaliatory strategies dominate the population.", duration=3.5, max_width=9.5)
         
@@ -176,4 +185,17 @@ class StrategyEcology(Scene):
             FadeOut(VGroup(bars, labels, humans, gen_label, winner_boxes)),
             run_time=1.0
         )
+        
+        # Space helps too: cooperators and defectors on a lattice, playing their neighbours
+        history = simulate(LATTICE_SIZE, LATTICE_GENERATIONS, b=LATTICE_TEMPTATION, seed=LATTICE_SEED)
+        frames = to_rgba(history)
+        lattice_generation = ValueTracker(0)
+        lattice = self.create_lattice(frames, lattice_generation).shift(DOWN * 0.3)
+        self.play(FadeIn(lattice), run_time=0.6)
+        
+        narrator.narrate_top_async("On a grid, cooperators form clusters that defectors can't break.", duration=3.5, max_width=9.5)
+        self.play(lattice_generation.animate.set_value(LATTICE_GENERATIONS), run_time=5.0, rate_func=linear)
+        narrator.flush()
+        lattice.clear_updaters()
+        self.play(FadeOut(lattice), run_time=0.8)
 
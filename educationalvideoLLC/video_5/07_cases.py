@@ -1,63 +1,30 @@
 from manim import *
-from core.narration import NarrationManager
-from core.config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_WARNING, ACCENT_COLOR_SUCCESS
 from core.citations import TRIVERS_1971, PACKER_1988, show_citation
+from core.figures import human_figure, crowd
+from core.gait import walk
 
-class RealWorldCases(Scene):
+class RealWorldCases(VisualTheoremScene):
     """
     Real-world Prisoner's Dilemma cases with animated human interactions.
     More storytelling, better visuals, longer runtime.
     """
     
     def create_detailed_human(self, color=WHITE, scale_factor=0.5):
-        """Create a detailed human figure with more anatomical accuracy."""
-        # Head
-        head = Circle(radius=0.18, color=color, fill_opacity=0.9, stroke_width=2)
-        
-        # Body (torso)
-        body = RoundedRectangle(
-            width=0.25, 
-            height=0.5, 
-            corner_radius=0.05,
-            color=color, 
-            fill_opacity=0.85,
-            stroke_width=2
-        )
-        
-        # Arms
-        left_arm = Line(ORIGIN, LEFT * 0.25 + DOWN * 0.2, color=color, stroke_width=7)
-        right_arm = Line(ORIGIN, RIGHT * 0.25 + DOWN * 0.2, color=color, stroke_width=7)
-        
-        # Legs
-        left_leg = Line(ORIGIN, LEFT * 0.12 + DOWN * 0.4, color=color, stroke_width=8)
-        right_leg = Line(ORIGIN, RIGHT * 0.12 + DOWN * 0.4, color=color, stroke_width=8)
-        
-        human = VGroup(
-            body,
-            left_arm.move_to(body.get_top() + DOWN * 0.08),
-            right_arm.move_to(body.get_top() + DOWN * 0.08),
-            head.move_to(body.get_top() + UP * 0.25),
-            left_leg.move_to(body.get_bottom()),
-            right_leg.move_to(body.get_bottom())
-        ).scale(scale_factor)
-        return human
+        """Create a detailed human figure (a copy of the cached prototype)."""
+        return human_figure("detailed", color=color, scale_factor=scale_factor)
     
     def animate_walking(self, human, distance, direction=RIGHT, duration=2.0):
-        """Animate human walking with leg/arm movement."""
-        # Simple walking cycle: alternate legs
-        leg_swing = [
-            human[4].animate.rotate(0.3, about_point=human[0].get_bottom()),  # left leg forward
-            human[5].animate.rotate(-0.3, about_point=human[0].get_bottom()), # right leg back
-        ]
-        return human.animate.shift(direction * distance)
+        """
+        Animate human walking with leg/arm movement (a gait cycle, see core/gait.py).
+        `human` may also be a VGroup of figures, which then walk together.
+        """
+        figures = human if isinstance(human[0], VGroup) else VGroup(human)
+        return walk(figures, direction * distance, style="detailed", run_time=duration, rate_func=linear)
     
     def construct(self):
-        narrator = NarrationManager(self)
-
-        # Background
-        bg = Rectangle(width=config.frame_width, height=config.frame_height,
-                       fill_color=BACKGROUND_COLOR, fill_opacity=1).set_stroke(width=0)
-        self.add(bg)
+        narrator = self.narrator
 
         # Title
         title = Text("Real-World Prisoner's Dilemmas", font_size=38, color=WHITE, weight=BOLD)
@@ -93,14 +60,15 @@ class RealWorldCases(Scene):
         narrator.narrate_top("Cooperate: do dishes. Defect: leave them.", duration=2.2, max_width=9.5)
         
         # Roommate 1 approaches and does dishes (cooperates)
-        self.play(roommate1.animate.move_to(sink.get_center() + DOWN * 0.8 + LEFT * 0.3), run_time=1.2)
+        to_sink = sink.get_center() + DOWN * 0.8 + LEFT * 0.3 - roommate1.get_center()
+        self.play(self.animate_walking(roommate1, np.linalg.norm(to_sink), normalize(to_sink), duration=1.2))
         self.play(
             dishes.animate.set_fill(opacity=0.1).set_stroke(opacity=0.3),
             run_time=0.8
         )
         
         # Roommate 2 walks away (defects)
-        self.play(roommate2.animate.shift(RIGHT * 2), run_time=1.0)
+        self.play(self.animate_walking(roommate2, 2, RIGHT, duration=1.0))
         
         narrator.narrate_top("If only one cooperates, they're exploited. But if both defect, the kitchen is gross.", duration=3.5, max_width=9.5)
         
@@ -149,13 +117,11 @@ class RealWorldCases(Scene):
         self.play(Transform(price2, new_price2), run_time=0.6)
         
         # Customers flock to B
-        customers = VGroup(*[
-            self.create_detailed_human(color=YELLOW_A, scale_factor=0.3)
-            for _ in range(5)
-        ]).arrange(RIGHT, buff=0.2).move_to(DOWN * 1.5)
+        customers = crowd(5, "detailed", color=YELLOW_A, scale_factor=0.3).arrange(RIGHT, buff=0.2).move_to(DOWN * 1.5)
         
         self.play(FadeIn(customers, shift=UP), run_time=0.8)
-        self.play(customers.animate.move_to(company2.get_center() + DOWN * 1.8), run_time=1.2)
+        to_store = company2.get_center() + DOWN * 1.8 - customers.get_center()
+        self.play(self.animate_walking(customers, np.linalg.norm(to_store), normalize(to_store), duration=1.2))
         
         narrator.narrate_top("Defect: undercut rival, steal customers. But rivals retaliate.", duration=2.8, max_width=9.5)
         
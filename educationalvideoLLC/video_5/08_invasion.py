@@ -0,0 +1,90 @@
+from manim import *
+from core.scene import VisualTheoremScene
+from core.config import ACCENT_COLOR_PRIMARY, ACCENT_COLOR_SUCCESS
+from core.citations import NOWAK_2004, show_citation
+from core.moran import cached_fixation
+
+# Moran-process estimate: one TFT mutant in a population of ALLD (seeded, cached on disk)
+POPULATION_SIZES = list(range(10, 101, 10))
+SELECTION_STRENGTHS = [0.02, 0.2]
+RUNS = 20_000
+MORAN_SEED = 2004
+
+class Invasion(VisualTheoremScene):
+    """
+    Invasion: how often does a single Tit for Tat take over a population of defectors?
+    Simulated fixation probabilities against the neutral 1/N line.
+    """
+
+    def create_fixation_plot(self, fixation, colors):
+        """
+        Fixation probability against population size, one curve per selection strength.
+
+        Args:
+            fixation: Result of core.moran.cached_fixation
+            colors: One color per selection strength
+
+        Returns:
+            (axes group, neutral line, [VGroup(curve, dots) per strength])
+        """
+        sizes = fixation["sizes"]
+        axes = Axes(
+            x_range=[0, int(sizes[-1]), 20],
+            y_range=[0, 0.14, 0.02],
+            x_length=7.5,
+            y_length=3.8,
+            tips=False,
+            axis_config={"color": GRAY_B, "stroke_width": 2, "font_size": 18},
+            x_axis_config={"include_numbers": True},
+            y_axis_config={"include_numbers": True, "decimal_number_config": {"num_decimal_places": 2}},
+        )
+        x_label = Text("Population size N", font_size=20, color=GRAY_B).next_to(axes.x_axis, DOWN, buff=0.45)
+        y_label = Text("Chance TFT takes over", font_size=20, color=GRAY_B).rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.5)
+
+        neutral = DashedVMobject(
+            axes.plot(lambda n: 1 / n, x_range=[float(sizes[0]), float(sizes[-1])], color=GRAY_B, stroke_width=3),
+            num_dashes=30,
+        )
+        curves = []
+        for j, color in enumerate(colors):
+            curve = VMobject(color=color, stroke_width=4)
+            curve.set_points_smoothly([axes.c2p(n, p) for n, p in zip(sizes, fixation["exact"][:, j])])
+            dots = VGroup(*[Dot(axes.c2p(n, p), radius=0.06, color=color) for n, p in zip(sizes, fixation["probability"][:, j])])
+            curves.append(VGroup(curve, dots))
+        return VGroup(axes, x_label, y_label), neutral, curves
+
+    def construct(self):
+        narrator = self.narrator
+
+        title = Text("Can One Cooperator Invade?", font_size=34, color=WHITE, weight=BOLD)
+        title.to_edge(UP, buff=0.6)
+        self.play(Write(title), run_time=0.8)
+
+        fixation = cached_fixation("Tit for Tat", "Always Defect", POPULATION_SIZES, SELECTION_STRENGTHS, runs=RUNS, seed=MORAN_SEED)
+        colors = [ACCENT_COLOR_SUCCESS, ACCENT_COLOR_PRIMARY]
+        frame, neutral, curves = self.create_fixation_plot(fixation, colors)
+        VGroup(frame, neutral, *curves).move_to(DOWN * 0.3)
+
+        narrator.narrate_top_async("One Tit for Tat mutant among defectors: does it take over, or die out?", duration=3, max_width=9.5)
+        self.play(Create(frame[0]), FadeIn(frame[1:]), run_time=1.2)
+        narrator.flush()
+
+        neutral_label = Text("pure chance: 1/N", font_size=18, color=GRAY_B).next_to(neutral.get_start(), RIGHT, buff=0.2)
+        narrator.narrate_top_async("A neutral mutant wins by pure chance—one time in N.", duration=2.8, max_width=9.5)
+        self.play(Create(neutral), FadeIn(neutral_label), run_time=1.2)
+        narrator.flush()
+
+        # Dots: simulated runs; curves: the exact Moran result they converge to
+        legend = VGroup(*[
+            VGroup(Dot(radius=0.06, color=color), Text(f"selection w = {w:g}", font_size=18, color=color)).arrange(RIGHT, buff=0.15)
+            for w, color in zip(fixation["strengths"], colors)
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.12).to_corner(UP + RIGHT, buff=0.6).shift(DOWN * 0.8)
+        narrator.narrate_top_async("In large enough populations, Tit for Tat beats chance—and stronger selection helps it more.", duration=3.5, max_width=9.5)
+        show_citation(self, NOWAK_2004, position=DOWN + RIGHT, duration=1.5, side_note=True, scheduler=narrator.scheduler)
+        for curve, dots in curves:
+            self.play(FadeIn(dots, lag_ratio=0.1), Create(curve), run_time=1.2)
+        self.play(FadeIn(legend), run_time=0.5)
+        narrator.flush()
+
+        self.wait(0.5)
+        self.play(FadeOut(VGroup(title, frame, neutral, neutral_label, legend, *curves)), run_time=0.8)
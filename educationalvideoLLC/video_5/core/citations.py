@@ -48,6 +48,13 @@ NOWAK_2006 = Citation(
     journal="Science, 314(5805), 1560-1563"
 )
 
+NOWAK_2004 = Citation(
+    authors=["Nowak", "Sasaki", "Taylor", "Fudenberg"],
+    year=2004,
+    title="Emergence of Cooperation and Evolutionary Stability in Finite Populations",
+    journal="Nature, 428(6983), 646-650"
+)
+
 TRIVERS_1971 = Citation(
     authors=["Trivers"],
     year=1971,
@@ -69,17 +76,8 @@ MOLANDER_1985 = Citation(
     journal="Journal of Conflict Resolution, 29(4), 611-618"
 )
 
-def show_citation(scene, citation: Citation, position=DOWN, duration=2.0, side_note=False):
-    """
-    Display citation on screen.
-    
-    Args:
-        scene: Manim Scene
-        citation: Citation object
-        position: Position (DOWN for bottom, UP for top, RIGHT for side note)
-        duration: How long to show
-        side_note: If True, show as small side note instead of full citation
-    """
+def build_citation(citation: Citation, position=DOWN, side_note=False):
+    """Build the on-screen citation mobject (side note text or boxed full citation)."""
     if side_note:
         # Compact side note format
         cite_text = Text(
@@ -92,43 +90,60 @@ def show_citation(scene, citation: Citation, position=DOWN, duration=2.0, side_n
             cite_text.to_edge(RIGHT, buff=0.4).shift(UP * 2)
         else:
             cite_text.to_corner(DOWN + RIGHT, buff=0.4)
-        
-        scene.play(FadeIn(cite_text, shift=LEFT * 0.2), run_time=0.4)
-        scene.wait(duration)
-        scene.play(FadeOut(cite_text, shift=LEFT * 0.2), run_time=0.4)
-    
-    else:
-        # Full citation at bottom
-        cite_text = MarkupText(
-            f"<i>{citation.short_cite()}</i>",
-            font_size=20,
-            color=GRAY_A
-        )
-        cite_text.to_edge(position, buff=0.3)
-        
-        bg_box = Rectangle(
-            width=cite_text.width + 0.3,
-            height=cite_text.height + 0.15,
-            fill_color=BLACK,
-            fill_opacity=0.7,
-            stroke_width=1,
-            stroke_color=GRAY_B
-        ).move_to(cite_text)
-        
-        group = VGroup(bg_box, cite_text)
-        scene.play(FadeIn(group, shift=UP * 0.1), run_time=0.5)
-        scene.wait(duration)
-        scene.play(FadeOut(group, shift=DOWN * 0.1), run_time=0.5)
+        return cite_text
 
-def show_bibliography(scene, citations: list, title="References"):
+    # Full citation at bottom
+    cite_text = MarkupText(
+        f"<i>{citation.short_cite()}</i>",
+        font_size=20,
+        color=GRAY_A
+    )
+    cite_text.to_edge(position, buff=0.3)
+
+    bg_box = Rectangle(
+        width=cite_text.width + 0.3,
+        height=cite_text.height + 0.15,
+        fill_color=BLACK,
+        fill_opacity=0.7,
+        stroke_width=1,
+        stroke_color=GRAY_B
+    ).move_to(cite_text)
+
+    return VGroup(bg_box, cite_text)
+
+def show_citation(scene, citation: Citation, position=DOWN, duration=2.0, side_note=False, scheduler=None):
     """
-    Show bibliography screen with all citations.
+    Display citation on screen.
     
     Args:
         scene: Manim Scene
-        citations: List of Citation objects
-        title: Title for bibliography screen
+        citation: Citation object
+        position: Position (DOWN for bottom, UP for top, RIGHT for side note)
+        duration: How long to show
+        side_note: If True, show as small side note instead of full citation
+        scheduler: Optional OverlayScheduler (e.g. narrator.scheduler); the citation is
+            then queued and plays alongside the next animations instead of blocking
     """
+    mob = build_citation(citation, position, side_note)
+
+    if side_note:
+        if scheduler is not None:
+            scheduler.queue(mob, duration, lane="side", fade=0.4, shift=LEFT * 0.2)
+            return
+        scene.play(FadeIn(mob, shift=LEFT * 0.2), run_time=0.4)
+        scene.wait(duration)
+        scene.play(FadeOut(mob, shift=LEFT * 0.2), run_time=0.4)
+    
+    else:
+        if scheduler is not None:
+            scheduler.queue(mob, duration, lane="citation", fade=0.5, shift=UP * 0.1, exit_shift=DOWN * 0.1)
+            return
+        scene.play(FadeIn(mob, shift=UP * 0.1), run_time=0.5)
+        scene.wait(duration)
+        scene.play(FadeOut(mob, shift=DOWN * 0.1), run_time=0.5)
+
+def build_bibliography(citations: list, title="References"):
+    """Build the bibliography screen: VGroup(title, references)."""
     bib_title = Text(title, font_size=40, color=WHITE, weight=BOLD)
     bib_title.to_edge(UP, buff=0.8)
     
@@ -146,10 +161,21 @@ def show_bibliography(scene, citations: list, title="References"):
     refs.arrange(DOWN, aligned_edge=LEFT, buff=0.35)
     refs.next_to(bib_title, DOWN, buff=0.6)
     
-    bib_group = VGroup(bib_title, refs)
+    return VGroup(bib_title, refs)
+
+def show_bibliography(scene, citations: list, title="References"):
+    """
+    Show bibliography screen with all citations.
+    
+    Args:
+        scene: Manim Scene
+        citations: List of Citation objects
+        title: Title for bibliography screen
+    """
+    bib_group = build_bibliography(citations, title)
+    bib_title, refs = bib_group
     
     scene.play(FadeIn(bib_title, shift=UP), run_time=0.8)
     scene.play(FadeIn(refs, lag_ratio=0.1), run_time=2.0)
     scene.wait(3)
     scene.play(FadeOut(bib_group), run_time=1.0)
-
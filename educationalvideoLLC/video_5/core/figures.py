@@ -0,0 +1,88 @@
+"""
+Human figures for VisualTheorem scenes.
+
+Each (style, color) figure is built once as a prototype; scenes get copies.
+Copying reuses the prototype's finished point arrays instead of re-running the
+Circle/RoundedRectangle/Line construction, so crowds of hundreds stay cheap.
+
+Submobject order is fixed: body, left arm, right arm, head, left leg, right leg.
+"""
+
+from manim import *
+
+# Proportions of each style (unscaled figure)
+STYLES = {
+    # Compact icon (strategy ecology labels)
+    "simple": {
+        "head_radius": 0.15, "head_opacity": 0.8, "body_width": 0.15, "body_height": 0.4,
+        "corner_radius": 0, "body_opacity": 0.8, "outline": None,
+        "arm": LEFT * 0.2 + DOWN * 0.15, "arm_width": 6, "arm_drop": 0.05,
+        "leg": LEFT * 0.1 + DOWN * 0.3, "leg_width": 6, "head_lift": 0.2,
+    },
+    # Rounded torso, thicker limbs (real-world cases)
+    "detailed": {
+        "head_radius": 0.18, "head_opacity": 0.9, "body_width": 0.25, "body_height": 0.5,
+        "corner_radius": 0.05, "body_opacity": 0.85, "outline": 2,
+        "arm": LEFT * 0.25 + DOWN * 0.2, "arm_width": 7, "arm_drop": 0.08,
+        "leg": LEFT * 0.12 + DOWN * 0.4, "leg_width": 8, "head_lift": 0.25,
+    },
+}
+
+# (style, color hex) -> unscaled prototype
+_PROTOTYPES = {}
+
+
+def build_figure(style="detailed", color=WHITE, scale_factor=1.0):
+    """Build a figure from scratch (what every call used to do). Prefer human_figure()."""
+    s = STYLES[style]
+    outline = {} if s["outline"] is None else {"stroke_width": s["outline"]}
+    head = Circle(radius=s["head_radius"], color=color, fill_opacity=s["head_opacity"], **outline)
+    if s["corner_radius"]:
+        body = RoundedRectangle(
+            width=s["body_width"], height=s["body_height"], corner_radius=s["corner_radius"],
+            color=color, fill_opacity=s["body_opacity"], **outline,
+        )
+    else:
+        body = Rectangle(width=s["body_width"], height=s["body_height"], color=color, fill_opacity=s["body_opacity"], **outline)
+
+    arm, leg = s["arm"], s["leg"]
+    mirror = np.array([-1, 1, 1])
+    left_arm = Line(ORIGIN, arm, color=color, stroke_width=s["arm_width"])
+    right_arm = Line(ORIGIN, arm * mirror, color=color, stroke_width=s["arm_width"])
+    left_leg = Line(ORIGIN, leg, color=color, stroke_width=s["leg_width"])
+    right_leg = Line(ORIGIN, leg * mirror, color=color, stroke_width=s["leg_width"])
+
+    shoulders = body.get_top() + DOWN * s["arm_drop"]
+    return VGroup(
+        body,
+        left_arm.move_to(shoulders),
+        right_arm.move_to(shoulders),
+        head.move_to(body.get_top() + UP * s["head_lift"]),
+        left_leg.move_to(body.get_bottom()),
+        right_leg.move_to(body.get_bottom()),
+    ).scale(scale_factor)
+
+
+def human_figure(style="detailed", color=WHITE, scale_factor=0.5):
+    """
+    A human figure, copied from the cached (style, color) prototype.
+
+    Args:
+        style: Key of STYLES ("simple" or "detailed")
+        color: Fill and stroke color
+        scale_factor: Size relative to the unscaled prototype
+
+    Returns:
+        VGroup(body, left_arm, right_arm, head, left_leg, right_leg)
+    """
+    key = (style, ManimColor(color).to_hex())
+    prototype = _PROTOTYPES.get(key)
+    if prototype is None:
+        prototype = _PROTOTYPES[key] = build_figure(style, color)
+    return prototype.copy().scale(scale_factor)
+
+
+def crowd(count, style="detailed", color=WHITE, scale_factor=0.5):
+    """`count` identical figures in a VGroup (arrange or place them afterwards)."""
+    figure = human_figure(style, color, scale_factor)
+    return VGroup(figure, *[figure.copy() for _ in range(count - 1)])
@@ -0,0 +1,134 @@
+"""
+Walking cycles for core/figures.py figures.
+
+A gait is a few keyframes of limb angles (radians, counter-clockwise from the rest
+pose) over one stride. One updater moves every walking figure: it interpolates
+the keyframes for all figures at once, then writes each limb's new endpoints
+straight into its point array. Limbs pivot about their rest midpoints, the way
+figures.py attaches them.
+"""
+
+from manim import *
+
+# Limb order inside a figure (see core/figures.py): body, L arm, R arm, head, L leg, R leg
+LIMBS = [1, 2, 4, 5]
+TORSO = [0, 3]
+
+# Keyframes over one stride for (left arm, right arm, left leg, right leg), starting
+# from rest; the cycle wraps, so the last keyframe blends back into the first.
+# Arms swing against legs.
+GAITS = {
+    "simple": {
+        "keyframes": np.array([
+            [0.0, 0.0, 0.0, 0.0],         # rest / passing
+            [-0.25, 0.25, 0.3, -0.3],     # left leg forward
+            [0.0, 0.0, 0.0, 0.0],         # passing
+            [0.25, -0.25, -0.3, 0.3],     # right leg forward
+        ]),
+        "stride": 0.5,                    # distance per cycle, in figure heights
+    },
+    "detailed": {
+        "keyframes": np.array([
+            [0.0, 0.0, 0.0, 0.0],
+            [-0.3, 0.3, 0.35, -0.35],
+            [0.0, 0.0, 0.0, 0.0],
+            [0.3, -0.3, -0.35, 0.35],
+        ]),
+        "stride": 0.6,
+    },
+}
+
+
+def gait_angles(keyframes, phase):
+    """
+    Limb angles at each phase, by cyclic linear interpolation of the keyframes.
+
+    Args:
+        keyframes: (k, limbs) angles
+        phase: (...) stride position; 1.0 is one full cycle
+
+    Returns:
+        (..., limbs) angles
+    """
+    k = len(keyframes)
+    position = (np.asarray(phase, dtype=float) % 1.0) * k
+    lower = np.floor(position).astype(int)
+    t = (position - lower)[..., None]
+    return (1 - t) * keyframes[lower % k] + t * keyframes[(lower + 1) % k]
+
+
+class WalkCycle:
+    """
+    Rest geometry of a group of figures and the gait that animates them.
+
+    Args:
+        figures: Figures from core/figures.py (same style)
+        style: Gait key in GAITS
+    """
+    def __init__(self, figures, style="detailed"):
+        self.figures = list(figures)
+        gait = GAITS[style]
+        self.keyframes = gait["keyframes"]
+        self.origins = np.array([figure[0].get_center() for figure in self.figures])       # (f, 3)
+        limbs = [[figure[i] for i in LIMBS] for figure in self.figures]
+        starts = np.array([[limb.get_start() for limb in row] for row in limbs])          # (f, 4, 3)
+        ends = np.array([[limb.get_end() for limb in row] for row in limbs])
+        self.pivots = (starts + ends) / 2 - self.origins[:, None]
+        self.halves = (ends - starts) / 2
+        self.strides = gait["stride"] * np.array([figure.height for figure in self.figures])
+        self.offset = np.zeros((len(self.figures), 3))
+
+    def limb_points(self, offset, phase):
+        """
+        Bezier points of every limb.
+
+        Args:
+            offset: (f, 3) displacement of each figure from where it started
+            phase: (f,) stride position of each figure
+
+        Returns:
+            (f, 4 limbs, 4 points, 3) array
+        """
+        angles = gait_angles(self.keyframes, phase)                                       # (f, 4)
+        cos, sin = np.cos(angles), np.sin(angles)
+        hx, hy = self.halves[..., 0], self.halves[..., 1]
+        halves = np.stack([cos * hx - sin * hy, sin * hx + cos * hy, self.halves[..., 2]], axis=-1)
+        centers = self.origins[:, None] + offset[:, None] + self.pivots
+        start, end = centers - halves, centers + halves
+        # Straight cubic segments: handles at one and two thirds
+        t = np.linspace(0, 1, 4)[:, None]
+        return start[:, :, None] + t * (end - start)[:, :, None]
+
+    def update(self, offset):
+        """Move every figure to `offset` (f, 3) from its start, posing limbs for the distance walked."""
+        offset = np.asarray(offset, dtype=float)
+        step = offset - self.offset
+        phase = np.linalg.norm(offset, axis=-1) / self.strides
+        points = self.limb_points(offset, phase)
+        for figure, delta, figure_points in zip(self.figures, step, points):
+            for i in TORSO:
+                figure[i].shift(delta)
+            for i, limb_points in zip(LIMBS, figure_points):
+                figure[i].set_points(limb_points)
+        self.offset = offset
+
+
+def walk(figures, displacement, style="detailed", **kwargs):
+    """
+    Animation of figures walking by `displacement` (one vector, or one per figure).
+
+    One UpdateFromAlphaFunc drives the whole group; extra kwargs (run_time,
+    rate_func...) go to it. Each figure's stride is stretched slightly so it
+    covers a whole number of half-cycles and ends back in the rest pose.
+    """
+    group = figures if isinstance(figures, VGroup) else VGroup(*figures)
+    cycle = WalkCycle(group, style)
+    displacement = np.broadcast_to(np.asarray(displacement, dtype=float), (len(group), 3))
+    distance = np.linalg.norm(displacement, axis=-1)
+    half_cycles = np.maximum(1, np.round(2 * distance / cycle.strides))
+    cycle.strides = np.where(distance > 0, 2 * distance / half_cycles, cycle.strides)
+
+    def step(_, alpha):
+        cycle.update(alpha * displacement)
+
+    return UpdateFromAlphaFunc(group, step, **kwargs)
@@ -0,0 +1,117 @@
+"""
+Optimal generosity under noise (Molander 1985), computed numerically.
+
+Generous TFT cooperates after the opponent cooperated and forgives a defection
+with probability g. Noise is an execution error: every player's move comes out
+wrong with probability e. For every (noise, g) on a grid we solve, exactly:
+  - what a population of GTFT(g) earns against itself;
+  - the best any deterministic memory-one deviant earns against it.
+Too little generosity and unconditional cooperators do better than GTFT; too much
+and defectors exploit it. The optimal generosity for a noise level is the g where
+the best deviant gains least: the payoff-maximizing reply to GTFT(g) is then
+GTFT(g) itself, up to that gain. As noise vanishes it tends to Molander's
+min(1 - (T - R)/(R - S), (R - P)/(T - P)). Results are cached on disk.
+"""
+
+import numpy as np
+
+from .ipd import PD_PAYOFFS, outcome_payoffs
+from .memory_one import MemoryOne, stationary
+from .result_cache import cached_arrays, result_key
+
+# Bump when the sweep changes so old cached results are ignored
+SWEEP_FORMAT = 1
+
+# Every deterministic memory-one strategy: against a memory-one opponent one of
+# these is always a best reply, so they stand in for all possible deviants
+DEVIANTS = MemoryOne(np.array(np.meshgrid(*[[0.0, 1.0]] * 4, indexing="ij")).reshape(4, -1).T)
+
+# (noise levels) x (generosities) solved per batch, to bound memory on large grids
+CHUNK = 20_000
+
+
+class GenerositySweep:
+    """
+    Result grid of a generosity x noise sweep.
+
+    Attributes:
+        noise: (n,) error rates
+        generosity: (g,) forgiveness probabilities
+        payoff: (n, g) per-round payoff of GTFT(g) against itself
+        advantage: (n, g) best deviant payoff minus `payoff` (> 0: invadable)
+    """
+    def __init__(self, noise, generosity, payoff, advantage):
+        self.noise = noise
+        self.generosity = generosity
+        self.payoff = payoff
+        self.advantage = advantage
+
+    def optimal_index(self):
+        """(n,) index into `generosity` of the least exploitable GTFT per noise level."""
+        return np.argmin(self.advantage, axis=1)
+
+    def optimal_generosity(self):
+        """(n,) optimal generosity per noise level."""
+        return self.generosity[self.optimal_index()]
+
+    def optimal_payoff(self):
+        """(n,) what a population playing the optimal GTFT earns per round."""
+        return self.payoff[np.arange(len(self.noise)), self.optimal_index()]
+
+    def arrays(self):
+        """Dict of the result arrays (the constructor's keyword arguments)."""
+        return {"noise": self.noise, "generosity": self.generosity, "payoff": self.payoff, "advantage": self.advantage}
+
+
+def _solve(noise, generosity, payoffs):
+    """Payoff and deviant advantage for (noise, generosity) pairs given as flat arrays."""
+    # Execution noise keeps every transition possible, so each chain has one stationary
+    # distribution (misperception alone leaves e.g. "repeat my last move" stuck)
+    gtft = MemoryOne.reactive(1.0, generosity).with_noise(noise[:, None], "execution").probs
+    deviants = DEVIANTS.with_noise(noise[:, None, None], "execution").probs    # (k, 16, 4)
+    values = outcome_payoffs(payoffs)
+
+    payoff = stationary(gtft, gtft) @ values
+    against = stationary(deviants, gtft[:, None]) @ values                 # (k, 16)
+    return payoff, against.max(axis=1) - payoff
+
+
+def generosity_sweep(noise, generosity, payoffs=PD_PAYOFFS):
+    """
+    Solve GTFT(g) for every noise level and generosity.
+
+    Args:
+        noise: (n,) error rates, each > 0
+        generosity: (g,) forgiveness probabilities in [0, 1]
+        payoffs: (T, R, P, S)
+
+    Returns:
+        GenerositySweep
+    """
+    noise = np.asarray(noise, dtype=float)
+    generosity = np.asarray(generosity, dtype=float)
+    grid_noise, grid_g = (a.ravel() for a in np.meshgrid(noise, generosity, indexing="ij"))
+    payoff = np.empty(grid_noise.shape)
+    advantage = np.empty(grid_noise.shape)
+    for start in range(0, len(grid_noise), CHUNK):
+        chunk = slice(start, start + CHUNK)
+        payoff[chunk], advantage[chunk] = _solve(grid_noise[chunk], grid_g[chunk], payoffs)
+    shape = (len(noise), len(generosity))
+    return GenerositySweep(noise, generosity, payoff.reshape(shape), advantage.reshape(shape))
+
+
+def cached_generosity_sweep(noise, generosity, payoffs=PD_PAYOFFS, cache_dir=None):
+    """
+    generosity_sweep(), loaded from disk when the same sweep was solved before.
+
+    Args:
+        cache_dir: Where results live (default: core.result_cache.result_cache_root())
+
+    Returns:
+        GenerositySweep
+    """
+    noise = np.asarray(noise, dtype=float)
+    generosity = np.asarray(generosity, dtype=float)
+    key = result_key({"sweep": SWEEP_FORMAT, "payoffs": [float(v) for v in payoffs]}, noise, generosity)
+    arrays = cached_arrays("generosity", key, lambda: generosity_sweep(noise, generosity, payoffs).arrays(), cache_dir)
+    return GenerositySweep(**arrays)
@@ -0,0 +1,74 @@
+"""
+Iterated Prisoner's Dilemma model for the video's simulations.
+Memory-one strategies and expected payoffs between them, vectorized with NumPy.
+"""
+
+import numpy as np
+
+# Prisoner's Dilemma payoffs (Axelrod 1980): Temptation, Reward, Punishment, Sucker
+PD_PAYOFFS = (5.0, 3.0, 1.0, 0.0)
+
+# Nowak & Sigmund's generosity for Generous TFT: min(1 - (T - R)/(R - S), (R - P)/(T - P))
+GENEROSITY = 1 / 3
+
+# Memory-one strategies: (first move, P(C | CC), P(C | CD), P(C | DC), P(C | DD)).
+# Outcomes are (own move, opponent move) from the last round; 1 = cooperate.
+STRATEGIES = {
+    "Tit for Tat": (1, 1, 0, 1, 0),
+    "Generous TFT": (1, 1, GENEROSITY, 1, GENEROSITY),
+    "Always Cooperate": (1, 1, 1, 1, 1),
+    "Always Defect": (0, 0, 0, 0, 0),
+    "Random": (0.5, 0.5, 0.5, 0.5, 0.5),
+}
+
+# Index of outcome (own, opp) as seen by the opponent: CD <-> DC
+OPPONENT_VIEW = [0, 2, 1, 3]
+
+
+def strategy_array(names):
+    """Stack named strategies into an (n, 5) array."""
+    return np.array([STRATEGIES[name] for name in names], dtype=float)
+
+
+def outcome_payoffs(payoffs=PD_PAYOFFS):
+    """Row player's payoff for outcomes CC, CD, DC, DD."""
+    t, r, p, s = payoffs
+    return np.array([r, s, t, p])
+
+
+def _outcome_distribution(mine, theirs):
+    """P(CC), P(CD), P(DC), P(DD) given each side's cooperation probability."""
+    return np.stack([mine * theirs, mine * (1 - theirs), (1 - mine) * theirs, (1 - mine) * (1 - theirs)], axis=-1)
+
+
+def payoff_matrix(strategies, rounds=10, payoffs=PD_PAYOFFS):
+    """
+    Expected per-round payoff of every strategy against every other.
+
+    Propagates the distribution over last-round outcomes for all pairs at once,
+    so there is no sampling noise and no Python loop over pairs.
+
+    Args:
+        strategies: (n, 5) array of memory-one strategies (see STRATEGIES)
+        rounds: Rounds per match
+        payoffs: (T, R, P, S)
+
+    Returns:
+        (n, n) array; entry [i, j] is what strategy i earns per round against j
+    """
+    p = np.asarray(strategies, dtype=float)
+    mine = p[:, None, 1:]                    # (n, 1, 4): i's reply to each outcome
+    theirs = p[None, :, 1:][..., OPPONENT_VIEW]  # (1, n, 4): j's reply, seen from i's side
+    dist = _outcome_distribution(p[:, None, 0], p[None, :, 0])
+    values = outcome_payoffs(payoffs)
+
+    total = np.zeros(dist.shape[:2])
+    for _ in range(rounds):
+        total += dist @ values
+        coop = dist * mine
+        defect = dist - coop
+        dist = np.stack([
+            (coop * theirs).sum(-1), (coop * (1 - theirs)).sum(-1),
+            (defect * theirs).sum(-1), (defect * (1 - theirs)).sum(-1),
+        ], axis=-1)
+    return total / rounds
@@ -1,11 +1,26 @@
 """
 VisualTheorem logo animation components.
 Reusable logo intro/outro for consistent branding.
+
+With VISUALTHEOREM_BRAND=clips the intro/outro are not rasterized per scene: the brand
+is placed in its final state and a <Scene>.clips.json marker tells render.assemble to
+splice in the shared pre-rendered clip (see render/brand.py).
 """
 
+import json
+import os
+from pathlib import Path
+
 from manim import *
 from .config import BACKGROUND_COLOR, ACCENT_COLOR_PRIMARY
 
+# "inline" animates the brand in every scene; "clips" leaves splice markers instead
+BRAND_MODE = os.environ.get("VISUALTHEOREM_BRAND", "inline")
+
+# Outro hold the shared clip is rendered with; other holds are always animated inline
+OUTRO_WAIT = 1.2
+
+
 def create_logo() -> VGroup:
     """Create the VisualTheorem logo."""
     left = Line(start=LEFT*0.6 + UP*0.5, end=ORIGIN, color=ACCENT_COLOR_PRIMARY, stroke_width=12)
@@ -14,18 +29,61 @@ def create_logo() -> VGroup:
     logo = VGroup(left, right, cross).scale(1.2)
     return logo
 
-def animate_logo_intro(scene) -> VGroup:
-    """Animate logo intro and return the complete logo group."""
+# Brand built once per process; every intro/outro animates a copy (Text layout is the costly part)
+_BRAND = None
+
+def create_brand() -> VGroup:
+    """Logo with the VisualTheorem title and tagline underneath."""
+    global _BRAND
+    if _BRAND is None:
+        _BRAND = _build_brand()
+    return _BRAND.copy()
+
+def _build_brand() -> VGroup:
     logo = create_logo()
     
-    # Title
     title = Text("VisualTheorem", font_size=56, color=WHITE, weight=BOLD)
     title.next_to(logo, DOWN, buff=0.7)
     
     tagline = Text("Psychology, explained simply", font_size=28, color=GRAY_B)
     tagline.next_to(title, DOWN, buff=0.2)
     
-    brand = VGroup(logo, title, tagline)
+    return VGroup(logo, title, tagline)
+
+def _splice_clip(scene, clip, splice):
+    """
+    Record that a pre-rendered brand clip belongs at the current scene time.
+
+    Returns False when the animation has to be rendered inline instead
+    (inline mode, or no movie file to attach the marker to).
+    """
+    if splice is None:
+        splice = BRAND_MODE == "clips"
+    movie_path = getattr(scene.renderer.file_writer, "movie_file_path", None)
+    if not splice or not movie_path:
+        return False
+    markers = getattr(scene, "_brand_clips", [])
+    markers.append({"clip": clip, "at": round(scene.renderer.time, 3)})
+    scene._brand_clips = markers
+    marker_path = Path(movie_path).with_suffix(".clips.json")
+    marker_path.write_text(json.dumps({"scene": type(scene).__name__, "clips": markers}, indent=2))
+    return True
+
+def animate_logo_intro(scene, splice=None) -> VGroup:
+    """
+    Animate logo intro and return the complete logo group.
+
+    Args:
+        scene: Scene to play into
+        splice: Leave a splice marker instead of animating (defaults to BRAND_MODE);
+            only honoured at the very start of a scene
+    """
+    brand = create_brand()
+    logo, title, tagline = brand
+    
+    if scene.renderer.time == 0 and _splice_clip(scene, "intro", splice):
+        scene.add(brand)
+        return brand
     
     # Faster, tighter animation
     scene.play(Create(logo[0]), Create(logo[1]), run_time=0.9)
@@ -36,23 +94,14 @@ def animate_logo_intro(scene) -> VGroup:
     
     return brand
 
-def animate_logo_outro(scene, wait_time=1.2):
-    """Animate logo outro."""
-    logo = create_logo()
-    
-    title = Text("VisualTheorem", font_size=56, color=WHITE, weight=BOLD)
-    title.next_to(logo, DOWN, buff=0.7)
-    
-    tagline = Text("Psychology, explained simply", font_size=28, color=GRAY_B)
-    tagline.next_to(title, DOWN, buff=0.2)
-    
-    brand = VGroup(logo, title, tagline)
-    
-    # Fade in logo
-    scene.play(FadeIn(brand, shift=UP * 0.2), run_time=1.5)
-    
-    # Wait a bit before fading to black (enough time for narration)
-    scene.wait(wait_time)
+def animate_logo_outro(scene, wait_time=OUTRO_WAIT, splice=None):
+    """
+    Animate logo outro.
+
+    With the default wait_time the outro can be spliced from the shared clip;
+    it must then be the last thing the scene plays.
+    """
+    brand = create_brand()
     
     # Quick fade to black
     black = Rectangle(
@@ -62,5 +111,15 @@ def animate_logo_outro(scene, wait_time=1.2):
         fill_opacity=1,
         stroke_opacity=0,
     )
+    
+    if wait_time == OUTRO_WAIT and _splice_clip(scene, "outro", splice):
+        scene.add(brand, black)
+        return
+    
+    # Fade in logo
+    scene.play(FadeIn(brand, shift=UP * 0.2), run_time=1.5)
+    
+    # Wait a bit before fading to black (enough time for narration)
+    scene.wait(wait_time)
+    
     scene.play(FadeIn(black), run_time=1.0)
-
@@ -0,0 +1,144 @@
+"""
+Memory-one strategies and their exact long-run payoffs.
+
+A memory-one strategy is four cooperation probabilities (p_CC, p_CD, p_DC, p_DD)
+after each outcome of the previous round. Two of them playing with noise form a
+4-state Markov chain; its stationary distribution gives the long-run payoff with
+no simulation. Whole grids of pairings are solved at once as stacked 4x4 systems.
+"""
+
+import numpy as np
+
+from .ipd import OPPONENT_VIEW, PD_PAYOFFS, STRATEGIES, outcome_payoffs
+
+
+class MemoryOne:
+    """
+    Array of memory-one strategies, shape (..., 4): P(C | CC, CD, DC, DD).
+
+    The first move does not matter for long-run payoffs under noise, so only the
+    four replies are kept. Index and iterate like the underlying array.
+    """
+    def __init__(self, probs):
+        self.probs = np.asarray(probs, dtype=float)
+        if self.probs.shape[-1] != 4:
+            raise ValueError(f"Expected (..., 4) reply probabilities, got shape {self.probs.shape}")
+
+    @classmethod
+    def named(cls, *names):
+        """Strategies from core/ipd.py STRATEGIES (first move dropped)."""
+        return cls([STRATEGIES[name][1:] for name in names])
+
+    @classmethod
+    def reactive(cls, after_c, after_d):
+        """
+        Strategies that only look at the opponent's last move (TFT = (1, 0), GTFT = (1, g)).
+        Arrays broadcast, so reactive(1, np.linspace(0, 1, 11)) is a generosity sweep.
+        """
+        after_c, after_d = np.broadcast_arrays(np.asarray(after_c, float), np.asarray(after_d, float))
+        return cls(np.stack([after_c, after_d, after_c, after_d], axis=-1))
+
+    @property
+    def shape(self):
+        return self.probs.shape[:-1]
+
+    def __len__(self):
+        return len(self.probs)
+
+    def __getitem__(self, index):
+        return MemoryOne(self.probs[index])
+
+    def with_noise(self, error, kind="perception"):
+        """
+        The strategy as it effectively plays under noise.
+
+        Args:
+            error: Error probability
+            kind: "perception" (the opponent's move is misread, as in core/noise.py)
+                or "execution" (the intended move comes out wrong)
+        """
+        p = self.probs
+        if kind == "perception":
+            misread = p[..., [1, 0, 3, 2]]      # same own move, opponent's move flipped
+            return MemoryOne((1 - error) * p + error * misread)
+        if kind == "execution":
+            return MemoryOne((1 - error) * p + error * (1 - p))
+        raise ValueError(f"Unknown noise kind: {kind}")
+
+
+def transition_matrices(p, q):
+    """
+    Markov transition matrices between outcomes CC, CD, DC, DD (player p's view).
+
+    Args:
+        p, q: (..., 4) arrays of reply probabilities (broadcast against each other)
+
+    Returns:
+        (..., 4, 4) array; row s is the outcome distribution after outcome s
+    """
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)[..., OPPONENT_VIEW]
+    p, q = np.broadcast_arrays(p, q)
+    return np.stack([p * q, p * (1 - q), (1 - p) * q, (1 - p) * (1 - q)], axis=-1)
+
+
+def stationary(p, q):
+    """
+    Stationary outcome distribution for every pairing, by stacked linear solves.
+
+    Solves v (M - I) = 0 with sum(v) = 1. The chain must have a unique stationary
+    distribution. Execution noise > 0 always guarantees it; perception noise does
+    for strategies that react to the opponent (TFT, GTFT, ...). Noiseless pairings
+    such as TFT vs TFT depend on the opening moves (use ipd.payoff_matrix for those).
+
+    Returns:
+        (..., 4) array of P(CC), P(CD), P(DC), P(DD)
+    """
+    m = transition_matrices(p, q)
+    a = np.swapaxes(m, -1, -2) - np.eye(4)
+    a[..., -1, :] = 1.0                    # replace one balance equation by normalization
+    b = np.zeros(a.shape[:-1])
+    b[..., -1] = 1.0
+    return np.linalg.solve(a, b[..., None])[..., 0]
+
+
+def long_run_payoffs(p, q, error=0.01, kind="perception", payoffs=PD_PAYOFFS):
+    """
+    Exact per-round payoffs of p against q in an infinitely repeated noisy game.
+
+    Args:
+        p, q: MemoryOne (or (..., 4) arrays); shapes broadcast, so p[:, None] against
+            q[None, :] solves a whole grid
+        error: Noise level (see MemoryOne.with_noise); must be > 0 for pure strategies
+        kind: "perception" or "execution"
+        payoffs: (T, R, P, S)
+
+    Returns:
+        (payoff of p, payoff of q, stationary distribution), broadcast shape (...)
+    """
+    p = p if isinstance(p, MemoryOne) else MemoryOne(p)
+    q = q if isinstance(q, MemoryOne) else MemoryOne(q)
+    v = stationary(p.with_noise(error, kind).probs, q.with_noise(error, kind).probs)
+    values = outcome_payoffs(payoffs)
+    return v @ values, v[..., OPPONENT_VIEW] @ values, v
+
+
+def payoff_grid(strategies, error=0.01, kind="perception", payoffs=PD_PAYOFFS):
+    """(n, n) long-run payoff of each strategy (row) against each other (column)."""
+    s = strategies if isinstance(strategies, MemoryOne) else MemoryOne(strategies)
+    row, _, _ = long_run_payoffs(s[:, None], s[None, :], error, kind, payoffs)
+    return row
+
+
+def mean_echo_length(p, q, error=0.01, kind="perception"):
+    """
+    Exact mean length of a stretch without mutual cooperation (a retaliation echo).
+
+    Long-run share of non-CC rounds divided by the rate at which play returns to CC.
+    """
+    p = p if isinstance(p, MemoryOne) else MemoryOne(p)
+    q = q if isinstance(q, MemoryOne) else MemoryOne(q)
+    p, q = p.with_noise(error, kind).probs, q.with_noise(error, kind).probs
+    v = stationary(p, q)
+    back_to_cc = (v[..., 1:] * transition_matrices(p, q)[..., 1:, 0]).sum(axis=-1)
+    return (1 - v[..., 0]) / back_to_cc
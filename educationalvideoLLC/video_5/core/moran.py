@@ -0,0 +1,138 @@
+"""
+Moran process: can a single mutant take over a finite population?
+
+A population of N plays the IPD; each step one individual reproduces (chosen in
+proportion to fitness 1 - w + w * payoff) and its offspring replaces a random
+individual. We estimate the probability that one mutant (e.g. TFT) fixes in a
+resident population (e.g. ALLD), across population sizes N and selection
+strengths w. Runs are batched NumPy arrays spread over a process pool; every
+batch has its own seed, so results do not depend on the number of workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .ipd import PD_PAYOFFS, payoff_matrix, strategy_array
+from .result_cache import cached_arrays, result_key
+
+# Runs per batch (one batch = one task for the pool)
+BATCH = 2_000
+
+
+def pair_payoffs(mutant, resident, rounds=10, payoffs=PD_PAYOFFS):
+    """
+    2x2 per-round payoffs [[mutant vs mutant, mutant vs resident], [resident vs mutant, resident vs resident]].
+
+    Args:
+        mutant, resident: Strategy names from core/ipd.py STRATEGIES
+        rounds: Rounds per game (finite, so TFT loses a little against ALLD)
+    """
+    return payoff_matrix(strategy_array([mutant, resident]), rounds=rounds, payoffs=payoffs)
+
+
+def _fitness(game, n, mutants, w):
+    """Mutant and resident fitness with `mutants` mutants (no self-interaction)."""
+    (a, b), (c, d) = game
+    pi_mutant = (a * (mutants - 1) + b * (n - mutants)) / (n - 1)
+    pi_resident = (c * mutants + d * (n - mutants - 1)) / (n - 1)
+    return 1 - w + w * pi_mutant, 1 - w + w * pi_resident
+
+
+def _up_probability(game, n, w):
+    """P(next change adds a mutant) for every mutant count 0..n (embedded chain)."""
+    mutants = np.arange(n + 1, dtype=float)
+    f_mutant, f_resident = _fitness(game, n, mutants, w)
+    # T+ / T- = f_mutant / f_resident: the common factors i (N - i) / N cancel
+    up = f_mutant / (f_mutant + f_resident)
+    return np.clip(up, 0.0, 1.0)
+
+
+def simulate_fixation(game, n, w, runs, seed):
+    """
+    Number of runs, out of `runs`, in which a single mutant fixes.
+
+    Only steps that change the mutant count are simulated (the embedded chain),
+    which gives the same fixation probability in far fewer steps.
+    """
+    rng = np.random.default_rng(seed)
+    up = _up_probability(np.asarray(game, float), n, w)
+    mutants = np.ones(runs, dtype=np.int64)
+    active = np.arange(runs)
+    while len(active):
+        counts = mutants[active]
+        counts += np.where(rng.random(len(active)) < up[counts], 1, -1)
+        mutants[active] = counts
+        active = active[(counts > 0) & (counts < n)]
+    return int((mutants == n).sum())
+
+
+def exact_fixation(game, n, w):
+    """Fixation probability from the closed form 1 / (1 + sum_k prod_{j<=k} T-(j)/T+(j))."""
+    f_mutant, f_resident = _fitness(np.asarray(game, float), n, np.arange(1, n, dtype=float), w)
+    return 1.0 / (1.0 + np.cumprod(f_resident / f_mutant).sum())
+
+
+def _batch_task(args):
+    game, n, w, runs, seed = args
+    return simulate_fixation(game, n, w, runs, seed)
+
+
+def estimate_fixation(game, sizes, strengths, runs=10_000, seed=0, jobs=None):
+    """
+    Monte Carlo fixation probability of one mutant for every (N, w).
+
+    Args:
+        game: 2x2 payoffs (see pair_payoffs)
+        sizes: Population sizes N
+        strengths: Selection strengths w in [0, 1]
+        runs: Runs per (N, w) cell
+        seed: Base seed; batch seeds are derived from (seed, cell, batch)
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        (probability, standard error), each (len(sizes), len(strengths))
+    """
+    game = np.asarray(game, dtype=float)
+    tasks, owners = [], []
+    for i, n in enumerate(sizes):
+        for j, w in enumerate(strengths):
+            cell = i * len(strengths) + j
+            for b, start in enumerate(range(0, runs, BATCH)):
+                batch_seed = np.random.SeedSequence([seed, cell, b])
+                tasks.append((game, int(n), float(w), min(BATCH, runs - start), batch_seed))
+                owners.append((i, j))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        fixed = [_batch_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            fixed = list(pool.map(_batch_task, tasks, chunksize=max(1, len(tasks) // (4 * jobs))))
+
+    counts = np.zeros((len(sizes), len(strengths)))
+    for (i, j), k in zip(owners, fixed):
+        counts[i, j] += k
+    probability = counts / runs
+    return probability, np.sqrt(probability * (1 - probability) / runs)
+
+
+def cached_fixation(mutant, resident, sizes, strengths, runs=10_000, seed=0, rounds=10, payoffs=PD_PAYOFFS, jobs=None, cache_dir=None):
+    """
+    estimate_fixation() for two named strategies, loaded from disk when already estimated.
+
+    Returns:
+        Dict with "probability", "stderr", "exact" (closed form, same shape) and "neutral" (1 / N)
+    """
+    sizes = np.asarray(sizes, dtype=int)
+    strengths = np.asarray(strengths, dtype=float)
+    game = pair_payoffs(mutant, resident, rounds, payoffs)
+    spec = {"mutant": mutant, "resident": resident, "runs": runs, "seed": seed, "rounds": rounds, "payoffs": [float(v) for v in payoffs]}
+
+    def compute():
+        probability, stderr = estimate_fixation(game, sizes, strengths, runs, seed, jobs)
+        exact = np.array([[exact_fixation(game, n, w) for w in strengths] for n in sizes])
+        return {"sizes": sizes, "strengths": strengths, "probability": probability, "stderr": stderr, "exact": exact, "neutral": 1.0 / sizes}
+
+    return cached_arrays("fixation", result_key(spec, sizes, strengths), compute, cache_dir)
@@ -0,0 +1,132 @@
+"""
+Noisy iterated Prisoner's Dilemma.
+
+Each move is seen by the opponent through a noisy channel: with probability `error`
+a cooperation looks like a defection (and vice versa). Strategies react to what they
+perceived, which is how a single glitch starts a Tit for Tat retaliation echo.
+Thousands of matches run as one seeded NumPy batch.
+"""
+
+import numpy as np
+
+from .ipd import STRATEGIES
+
+
+class NoisyMatches:
+    """
+    Moves of a batch of noisy matches.
+
+    Attributes:
+        intended: (m, rounds, 2) bool, what each player actually played (True = C)
+        perceived: (m, rounds, 2) bool, each player's move as the *opponent* saw it
+    """
+    def __init__(self, intended, perceived):
+        self.intended = intended
+        self.perceived = perceived
+
+    @property
+    def errors(self):
+        """(m, rounds, 2) bool, True where a move was misperceived."""
+        return self.intended != self.perceived
+
+    def cooperation_rate(self):
+        """Fraction of rounds, over all matches, in which both players cooperated."""
+        return float((self.intended[..., 0] & self.intended[..., 1]).mean())
+
+    def echo_lengths(self):
+        """
+        Lengths of every stretch of rounds without mutual cooperation.
+
+        Returns:
+            1-D int array (one entry per stretch, over all matches)
+        """
+        broken = ~(self.intended[..., 0] & self.intended[..., 1])
+        m, rounds = broken.shape
+        # Pad each match with a False so stretches never join across matches
+        padded = np.zeros((m, rounds + 2), dtype=np.int8)
+        padded[:, 1:-1] = broken
+        edges = np.diff(padded.ravel())
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return ends - starts
+
+    def echo_links(self, match, player=0):
+        """
+        Retaliation chains seen from one player's side of one match.
+
+        A link (t, t + 2) means: `player`'s move at t was seen as D, the opponent
+        answered with D at t + 1, which `player` saw and answered with D at t + 2.
+
+        Returns:
+            List of (t, t + 2) round pairs
+        """
+        me, other = player, 1 - player
+        played = self.intended[match]
+        seen = self.perceived[match]
+        linked = (
+            ~seen[:-2, me] & ~played[1:-1, other] & ~seen[1:-1, other] & ~played[2:, me]
+        )
+        return [(int(t), int(t) + 2) for t in np.flatnonzero(linked)]
+
+    def first_echo(self, player=0, window=10, min_links=3):
+        """
+        First match where one glitch by `player` starts a clear echo, for drawing.
+
+        The glitch must be `player`'s first misperceived move, preceded by clean
+        rounds, with at least `min_links` echo links inside `window` rounds.
+
+        Returns:
+            (match, start round of the window), or None if no match qualifies
+        """
+        for match in range(len(self.intended)):
+            glitches = np.flatnonzero(self.errors[match, :, player])
+            if not len(glitches) or glitches[0] == 0 or self.errors[match, :glitches[0]].any():
+                continue
+            start = int(glitches[0]) - 1
+            links = [link for link in self.echo_links(match, player) if link[1] < start + window]
+            if len(links) >= min_links:
+                return match, start
+        return None
+
+
+def _as_strategy(strategy):
+    if isinstance(strategy, str):
+        strategy = STRATEGIES[strategy]
+    return np.asarray(strategy, dtype=float)
+
+
+def noisy_matches(a, b, matches=1000, rounds=50, error=0.05, seed=0):
+    """
+    Play `matches` noisy games of strategy `a` against `b` in one batch.
+
+    Args:
+        a, b: Strategy names from core/ipd.py STRATEGIES, or memory-one tuples
+            (first move, P(C | CC), P(C | CD), P(C | DC), P(C | DD)), applied to
+            (own move, perceived opponent move)
+        matches: Number of independent matches
+        rounds: Rounds per match
+        error: Probability that a move is misperceived by the opponent
+        seed: Same seed, same matches (and same frames)
+
+    Returns:
+        NoisyMatches
+    """
+    rng = np.random.default_rng(seed)
+    strategies = np.stack([_as_strategy(a), _as_strategy(b)])   # (2, 5)
+    first, reply = strategies[:, 0], strategies[:, 1:]
+
+    intended = np.empty((matches, rounds, 2), dtype=bool)
+    perceived = np.empty((matches, rounds, 2), dtype=bool)
+    for r in range(rounds):
+        if r == 0:
+            p = np.broadcast_to(first, (matches, 2))
+        else:
+            own = intended[:, r - 1]
+            seen = perceived[:, r - 1, ::-1]                       # opponent's move as I saw it
+            outcome = 2 * (~own) + (~seen)                         # CC=0, CD=1, DC=2, DD=3
+            p = reply[np.arange(2), outcome]
+        move = rng.random((matches, 2)) < p
+        flip = rng.random((matches, 2)) < error
+        intended[:, r] = move
+        perceived[:, r] = move ^ flip
+    return NoisyMatches(intended, perceived)
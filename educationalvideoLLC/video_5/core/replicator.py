@@ -0,0 +1,85 @@
+"""
+Replicator dynamics for strategy ecologies.
+Population shares evolve by relative fitness under a payoff matrix (see core/ipd.py),
+either generation by generation or as an ODE with a fixed RK4 step.
+"""
+
+import numpy as np
+
+
+def _normalize(shares):
+    shares = np.asarray(shares, dtype=float)
+    return shares / shares.sum(axis=-1, keepdims=True)
+
+
+def replicator_trajectory(payoffs, initial, generations):
+    """
+    Discrete replicator dynamics: x_i' = x_i * f_i / mean fitness.
+
+    Args:
+        payoffs: (n, n) payoff matrix, all entries positive
+        initial: (..., n) starting populations (any scale; normalized to shares)
+        generations: Number of generations to run
+
+    Returns:
+        (generations + 1, ..., n) array of shares, starting with the initial one
+    """
+    a = np.asarray(payoffs, dtype=float)
+    x = _normalize(initial)
+    out = np.empty((generations + 1,) + x.shape)
+    out[0] = x
+    for g in range(1, generations + 1):
+        fitness = x @ a.T
+        x = x * fitness / (x * fitness).sum(axis=-1, keepdims=True)
+        out[g] = x
+    return out
+
+
+def _replicator_rate(a, x):
+    fitness = x @ a.T
+    mean = (x * fitness).sum(axis=-1, keepdims=True)
+    return x * (fitness - mean)
+
+
+def replicator_ode(payoffs, initial, t_end, dt=0.05):
+    """
+    Continuous replicator dynamics dx_i/dt = x_i (f_i - mean fitness), fixed-step RK4.
+
+    Args:
+        payoffs: (n, n) payoff matrix
+        initial: (..., n) starting populations (normalized to shares)
+        t_end: Time to integrate to
+        dt: Step size
+
+    Returns:
+        (times, shares): times of shape (steps + 1,), shares of shape (steps + 1, ..., n)
+    """
+    a = np.asarray(payoffs, dtype=float)
+    steps = int(round(t_end / dt))
+    x = _normalize(initial)
+    out = np.empty((steps + 1,) + x.shape)
+    out[0] = x
+    for k in range(1, steps + 1):
+        k1 = _replicator_rate(a, x)
+        k2 = _replicator_rate(a, x + dt / 2 * k1)
+        k3 = _replicator_rate(a, x + dt / 2 * k2)
+        k4 = _replicator_rate(a, x + dt * k3)
+        x = np.clip(x + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4), 0, None)
+        x = _normalize(x)
+        out[k] = x
+    return np.arange(steps + 1) * dt, out
+
+
+def shares_at(trajectory, t):
+    """
+    Shares at fractional generation `t`, linearly interpolated (for smooth animation).
+
+    Args:
+        trajectory: (steps + 1, ..., n) array from replicator_trajectory
+        t: Position along the first axis, clamped to the trajectory
+    """
+    t = min(max(t, 0.0), len(trajectory) - 1)
+    lo = int(np.floor(t))
+    hi = min(lo + 1, len(trajectory) - 1)
+    frac = t - lo
+    return (1 - frac) * trajectory[lo] + frac * trajectory[hi]
@@ -0,0 +1,64 @@
+"""
+On-disk cache for simulation results (NumPy arrays).
+
+Expensive sweeps are solved once and stored as .npz files next to the render
+cache, keyed by a hash of everything that determines them.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Bump when a cached computation changes so old results are ignored
+RESULT_FORMAT = 1
+
+# Next to the render cache, so one VISUALTHEOREM_CACHE setting moves both
+SERIES_ROOT = Path(__file__).resolve().parents[2]
+
+
+def result_cache_root():
+    """$VISUALTHEOREM_CACHE/sweeps, or .render_cache/sweeps in the series root."""
+    return Path(os.environ.get("VISUALTHEOREM_CACHE", SERIES_ROOT / ".render_cache")) / "sweeps"
+
+
+def result_key(spec, *arrays):
+    """
+    Hash of a JSON-able spec (payoffs, parameters...) and any number of arrays (grids).
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"format": RESULT_FORMAT, **spec}, sort_keys=True).encode())
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+def cached_arrays(name, key, compute, cache_dir=None):
+    """
+    Load `<name>-<key>.npz`, or call `compute()` and store what it returns.
+
+    Args:
+        name: File prefix, e.g. "generosity"
+        key: result_key(...) of the computation
+        compute: Zero-argument function returning a dict of arrays
+        cache_dir: Where results live (default: result_cache_root())
+
+    Returns:
+        Dict of arrays
+    """
+    root = Path(cache_dir) if cache_dir is not None else result_cache_root()
+    path = root / f"{name}-{key}.npz"
+    if path.exists():
+        with np.load(path) as data:
+            return {k: data[k] for k in data.files}
+
+    arrays = compute()
+    root.mkdir(parents=True, exist_ok=True)
+    # Write under a temporary name so a parallel render never reads half a file
+    partial = path.with_name(f"{path.stem}.{os.getpid()}.partial.npz")
+    np.savez(partial, **arrays)
+    os.replace(partial, path)
+    return arrays
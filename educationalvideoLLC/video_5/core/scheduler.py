@@ -0,0 +1,131 @@
+"""
+Non-blocking overlay scheduler for VisualTheorem videos.
+Queues subtitles and side notes on a timeline so they fade in, hold and fade out
+while the scene keeps playing its own animations, instead of blocking with waits.
+"""
+
+from manim import *
+
+
+class _Cue:
+    def __init__(self, mobject, start, duration, fade, shift, exit_shift):
+        self.mobject = mobject
+        self.start = start
+        self.end = start + duration + 2 * fade
+        self.fade = fade
+        self.shift = shift
+        self.exit_shift = exit_shift
+        self.home = mobject.get_center().copy()
+        # Remember each part's opacity so fades scale it instead of overwriting it
+        self.fills = [m.get_fill_opacity() for m in mobject.get_family()]
+        self.strokes = [m.get_stroke_opacity() for m in mobject.get_family()]
+
+    def alpha(self, t):
+        """Visibility at scene time t (0 hidden, 1 fully shown)."""
+        if t <= self.start or t >= self.end:
+            return 0.0
+        if t < self.start + self.fade:
+            return smooth((t - self.start) / self.fade)
+        if t > self.end - self.fade:
+            return smooth((self.end - t) / self.fade)
+        return 1.0
+
+    def apply(self, t):
+        a = self.alpha(t)
+        if t < self.start + self.fade:
+            self.mobject.move_to(self.home - (1 - a) * self.shift)
+        else:
+            self.mobject.move_to(self.home + (1 - a) * self.exit_shift)
+        for m, fill, stroke in zip(self.mobject.get_family(), self.fills, self.strokes):
+            m.set_fill(opacity=fill * a, family=False)
+            m.set_stroke(opacity=stroke * a, family=False)
+
+
+class OverlayScheduler:
+    """
+    Timeline of overlay cues driven by one updater.
+
+    Cues in the same lane (e.g. "top" subtitles, "side" citations) play one after
+    another; different lanes overlap freely. While any cue is pending, the scene's
+    own play() calls animate the overlays too. Call flush() before the scene ends
+    (or before a hard cut) to wait out whatever is still on screen.
+    """
+    def __init__(self, scene):
+        self.scene = scene
+        self.container = VGroup()
+        self.cues = []
+        self.lanes = {}
+        self.clock = 0.0
+        self.active = False
+
+    def _now(self):
+        return self.clock if self.active else self.scene.renderer.time
+
+    def _activate(self):
+        if self.active:
+            return
+        self.clock = self.scene.renderer.time
+        self.container.add_updater(self._tick)
+        self.scene.add(self.container)
+        self.active = True
+
+    def _deactivate(self):
+        self.container.remove_updater(self._tick)
+        self.scene.remove(self.container)
+        self.active = False
+
+    def _tick(self, mobject, dt):
+        self.clock += dt
+        for cue in list(self.cues):
+            if self.clock >= cue.end - 1e-6:
+                self.container.remove(cue.mobject)
+                self.cues.remove(cue)
+            elif self.clock > cue.start:
+                if cue.mobject not in self.container.submobjects:
+                    self.container.add(cue.mobject)
+                cue.apply(self.clock)
+        if not self.cues:
+            self._deactivate()
+
+    def digest_state(self):
+        """Pending cue timings, so render caches can tell schedules apart."""
+        return [(round(c.start - self.clock, 3), round(c.end - self.clock, 3)) for c in self.cues]
+
+    def queue(self, mobject, duration, lane="top", fade=0.5, shift=UP * 0.1, exit_shift=None):
+        """
+        Schedule an overlay without blocking.
+
+        Args:
+            mobject: Positioned overlay (e.g. subtitle group or citation text)
+            duration: Hold time at full opacity (fade time is added on both sides)
+            lane: Cues in the same lane never overlap
+            fade: Fade in/out time in seconds
+            shift: Drift while fading in (like FadeIn(shift=...))
+            exit_shift: Drift while fading out (defaults to continuing along `shift`)
+
+        Returns:
+            Scene time at which the cue will finish
+        """
+        now = self._now()
+        start = max(now, self.lanes.get(lane, now))
+        cue = _Cue(mobject, start, duration, fade, shift, shift if exit_shift is None else exit_shift)
+        cue.apply(start)
+        self.lanes[lane] = cue.end
+        self.cues.append(cue)
+        self._activate()
+        return cue.end
+
+    def remaining(self):
+        """Seconds until every queued cue has finished."""
+        if not self.cues:
+            return 0.0
+        return max(c.end for c in self.cues) - self._now()
+
+    def flush(self):
+        """Block until all queued overlays are gone (keeps reading time intact)."""
+        remaining = self.remaining()
+        if remaining > 0:
+            self.scene.wait(remaining)
+        if self.active:
+            # Drop cues that ended on the last frame so later waits are static again
+            self._tick(self.container, 0)
@@ -0,0 +1,102 @@
+"""
+Spatial Prisoner's Dilemma (Nowak & May 1992) on a periodic lattice.
+
+Each cell is a cooperator or a defector and plays its 8 neighbours and itself.
+Payoffs: R = 1 for C meeting C, T = b for D meeting C, 0 otherwise. Then every
+cell copies the strategy of the best scorer in its neighbourhood. Neighbour sums
+are array rolls, so a 200x200 generation is a handful of NumPy operations, and
+each generation becomes one RGBA image for an ImageMobject.
+"""
+
+import numpy as np
+
+# Moore neighbourhood including the cell itself
+OFFSETS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+# Nowak & May's colours: blue C stays C, red D stays D, green D -> C, yellow C -> D
+PALETTE = {
+    "cooperator": (74, 158, 255),
+    "defector": (248, 113, 113),
+    "new_cooperator": (74, 222, 128),
+    "new_defector": (255, 215, 0),
+}
+
+
+def neighbourhood_sum(values):
+    """Sum of each cell and its 8 neighbours (periodic boundary)."""
+    total = np.zeros_like(values)
+    for dy, dx in OFFSETS:
+        total += np.roll(values, (dy, dx), axis=(0, 1))
+    return total
+
+
+def step(cooperators, b):
+    """
+    One generation: play the neighbourhood, then imitate the best neighbour.
+
+    Args:
+        cooperators: (n, n) bool lattice, True = cooperator
+        b: Temptation to defect (1 < b < 2 for the interesting regime)
+
+    Returns:
+        (n, n) bool lattice of the next generation
+    """
+    c = cooperators.astype(float)
+    cooperating_neighbours = neighbourhood_sum(c)
+    score = np.where(cooperators, cooperating_neighbours, b * cooperating_neighbours)
+
+    # Ties go to the first offset scanned, with the cell itself checked first
+    best_score = score.copy()
+    best = cooperators.copy()
+    for dy, dx in OFFSETS:
+        if (dy, dx) == (0, 0):
+            continue
+        shifted = np.roll(score, (dy, dx), axis=(0, 1))
+        better = shifted > best_score
+        best_score = np.where(better, shifted, best_score)
+        best = np.where(better, np.roll(cooperators, (dy, dx), axis=(0, 1)), best)
+    return best
+
+
+def simulate(size=200, generations=60, b=1.85, cooperator_share=0.9, seed=0, initial=None):
+    """
+    Run the spatial game from a random (seeded) or given lattice.
+
+    Args:
+        size: Lattice side length
+        generations: Generations after the initial state
+        b: Temptation to defect
+        cooperator_share: Initial fraction of cooperators (random start only)
+        seed: Same seed, same lattice
+        initial: Optional (size, size) bool starting lattice
+
+    Returns:
+        (generations + 1, size, size) bool history, True = cooperator
+    """
+    if initial is None:
+        rng = np.random.default_rng(seed)
+        initial = rng.random((size, size)) < cooperator_share
+    history = np.empty((generations + 1,) + initial.shape, dtype=bool)
+    history[0] = initial
+    for g in range(generations):
+        history[g + 1] = step(history[g], b)
+    return history
+
+
+def to_rgba(history, palette=PALETTE):
+    """
+    Colour every generation, marking cells that just switched strategy.
+
+    Returns:
+        (generations + 1, n, n, 4) uint8 frames, ready for ImageMobject pixel arrays
+    """
+    previous = np.concatenate([history[:1], history[:-1]])
+    colours = np.array([
+        palette["defector"], palette["new_cooperator"],
+        palette["new_defector"], palette["cooperator"],
+    ], dtype=np.uint8)
+    # index = 2 * was cooperator + is cooperator: D->D, D->C, C->D, C->C
+    index = 2 * previous.astype(np.intp) + history.astype(np.intp)
+    frames = np.full(history.shape + (4,), 255, dtype=np.uint8)
+    frames[..., :3] = colours[index]
+    return frames
@@ -0,0 +1,216 @@
+"""
+Round-robin IPD tournaments in the style of Axelrod (1980).
+
+Strategies are rows of parameter arrays (memory-one replies plus a few classic rules),
+so every match of a tournament, over every repetition, advances in one NumPy step
+per round. Scores and full move histories come back as arrays for the scenes to read.
+"""
+
+import numpy as np
+
+from .ipd import PD_PAYOFFS, STRATEGIES
+
+# Classic entries as (first move, memory-one replies, rule overrides). Replies are
+# P(C | CC, CD, DC, DD) from the player's own point of view, as in core/ipd.py.
+#   grim: defect forever once the opponent has defected
+#   tf2t: defect only after two opponent defections in a row
+#   defect_round: always defect in this round (0-based), e.g. a probe
+CLASSICS = {
+    **{name: {"first": s[0], "reply": s[1:]} for name, s in STRATEGIES.items()},
+    "Friedman": {"first": 1, "reply": (1, 0, 1, 0), "grim": True},
+    "Joss": {"first": 1, "reply": (0.9, 0, 0.9, 0)},
+    # TFT that probes with a defection on move 50 (simplified: no randomness test)
+    "Graaskamp": {"first": 1, "reply": (1, 0, 1, 0), "defect_round": 49},
+    # Rules never published; modelled as an erratic reciprocator
+    "Name Withheld": {"first": 1, "reply": (0.7, 0.2, 0.7, 0.2)},
+    "Tit for Two Tats": {"first": 1, "reply": (1, 1, 1, 1), "tf2t": True},
+    "Win-Stay Lose-Shift": {"first": 1, "reply": (1, 0, 0, 1)},
+    "Suspicious TFT": {"first": 0, "reply": (1, 0, 1, 0)},
+}
+
+
+class StrategyTable:
+    """
+    A set of strategies stored column-wise, ready for batched play.
+
+    Args:
+        names: Strategy names (one per row)
+        first: (n,) probability of cooperating in round 0
+        reply: (n, 4) memory-one cooperation probabilities after CC, CD, DC, DD
+        grim, tf2t: (n,) rule flags (see CLASSICS)
+        defect_round: (n,) round forced to D, or -1
+    """
+    def __init__(self, names, first, reply, grim=None, tf2t=None, defect_round=None):
+        n = len(names)
+        self.names = list(names)
+        self.first = np.asarray(first, dtype=float).reshape(n)
+        self.reply = np.asarray(reply, dtype=float).reshape(n, 4)
+        self.grim = np.zeros(n, bool) if grim is None else np.asarray(grim, bool)
+        self.tf2t = np.zeros(n, bool) if tf2t is None else np.asarray(tf2t, bool)
+        self.defect_round = np.full(n, -1) if defect_round is None else np.asarray(defect_round, int)
+
+    @classmethod
+    def from_names(cls, names):
+        """Table of named CLASSICS entries."""
+        specs = [CLASSICS[name] for name in names]
+        return cls(
+            names,
+            [s["first"] for s in specs],
+            [s["reply"] for s in specs],
+            grim=[s.get("grim", False) for s in specs],
+            tf2t=[s.get("tf2t", False) for s in specs],
+            defect_round=[s.get("defect_round", -1) for s in specs],
+        )
+
+    @classmethod
+    def memory_one_grid(cls, levels=(0.0, 0.5, 1.0), first=1.0):
+        """Every memory-one strategy whose four replies take values from `levels`."""
+        grid = np.array(np.meshgrid(*[levels] * 4, indexing="ij")).reshape(4, -1).T
+        names = ["M1(" + ",".join(f"{v:g}" for v in row) + ")" for row in grid]
+        return cls(names, np.full(len(grid), first), grid)
+
+    def __add__(self, other):
+        return StrategyTable(
+            self.names + other.names,
+            np.concatenate([self.first, other.first]),
+            np.concatenate([self.reply, other.reply]),
+            grim=np.concatenate([self.grim, other.grim]),
+            tf2t=np.concatenate([self.tf2t, other.tf2t]),
+            defect_round=np.concatenate([self.defect_round, other.defect_round]),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, name):
+        return self.names.index(name)
+
+
+def play_matches(table, players, rounds, rng):
+    """
+    Play many matches at once.
+
+    Args:
+        table: StrategyTable
+        players: (m, 2) strategy indices of the two sides of each match
+        rounds: Rounds per match
+        rng: numpy Generator (only used by mixed strategies)
+
+    Returns:
+        (m, rounds, 2) bool array of moves, True = cooperate
+    """
+    players = np.asarray(players)
+    m = len(players)
+    first = table.first[players]
+    reply = table.reply[players]                    # (m, 2, 4)
+    grim = table.grim[players]
+    tf2t = table.tf2t[players]
+    defect_round = table.defect_round[players]
+
+    moves = np.empty((m, rounds, 2), dtype=bool)
+    opponent_defected = np.zeros((m, 2), dtype=bool)
+    opponent_streak = np.zeros((m, 2), dtype=int)   # consecutive opponent defections
+    for r in range(rounds):
+        if r == 0:
+            p = first
+        else:
+            own = moves[:, r - 1]
+            opp = own[:, ::-1]
+            outcome = 2 * (~own) + (~opp)           # CC=0, CD=1, DC=2, DD=3
+            p = np.take_along_axis(reply, outcome[..., None], axis=-1)[..., 0]
+            p = np.where(tf2t, (opponent_streak < 2).astype(float), p)
+        p = np.where(grim & opponent_defected, 0.0, p)
+        p = np.where(defect_round == r, 0.0, p)
+        move = rng.random((m, 2)) < p
+        moves[:, r] = move
+        opp_move = move[:, ::-1]
+        opponent_defected |= ~opp_move
+        opponent_streak = np.where(opp_move, 0, opponent_streak + 1)
+    return moves
+
+
+class TournamentResult:
+    """
+    Outcome of a round-robin tournament.
+
+    Attributes:
+        names: Strategy names
+        pairs: (p, 2) strategy indices of each pairing (self-play included)
+        moves: (repetitions, p, rounds, 2) bool move histories, or None if not kept
+        scores: (repetitions, n, n) mean per-round payoff of row strategy against column
+    """
+    def __init__(self, names, pairs, moves, scores):
+        self.names = names
+        self.pairs = pairs
+        self.moves = moves
+        self.scores = scores
+
+    @property
+    def mean_scores(self):
+        """(n, n) per-round payoffs averaged over repetitions."""
+        return self.scores.mean(axis=0)
+
+    @property
+    def totals(self):
+        """(n,) average per-round payoff against the whole field, as Axelrod ranked them."""
+        return self.mean_scores.mean(axis=1)
+
+    def ranking(self):
+        """(name, score) from best to worst."""
+        order = np.argsort(-self.totals, kind="stable")
+        return [(self.names[i], float(self.totals[i])) for i in order]
+
+    def history(self, a, b, repetition=0):
+        """
+        Moves of strategy `a` and `b` (names) in their match.
+
+        Returns:
+            (moves_a, moves_b) bool arrays of length `rounds`, True = cooperate
+        """
+        if self.moves is None:
+            raise ValueError("Tournament was run with keep_moves=False")
+        i, j = self.names.index(a), self.names.index(b)
+        lookup = {(int(x), int(y)): k for k, (x, y) in enumerate(self.pairs)}
+        if (i, j) in lookup:
+            match = self.moves[repetition, lookup[(i, j)]]
+            return match[:, 0], match[:, 1]
+        match = self.moves[repetition, lookup[(j, i)]]
+        return match[:, 1], match[:, 0]
+
+
+def round_robin(table, rounds=200, repetitions=1, seed=0, payoffs=PD_PAYOFFS, keep_moves=True):
+    """
+    Every strategy plays every other (and a copy of itself) for `rounds` rounds.
+
+    Args:
+        table: StrategyTable
+        rounds: Rounds per match (Axelrod used 200)
+        repetitions: Independent replicas of the whole tournament
+        seed: Seed for mixed strategies; same seed, same tournament
+        payoffs: (T, R, P, S)
+        keep_moves: Keep full move histories (repetitions x pairs x rounds x 2 bools)
+
+    Returns:
+        TournamentResult
+    """
+    n = len(table)
+    rows, cols = np.triu_indices(n)
+    pairs = np.stack([rows, cols], axis=1)
+    players = np.tile(pairs, (repetitions, 1))
+    rng = np.random.default_rng(seed)
+    moves = play_matches(table, players, rounds, rng)
+
+    t, r, p, s = payoffs
+    payoff = np.array([[p, t], [s, r]])               # payoff[own C?, opponent C?]
+    own = moves.astype(int)
+    per_match = payoff[own, own[..., ::-1]].mean(axis=1)   # (m, 2)
+    per_match = per_match.reshape(repetitions, len(pairs), 2)
+
+    scores = np.zeros((repetitions, n, n))
+    scores[:, rows, cols] = per_match[..., 0]
+    scores[:, cols, rows] = per_match[..., 1]
+    diagonal = rows == cols
+    scores[:, rows[diagonal], cols[diagonal]] = per_match[:, diagonal].mean(axis=-1)
+
+    moves = moves.reshape(repetitions, len(pairs), rounds, 2) if keep_moves else None
+    return TournamentResult(table.names, pairs, moves, scores)